@@ -67,6 +67,9 @@ class AgentFactory(Protocol):
 class DefaultAgentFactory:
     """Default implementation of agent factory."""
 
+    # Agent class instantiated by create_agent
+    agent_class: type[OrchestratorAgent] = OrchestratorAgent
+
     def __init__(
         self,
         database_manager: DatabaseManager,
@@ -160,7 +163,7 @@ class DefaultAgentFactory:
             prompt = agent_prompt_result.prompt
 
             # Create the orchestrator agent
-            agent = OrchestratorAgent(
+            agent = self.agent_class(
                 database_manager=self.database_manager,
                 available_llm_providers=self.available_llm_providers,
                 message_broker=self.message_broker,
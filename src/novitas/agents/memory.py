@@ -9,6 +9,9 @@ from typing import Any
 from uuid import UUID
 
 from langchain.memory import ConversationBufferMemory
+from langchain_core.messages import AIMessage
+from langchain_core.messages import BaseMessage
+from langchain_core.messages import HumanMessage
 
 from ..config.logging import get_logger
 from ..core.exceptions import AgentError
@@ -742,6 +745,65 @@ class LangChainMemoryManager:
 
         return memory_item.id
 
+    async def add_memories(
+        self, agent_id: UUID, memory_items: list[MemoryItem]
+    ) -> list[UUID]:
+        """Add several memory items for an agent at once.
+
+        Conversation items are written to LangChain memory in a single
+        ``add_messages`` call instead of one ``save_context`` per item.
+
+        Args:
+            agent_id: ID of the agent
+            memory_items: Memory items to add
+
+        Returns:
+            Memory item IDs, in the order given
+
+        Raises:
+            AgentError: If agent is not registered
+        """
+        if agent_id not in self._agents:
+            raise AgentError(f"Agent {agent_id} is not registered")
+
+        # Add to cache
+        self._memory_cache[agent_id].extend(memory_items)
+
+        # Add conversations to LangChain memory in one batch
+        messages: list[BaseMessage] = []
+        for memory_item in memory_items:
+            if memory_item.memory_type != MemoryType.CONVERSATION:
+                continue
+            pair = self._conversation_pair(memory_item.content)
+            if pair:
+                messages.append(HumanMessage(content=pair[0]))
+                messages.append(AIMessage(content=pair[1]))
+        if messages:
+            self._langchain_memories[agent_id].chat_memory.add_messages(messages)
+
+        # Notify handlers; most agents register none, so skip the item loop
+        handlers = self._memory_handlers[agent_id]
+        if handlers:
+            for memory_item in memory_items:
+                for handler in handlers:
+                    try:
+                        handler(memory_item)
+                    except Exception as e:
+                        self.logger.error(
+                            "Memory handler failed",
+                            agent_id=agent_id,
+                            memory_id=memory_item.id,
+                            error=str(e),
+                        )
+
+        self.logger.info(
+            "Memories added to LangChain manager",
+            agent_id=agent_id,
+            count=len(memory_items),
+        )
+
+        return [memory_item.id for memory_item in memory_items]
+
     async def get_memory(
         self,
         agent_id: UUID,
@@ -1010,19 +1072,29 @@ class LangChainMemoryManager:
         if memory_item.memory_type != MemoryType.CONVERSATION:
             return
 
-        content = memory_item.content
-        langchain_memory = self._langchain_memories[agent_id]
+        pair = self._conversation_pair(memory_item.content)
+        if pair:
+            self._langchain_memories[agent_id].save_context(
+                {"input": pair[0]}, {"output": pair[1]}
+            )
+
+    @staticmethod
+    def _conversation_pair(content: dict[str, Any]) -> tuple[str, str] | None:
+        """Extract the input/output pair from conversation memory content.
 
+        Args:
+            content: Memory content
+
+        Returns:
+            Input and output text, or None if the content has neither format
+        """
         # Try to extract input/output from content
         if "input" in content and "output" in content:
-            langchain_memory.save_context(
-                {"input": content["input"]}, {"output": content["output"]}
-            )
-        elif "message" in content:
+            return content["input"], content["output"]
+        if "message" in content:
             # Single message format
-            langchain_memory.save_context(
-                {"input": content["message"]}, {"output": "Message received"}
-            )
+            return content["message"], "Message received"
+        return None
 
     async def _load_agent_memory(self, agent_id: UUID) -> None:
         """Load memory for an agent from the database.
@@ -463,7 +463,6 @@ class OrchestratorAgent(BaseAgent):
             List of proposals from all agents
         """
         self.logger.info("WORKFLOW STEP 1: Starting agent workflow execution")
-        all_proposals = []
 
         # Generate improvement proposals for the actual files being analyzed
         files_to_analyze = context.get("files_to_analyze", [])
@@ -484,76 +483,93 @@ class OrchestratorAgent(BaseAgent):
 
                 self.logger.info("WORKFLOW STEP 3: About to generate real AI proposals")
 
-        # Generate real AI proposals for each file
-        for file_path in files_to_analyze:
-            if file_path in file_contents:
-                self.logger.info(
-                    f"WORKFLOW STEP 3.{len(all_proposals) + 1}: Analyzing {file_path}"
+        # Analyze files concurrently: the cycle waits for the slowest LLM call
+        # rather than the sum of all of them. Results keep the input file order.
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(
+                    self._analyze_file(step, file_path, file_contents[file_path])
                 )
-
-                try:
-                    # Create analysis prompt for this file
-                    analysis_prompt = f"""
-                    Analyze this code file and suggest 1-2 specific improvements:
-
-                    File: {file_path}
-                    Content:
-                    ```python
-                    {file_contents[file_path][:4000]}
-                    ```
-
-                    Focus on practical, actionable improvements that would make the code better.
-                    Provide specific diffs showing the exact code changes needed.
-                    """
-
-                    # Get structured AI analysis
-                    self.logger.info(
-                        f"WORKFLOW STEP 3.{len(all_proposals) + 1}.1: Calling LLM for {file_path}"
-                    )
-                    analysis_result = await asyncio.wait_for(
-                        generate_structured_response(
-                            self.llm_provider,
-                            analysis_prompt,
-                            ImprovementAnalysis,
-                            max_tokens=1000,
-                        ),
-                        timeout=30.0,
-                    )
-                    self.logger.info(
-                        f"WORKFLOW STEP 3.{len(all_proposals) + 1}.2: Got structured response for {file_path}"
-                    )
-
-                    # Convert structured response to ChangeProposal objects
-                    for proposal_data in analysis_result.proposals:
-                        proposal = ChangeProposal(
-                            agent_id=self.id,
-                            improvement_type=ImprovementType(
-                                proposal_data.improvement_type
-                            ),
-                            file_path=file_path,
-                            description=proposal_data.title,
-                            reasoning=proposal_data.reasoning,
-                            proposed_changes={"diff": proposal_data.diff},
-                            confidence_score=proposal_data.confidence_score,
-                        )
-                        all_proposals.append(proposal)
-                        self.logger.info(
-                            f"WORKFLOW STEP 3.{len(all_proposals)}: Added structured proposal for {file_path}"
-                        )
-
-                except TimeoutError:
-                    self.logger.warning(f"LLM analysis timed out for {file_path}")
-                    continue
-
-                except Exception as e:
-                    self.logger.error(f"Error analyzing {file_path}: {e}")
-                    continue
+                for step, file_path in enumerate(files_to_analyze, 1)
+                if file_path in file_contents
+            ]
+        all_proposals = [proposal for task in tasks for proposal in task.result()]
 
         self.logger.info(
             f"WORKFLOW STEP 4 COMPLETE: Returning {len(all_proposals)} proposals"
         )
         return all_proposals
 
+    async def _analyze_file(
+        self, step: int, file_path: str, content: str
+    ) -> list[ChangeProposal]:
+        """Ask the LLM for improvement proposals for a single file.
+
+        Args:
+            step: Position of the file in the workflow, used in log messages
+            file_path: Path of the file being analyzed
+            content: Contents of the file
+
+        Returns:
+            Proposals for the file; empty if the analysis failed or timed out
+        """
+        self.logger.info(f"WORKFLOW STEP 3.{step}: Analyzing {file_path}")
+        proposals = []
+
+        try:
+            # Create analysis prompt for this file
+            analysis_prompt = f"""
+            Analyze this code file and suggest 1-2 specific improvements:
+
+            File: {file_path}
+            Content:
+            ```python
+            {content[:4000]}
+            ```
+
+            Focus on practical, actionable improvements that would make the code better.
+            Provide specific diffs showing the exact code changes needed.
+            """
+
+            # Get structured AI analysis
+            self.logger.info(f"WORKFLOW STEP 3.{step}.1: Calling LLM for {file_path}")
+            analysis_result = await asyncio.wait_for(
+                generate_structured_response(
+                    self.llm_provider,
+                    analysis_prompt,
+                    ImprovementAnalysis,
+                    max_tokens=1000,
+                ),
+                timeout=30.0,
+            )
+            self.logger.info(
+                f"WORKFLOW STEP 3.{step}.2: Got structured response for {file_path}"
+            )
+
+            # Convert structured response to ChangeProposal objects
+            for proposal_data in analysis_result.proposals:
+                proposal = ChangeProposal(
+                    agent_id=self.id,
+                    improvement_type=ImprovementType(proposal_data.improvement_type),
+                    file_path=file_path,
+                    description=proposal_data.title,
+                    reasoning=proposal_data.reasoning,
+                    proposed_changes={"diff": proposal_data.diff},
+                    confidence_score=proposal_data.confidence_score,
+                )
+                proposals.append(proposal)
+                self.logger.info(
+                    f"WORKFLOW STEP 3.{step}: Added structured proposal for {file_path}"
+                )
+
+        except TimeoutError:
+            self.logger.warning(f"LLM analysis timed out for {file_path}")
+
+        except Exception as e:
+            self.logger.error(f"Error analyzing {file_path}: {e}")
+
+        return proposals
+
     async def _evaluate_proposals(
         self, proposals: list[ChangeProposal]
     ) -> list[ChangeProposal]:
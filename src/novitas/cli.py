@@ -14,6 +14,7 @@ from .config.logging import get_logger
 from .config.settings import settings
 from .database.connection import get_database_manager
 from .main import run_improvement_cycle
+from .messaging import close_message_brokers
 
 # Initialize CLI app
 app = typer.Typer(
@@ -94,10 +95,17 @@ def _run_improvement_cycle(
             if dry_run:
                 settings.dry_run = dry_run
 
+            async def _async_improve():
+                try:
+                    await run_improvement_cycle(
+                        daily=daily, force=force, dry_run=dry_run
+                    )
+                finally:
+                    # Close the brokers the cycle shared on this event loop
+                    await close_message_brokers()
+
             # Run the async function
-            asyncio.run(
-                run_improvement_cycle(daily=daily, force=force, dry_run=dry_run)
-            )
+            asyncio.run(_async_improve())
 
             progress.update(task, description="Improvement cycle completed!")
 
@@ -295,7 +303,7 @@ def _run_db_command(
 
             if status:
                 await db_manager.connect()
-                status_info = await db_manager.get_status()
+                status_info = db_manager.status
                 console.print(
                     f"[bold green]✓[/bold green] Database connection: {status_info}"
                 )
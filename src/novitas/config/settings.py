@@ -65,6 +65,30 @@ class Settings(BaseSettings):
         alias="DATABASE_PASSWORD",
     )
 
+    database_auto_create: bool | None = Field(
+        default=None,
+        description="Create missing tables on connect (defaults to on outside staging/production)",
+        alias="DATABASE_AUTO_CREATE",
+    )
+    database_pool_size: int = Field(
+        default=10,
+        gt=0,
+        description="Connections kept open (and pre-opened on connect) by the pool",
+        alias="DATABASE_POOL_SIZE",
+    )
+    database_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="TTL for cached read results (0 disables the cache)",
+        alias="DATABASE_CACHE_TTL_SECONDS",
+    )
+    database_cache_max_entries: int = Field(
+        default=1024,
+        gt=0,
+        description="Cached read results kept before the least recently used is evicted",
+        alias="DATABASE_CACHE_MAX_ENTRIES",
+    )
+
     # Redis configuration (12-factor: Backing services)
     redis_url: str = Field(
         default="redis://localhost:6379/0",
@@ -141,6 +165,11 @@ class Settings(BaseSettings):
         description="Run in dry-run mode (no actual changes)",
         alias="NOVITAS_DRY_RUN",
     )
+    demo_trace: bool = Field(
+        default=False,
+        description="Print step-by-step demo trace lines to stdout",
+        alias="DEMO_TRACE",
+    )
 
     @property
     def resolved_database_url(self) -> str:
@@ -163,6 +192,19 @@ class Settings(BaseSettings):
             # Use PostgreSQL for staging and production (robust, scalable)
             return f"postgresql+asyncpg://{self.database_user}:{self.database_password}@{self.database_host}:{self.database_port}/{self.database_name}"
 
+    @property
+    def resolved_database_auto_create(self) -> bool:
+        """
+        Whether connect() should create missing tables.
+
+        Development and testing bootstrap their SQLite schema on connect;
+        staging and production manage the schema strictly through Alembic.
+        """
+        if self.database_auto_create is not None:
+            return self.database_auto_create
+
+        return self.environment in ["development", "testing"]
+
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
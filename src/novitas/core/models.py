@@ -45,6 +45,7 @@ class ChangeProposal(BaseModel):
 
     id: UUID = Field(default_factory=uuid4)
     agent_id: UUID
+    cycle_id: UUID | None = None
     improvement_type: ImprovementType
     file_path: str
     description: str
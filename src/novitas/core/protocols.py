@@ -2,6 +2,7 @@
 
 from abc import ABC
 from abc import abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 from typing import Protocol
 from typing import runtime_checkable
@@ -61,6 +62,15 @@ class DatabaseManager(Protocol):
         """Disconnect from the database."""
         ...
 
+    @property
+    def status(self) -> str:
+        """Database connection status."""
+        ...
+
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Group the writes made inside the block into a single commit."""
+        ...
+
     async def save_agent_state(self, agent_state: AgentState) -> None:
         """Save an agent's state to the database."""
         ...
@@ -69,10 +79,18 @@ class DatabaseManager(Protocol):
         """Load an agent's state from the database."""
         ...
 
+    async def load_agent_states(self, agent_ids: list[UUID]) -> list[AgentState]:
+        """Load several agents' states from the database."""
+        ...
+
     async def save_change_proposal(self, proposal: ChangeProposal) -> None:
         """Save a change proposal to the database."""
         ...
 
+    async def save_change_proposals(self, proposals: list[ChangeProposal]) -> None:
+        """Save a batch of new change proposals to the database."""
+        ...
+
     async def get_change_proposals(self, cycle_id: UUID) -> list[ChangeProposal]:
         """Get all change proposals for a cycle."""
         ...
@@ -108,6 +126,12 @@ class MessageBroker(Protocol):
         """Receive a message for an agent."""
         ...
 
+    async def receive_messages(
+        self, agent_id: UUID, max_messages: int = 32
+    ) -> list[dict[str, Any]]:
+        """Receive a batch of messages for an agent."""
+        ...
+
     async def broadcast_message(self, message: dict[str, Any]) -> None:
         """Broadcast a message to all agents."""
         ...
@@ -1,13 +1,25 @@
 """Database connection and management for the Novitas AI system."""
 
-import subprocess
-import sys
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
 from uuid import UUID
 
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from ..config.logging import get_logger
 from ..config.settings import settings
@@ -15,13 +27,31 @@ from ..core.models import AgentState
 from ..core.models import ChangeProposal
 from ..core.models import ImprovementCycle
 from ..core.protocols import DatabaseManager
+from .models import AgentStateModel
 from .models import Base
+from .models import ImprovementCycleModel
 from .repositories import AgentStateRepository
 from .repositories import ChangeProposalRepository
 from .repositories import ImprovementCycleRepository
+from .repositories import in_unit_of_work
+from .repositories import unit_of_work
 
 logger = get_logger(__name__)
 
+_CACHE_MISS = object()
+
+
+def _run_upgrade(sync_conn: Connection, alembic_config: Config) -> None:
+    """Upgrade to head on a connection borrowed from the application's engine."""
+    alembic_config.attributes["connection"] = sync_conn
+    command.upgrade(alembic_config, "head")
+
+
+def _reset_schema(sync_conn: Connection) -> None:
+    """Drop and recreate all tables within a single run_sync dispatch."""
+    Base.metadata.drop_all(sync_conn)
+    Base.metadata.create_all(sync_conn)
+
 
 class DatabaseManagerImpl(DatabaseManager):
     """Implementation of the database manager."""
@@ -30,33 +60,100 @@ class DatabaseManagerImpl(DatabaseManager):
         """Initialize the database manager."""
         self._connected = False
         self._engine: AsyncEngine | None = None
-        self._session_maker = None
+        self._session_maker: async_sessionmaker[AsyncSession] | None = None
         self._session: AsyncSession | None = None
 
+        # Bounded LRU read-result cache keyed on (method, table, generation); every
+        # write to a table bumps its generation so stale entries are never served.
+        self._generations: dict[str, int] = {}
+        self._result_cache: OrderedDict[tuple[str, str, int], tuple[float, Any]] = (
+            OrderedDict()
+        )
+
+    def _cache_get(self, method: str, table: str) -> Any:
+        """Return a deep copy of a cached read result, or the miss sentinel."""
+        key = (method, table, self._generations.get(table, 0))
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return _CACHE_MISS
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._result_cache[key]
+            return _CACHE_MISS
+
+        self._result_cache.move_to_end(key)
+        # Callers mutate nested fields (memory, metrics) in place
+        return copy.deepcopy(value)
+
+    def _cache_put(self, method: str, table: str, value: Any) -> None:
+        """Store a deep copy of a read result for the table's current generation."""
+        ttl = settings.database_cache_ttl_seconds
+        if ttl <= 0:
+            return
+
+        # Rows read inside an open unit of work may still be rolled back
+        if self._session is not None and in_unit_of_work(self._session):
+            return
+
+        key = (method, table, self._generations.get(table, 0))
+        self._result_cache[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > settings.database_cache_max_entries:
+            self._result_cache.popitem(last=False)
+
+    def _invalidate(self, table: str) -> None:
+        """Bump a table's generation and drop its cached results."""
+        self._generations[table] = self._generations.get(table, 0) + 1
+        self._result_cache = OrderedDict(
+            (key, entry) for key, entry in self._result_cache.items() if key[1] != table
+        )
+
+    def _clear_cache(self) -> None:
+        """Drop all cached read results."""
+        self._result_cache.clear()
+
     async def connect(self) -> None:
         """Connect to the database."""
         if self._connected:
             return
 
         try:
-            # Create async engine
+            # Create async engine; in-memory SQLite keeps SQLAlchemy's static pool
+            database_url = make_url(settings.resolved_database_url)
+            pooled = (
+                database_url.get_backend_name() != "sqlite"
+                or database_url.database not in (None, "", ":memory:")
+            )
+            pool_kwargs: dict[str, Any] = {}
+            if pooled:
+                pool_kwargs = {
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": settings.database_pool_size,
+                    "max_overflow": 0,
+                }
+
             self._engine = create_async_engine(
-                settings.resolved_database_url,
+                database_url,
                 echo=settings.debug,
                 pool_pre_ping=True,
+                **pool_kwargs,
             )
 
-            # Create tables if they don't exist
-            async with self._engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
+            # Create tables if they don't exist; staging/production rely on migrate()
+            if settings.debug or settings.resolved_database_auto_create:
+                async with self._engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
 
             # Create session maker
-            self._session_maker = sessionmaker(
+            self._session_maker = async_sessionmaker(
                 bind=self._engine,
-                class_=AsyncSession,
                 expire_on_commit=False,
             )
 
+            if pooled:
+                await self._warm_pool(settings.database_pool_size)
+
             self._connected = True
             logger.info("Database connected successfully")
 
@@ -64,6 +161,16 @@ class DatabaseManagerImpl(DatabaseManager):
             logger.error("Failed to connect to database", error=str(e))
             raise
 
+    async def _warm_pool(self, size: int) -> None:
+        """Open size pooled connections up front so first queries skip the handshake."""
+
+        async def ping() -> None:
+            async with self._engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        # Run concurrently so each ping holds its own connection
+        await asyncio.gather(*(ping() for _ in range(size)))
+
     async def disconnect(self) -> None:
         """Disconnect from the database."""
         if not self._connected:
@@ -80,6 +187,7 @@ class DatabaseManagerImpl(DatabaseManager):
             self._session = None
             self._engine = None
             self._session_maker = None
+            self._clear_cache()
 
             logger.info("Database disconnected successfully")
 
@@ -100,6 +208,13 @@ class DatabaseManagerImpl(DatabaseManager):
 
         return self._session
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Commit all writes made inside the block once, or roll them back."""
+        session = await self._get_session()
+        async with unit_of_work(session):
+            yield
+
     async def save_agent_state(self, agent_state: AgentState) -> None:
         """Save an agent's state to the database."""
         session = await self._get_session()
@@ -115,6 +230,8 @@ class DatabaseManagerImpl(DatabaseManager):
                 await repository.create(agent_state)
                 logger.info("Created agent state", agent_id=agent_state.id)
 
+            self._invalidate(AgentStateModel.__tablename__)
+
         except Exception as e:
             logger.error(
                 "Failed to save agent state", agent_id=agent_state.id, error=str(e)
@@ -123,22 +240,54 @@ class DatabaseManagerImpl(DatabaseManager):
 
     async def load_agent_state(self, agent_id: UUID) -> AgentState | None:
         """Load an agent's state from the database."""
+        method = f"load_agent_state:{agent_id}"
+        cached = self._cache_get(method, AgentStateModel.__tablename__)
+        if cached is not _CACHE_MISS:
+            return cached
+
         session = await self._get_session()
         repository = AgentStateRepository(session)
 
         try:
             agent_state = await repository.get_by_id(str(agent_id))
-            if agent_state:
-                logger.info("Loaded agent state", agent_id=agent_id)
-            else:
+            if not agent_state:
+                # Misses are not cached so agents created elsewhere show up
                 logger.info("Agent state not found", agent_id=agent_id)
+                return None
 
+            logger.info("Loaded agent state", agent_id=agent_id)
+            self._cache_put(method, AgentStateModel.__tablename__, agent_state)
             return agent_state
 
         except Exception as e:
             logger.error("Failed to load agent state", agent_id=agent_id, error=str(e))
             raise
 
+    async def load_agent_states(self, agent_ids: list[UUID]) -> list[AgentState]:
+        """Load several agents' states with a single query.
+
+        States are returned in the order of ``agent_ids``; unknown IDs are skipped.
+        """
+        session = await self._get_session()
+        repository = AgentStateRepository(session)
+
+        try:
+            agent_states = await repository.get_by_ids(
+                [str(agent_id) for agent_id in agent_ids]
+            )
+            logger.info(
+                "Loaded agent states",
+                requested=len(agent_ids),
+                count=len(agent_states),
+            )
+            return agent_states
+
+        except Exception as e:
+            logger.error(
+                "Failed to load agent states", count=len(agent_ids), error=str(e)
+            )
+            raise
+
     async def save_change_proposal(self, proposal: ChangeProposal) -> None:
         """Save a change proposal to the database."""
         session = await self._get_session()
@@ -160,6 +309,21 @@ class DatabaseManagerImpl(DatabaseManager):
             )
             raise
 
+    async def save_change_proposals(self, proposals: list[ChangeProposal]) -> None:
+        """Insert a batch of new change proposals in a single round-trip."""
+        session = await self._get_session()
+        repository = ChangeProposalRepository(session)
+
+        try:
+            await repository.create_many(proposals)
+            logger.info("Created change proposals", count=len(proposals))
+
+        except Exception as e:
+            logger.error(
+                "Failed to save change proposals", count=len(proposals), error=str(e)
+            )
+            raise
+
     async def get_change_proposals(self, cycle_id: UUID) -> list[ChangeProposal]:
         """Get all change proposals for a cycle."""
         session = await self._get_session()
@@ -193,6 +357,8 @@ class DatabaseManagerImpl(DatabaseManager):
                 await repository.create(cycle)
                 logger.info("Created improvement cycle", cycle_id=cycle.id)
 
+            self._invalidate(ImprovementCycleModel.__tablename__)
+
         except Exception as e:
             logger.error(
                 "Failed to save improvement cycle", cycle_id=cycle.id, error=str(e)
@@ -201,6 +367,12 @@ class DatabaseManagerImpl(DatabaseManager):
 
     async def get_latest_cycle(self) -> ImprovementCycle | None:
         """Get the latest improvement cycle."""
+        cached = self._cache_get(
+            "get_latest_cycle", ImprovementCycleModel.__tablename__
+        )
+        if cached is not _CACHE_MISS:
+            return cached
+
         session = await self._get_session()
         repository = ImprovementCycleRepository(session)
 
@@ -211,6 +383,9 @@ class DatabaseManagerImpl(DatabaseManager):
             else:
                 logger.info("No cycles found")
 
+            self._cache_put(
+                "get_latest_cycle", ImprovementCycleModel.__tablename__, cycle
+            )
             return cycle
 
         except Exception as e:
@@ -219,18 +394,36 @@ class DatabaseManagerImpl(DatabaseManager):
 
     async def get_all_agents(self) -> list[AgentState]:
         """Get all agents from the database."""
+        cached = self._cache_get("get_all_agents", AgentStateModel.__tablename__)
+        if cached is not _CACHE_MISS:
+            return cached
+
         session = await self._get_session()
         repository = AgentStateRepository(session)
 
         try:
             agents = await repository.get_all()
             logger.info("Retrieved all agents", count=len(agents))
+            self._cache_put("get_all_agents", AgentStateModel.__tablename__, agents)
             return agents
 
         except Exception as e:
             logger.error("Failed to get all agents", error=str(e))
             raise
 
+    async def iter_all_agents(self) -> AsyncIterator[AgentState]:
+        """Stream all agents from the database in constant memory."""
+        session = await self._get_session()
+        repository = AgentStateRepository(session)
+
+        try:
+            async for agent in repository.iter_all():
+                yield agent
+
+        except Exception as e:
+            logger.error("Failed to stream agents", error=str(e))
+            raise
+
     async def get_recent_cycles(self, count: int) -> list[ImprovementCycle]:
         """Get recent improvement cycles."""
         session = await self._get_session()
@@ -254,17 +447,11 @@ class DatabaseManagerImpl(DatabaseManager):
             raise RuntimeError("Database engine not initialized")
 
         try:
-            # Run Alembic migrations
-            result = subprocess.run(
-                [sys.executable, "-m", "alembic", "upgrade", "head"],
-                check=False,
-                capture_output=True,
-                text=True,
-                cwd=".",
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(f"Migration failed: {result.stderr}")
+            # Run Alembic migrations in-process over the existing async pool
+            alembic_config = Config(str(Path("alembic.ini")))
+            alembic_config.attributes["configure_logger"] = False
+            async with self._engine.begin() as conn:
+                await conn.run_sync(_run_upgrade, alembic_config)
 
             logger.info("Database migrations completed successfully")
 
@@ -283,22 +470,118 @@ class DatabaseManagerImpl(DatabaseManager):
         try:
             # Drop all tables and recreate them
             async with self._engine.begin() as conn:
-                await conn.run_sync(Base.metadata.drop_all)
-                await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(_reset_schema)
 
+            self._clear_cache()
             logger.info("Database reset completed")
 
         except Exception as e:
             logger.error("Failed to reset database", error=str(e))
             raise
 
-    def get_status(self) -> str:
-        """Get database status."""
+    @property
+    def status(self) -> str:
+        """Database connection status."""
         if not self._connected:
             return "Disconnected"
         return "Connected"
 
 
-def get_database_manager() -> DatabaseManager:
-    """Get a database manager instance."""
+class InMemoryDatabaseManager(DatabaseManager):
+    """Dict-backed database manager for dry runs; nothing is persisted."""
+
+    def __init__(self) -> None:
+        """Initialize the in-memory database manager."""
+        self._connected = False
+        self._agent_states: dict[UUID, AgentState] = {}
+        self._change_proposals: dict[UUID, ChangeProposal] = {}
+        self._improvement_cycles: dict[UUID, ImprovementCycle] = {}
+        self._agent_memory: dict[UUID, dict[str, Any]] = {}
+
+    async def connect(self) -> None:
+        """Connect to the database."""
+        self._connected = True
+        logger.info("In-memory database manager connected")
+
+    async def disconnect(self) -> None:
+        """Disconnect from the database."""
+        self._connected = False
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes into a single commit (a no-op in memory)."""
+        yield
+
+    async def save_agent_state(self, agent_state: AgentState) -> None:
+        """Save an agent's state."""
+        self._agent_states[agent_state.id] = agent_state.model_copy()
+
+    async def load_agent_state(self, agent_id: UUID) -> AgentState | None:
+        """Load an agent's state."""
+        agent_state = self._agent_states.get(agent_id)
+        return agent_state.model_copy() if agent_state else None
+
+    async def load_agent_states(self, agent_ids: list[UUID]) -> list[AgentState]:
+        """Load several agents' states."""
+        return [
+            self._agent_states[agent_id].model_copy()
+            for agent_id in agent_ids
+            if agent_id in self._agent_states
+        ]
+
+    async def save_change_proposal(self, proposal: ChangeProposal) -> None:
+        """Save a change proposal."""
+        self._change_proposals[proposal.id] = proposal
+
+    async def save_change_proposals(self, proposals: list[ChangeProposal]) -> None:
+        """Save a batch of new change proposals."""
+        for proposal in proposals:
+            self._change_proposals[proposal.id] = proposal
+
+    async def get_change_proposals(self, cycle_id: UUID) -> list[ChangeProposal]:
+        """Get all change proposals for a cycle."""
+        return [
+            proposal
+            for proposal in self._change_proposals.values()
+            if proposal.cycle_id == cycle_id
+        ]
+
+    async def save_improvement_cycle(self, cycle: ImprovementCycle) -> None:
+        """Save an improvement cycle."""
+        self._improvement_cycles[cycle.id] = cycle
+
+    async def get_latest_cycle(self) -> ImprovementCycle | None:
+        """Get the latest improvement cycle."""
+        return max(
+            self._improvement_cycles.values(),
+            key=lambda cycle: cycle.start_time,
+            default=None,
+        )
+
+    async def save_agent_memory(
+        self, agent_id: UUID, memory_data: dict[str, Any]
+    ) -> None:
+        """Save agent memory."""
+        self._agent_memory[agent_id] = memory_data
+
+    async def load_agent_memory(self, agent_id: UUID) -> dict[str, Any] | None:
+        """Load agent memory."""
+        return self._agent_memory.get(agent_id)
+
+    @property
+    def status(self) -> str:
+        """Database connection status."""
+        if not self._connected:
+            return "Disconnected"
+        return "Connected (in-memory)"
+
+
+def get_database_manager(dry_run: bool = False) -> DatabaseManager:
+    """Get a database manager instance.
+
+    Dry runs get an in-memory manager so no connection is opened and nothing
+    is written.
+    """
+    if dry_run:
+        return InMemoryDatabaseManager()
     return DatabaseManagerImpl()
@@ -1,5 +1,6 @@
 """Alembic environment configuration."""
 
+import functools
 import sys
 from logging.config import fileConfig
 from pathlib import Path
@@ -7,6 +8,7 @@ from pathlib import Path
 from alembic import context
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.engine import Connection
 
 # Add the src directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / "src"))
@@ -20,7 +22,10 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# Skipped when invoked programmatically so the application's logging is kept.
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -31,6 +36,7 @@ target_metadata = Base.metadata
 # can be acquired as needed for specific migration requirements
 
 
+@functools.cache
 def get_sync_database_url() -> str:
     """Get sync database URL for Alembic migrations."""
     # Convert async URLs to sync URLs for Alembic
@@ -46,6 +52,19 @@ def get_sync_database_url() -> str:
         return async_url
 
 
+def include_object(
+    obj: object,
+    name: str | None,  # noqa: ARG001
+    type_: str,
+    reflected: bool,  # noqa: ARG001
+    compare_to: object,  # noqa: ARG001
+) -> bool:
+    """Skip PostgreSQL-only indexes when autogenerating against another backend."""
+    if type_ == "index" and obj.dialect_kwargs.get("postgresql_using"):
+        return context.get_context().dialect.name == "postgresql"
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -65,6 +84,19 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """Run migrations on an already open connection."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -74,10 +106,17 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+    Reuses a connection handed over through ``config.attributes`` (the
+    application passes one from its async engine via ``run_sync``); otherwise,
+    as for CLI usage, creates an Engine and associates a connection with the
+    context.
 
     """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     # Use sync database URL for online mode
     sync_url = get_sync_database_url()
     config.set_main_option("sqlalchemy.url", sync_url)
@@ -89,10 +128,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,78 @@
+"""Store enum values as indexed VARCHAR columns
+
+Revision ID: 3b7d9f2e6a15
+Revises: 9e4b1d0a7c32
+Create Date: 2026-10-16 03:44:05.271863
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7d9f2e6a15"
+down_revision: str | Sequence[str] | None = "9e4b1d0a7c32"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+AGENT_TYPES = ("ORCHESTRATOR", "CODE_AGENT", "TEST_AGENT", "DOCUMENTATION_AGENT")
+AGENT_STATUSES = ("ACTIVE", "INACTIVE", "RETIRED", "ARCHIVED")
+IMPROVEMENT_TYPES = (
+    "CODE_IMPROVEMENT",
+    "TEST_IMPROVEMENT",
+    "DOCUMENTATION_IMPROVEMENT",
+    "PROMPT_IMPROVEMENT",
+    "CONFIG_IMPROVEMENT",
+)
+
+# (table, column, native enum name, member names)
+ENUM_COLUMNS = [
+    ("agent_states", "agent_type", "agenttype", AGENT_TYPES),
+    ("agent_states", "status", "agentstatus", AGENT_STATUSES),
+    ("change_proposals", "improvement_type", "improvementtype", IMPROVEMENT_TYPES),
+    ("prompt_templates", "agent_type", "agenttype", AGENT_TYPES),
+]
+NATIVE_ENUMS = {enum_name: names for _, _, enum_name, names in ENUM_COLUMNS}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, enum_name, names in ENUM_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Enum(*names, name=enum_name),
+                type_=sa.String(length=32),
+                existing_nullable=False,
+                postgresql_using=f"{column}::text",
+            )
+
+        # Every member's value is its lower-cased name
+        op.execute(f"UPDATE {table} SET {column} = lower({column})")
+        op.create_index(f"ix_{table}_{column}", table, [column])
+
+    if op.get_bind().dialect.name == "postgresql":
+        for enum_name in NATIVE_ENUMS:
+            op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        for enum_name, names in NATIVE_ENUMS.items():
+            sa.Enum(*names, name=enum_name).create(op.get_bind())
+
+    for table, column, enum_name, names in ENUM_COLUMNS:
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
+        op.execute(f"UPDATE {table} SET {column} = upper({column})")
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=32),
+                type_=sa.Enum(*names, name=enum_name),
+                existing_nullable=False,
+                postgresql_using=f"{column}::{enum_name}",
+            )
@@ -0,0 +1,67 @@
+"""Use native boolean columns
+
+Revision ID: 5c8e2b7f41d9
+Revises: a1f2cff288f0
+Create Date: 2026-10-16 03:20:12.418305
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c8e2b7f41d9"
+down_revision: str | Sequence[str] | None = "a1f2cff288f0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BOOLEAN_COLUMNS = [
+    ("improvement_cycles", "success"),
+    ("agent_actions", "success"),
+    ("prompt_templates", "is_active"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+
+    for table, column in BOOLEAN_COLUMNS:
+        # SQLite copies values verbatim when rebuilding the table
+        if is_sqlite:
+            op.execute(
+                f"UPDATE {table} SET {column} = "
+                f"CASE WHEN lower({column}) = 'true' THEN 1 ELSE 0 END"
+            )
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=10),
+                type_=sa.Boolean(),
+                existing_nullable=False,
+                postgresql_using=f"{column}::boolean",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+
+    for table, column in BOOLEAN_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Boolean(),
+                type_=sa.String(length=10),
+                existing_nullable=False,
+                postgresql_using=f"{column}::text",
+            )
+
+        if is_sqlite:
+            op.execute(
+                f"UPDATE {table} SET {column} = "
+                f"CASE WHEN {column} = 1 THEN 'true' ELSE 'false' END"
+            )
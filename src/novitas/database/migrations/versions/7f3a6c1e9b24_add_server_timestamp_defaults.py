@@ -0,0 +1,52 @@
+"""Add server-side timestamp defaults
+
+Revision ID: 7f3a6c1e9b24
+Revises: 3b7d9f2e6a15
+Create Date: 2026-10-16 04:05:37.912604
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3a6c1e9b24"
+down_revision: str | Sequence[str] | None = "3b7d9f2e6a15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIMESTAMP_COLUMNS = [
+    ("agent_states", "created_at"),
+    ("agent_states", "last_active"),
+    ("change_proposals", "created_at"),
+    ("improvement_cycles", "start_time"),
+    ("agent_actions", "timestamp"),
+    ("prompt_templates", "created_at"),
+    ("prompt_templates", "updated_at"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
@@ -0,0 +1,78 @@
+"""Use JSONB with GIN indexes on PostgreSQL
+
+Revision ID: 9e4b1d0a7c32
+Revises: 5c8e2b7f41d9
+Create Date: 2026-10-16 03:31:47.902114
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b1d0a7c32"
+down_revision: str | Sequence[str] | None = "5c8e2b7f41d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSON_COLUMNS = [
+    ("agent_states", "memory"),
+    ("agent_states", "performance_metrics"),
+    ("change_proposals", "proposed_changes"),
+    ("improvement_cycles", "agents_used"),
+    ("improvement_cycles", "changes_proposed"),
+    ("improvement_cycles", "changes_accepted"),
+    ("agent_actions", "details"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite keeps plain JSON; only PostgreSQL has JSONB and GIN
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    op.create_index(
+        "ix_agent_states_performance_metrics_gin",
+        "agent_states",
+        ["performance_metrics"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_actions_details_gin",
+        "agent_actions",
+        ["details"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_actions_details_gin", table_name="agent_actions")
+    op.drop_index("ix_agent_states_performance_metrics_gin", table_name="agent_states")
+
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::json",
+        )
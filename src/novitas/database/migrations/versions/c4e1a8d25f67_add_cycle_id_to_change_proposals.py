@@ -0,0 +1,36 @@
+"""Add cycle_id to change proposals
+
+Revision ID: c4e1a8d25f67
+Revises: 7f3a6c1e9b24
+Create Date: 2026-10-16 04:41:09.350218
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e1a8d25f67"
+down_revision: str | Sequence[str] | None = "7f3a6c1e9b24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("change_proposals", sa.Column("cycle_id", sa.String(), nullable=True))
+    op.create_index(
+        op.f("ix_change_proposals_cycle_id"),
+        "change_proposals",
+        ["cycle_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_change_proposals_cycle_id"), table_name="change_proposals")
+    with op.batch_alter_table("change_proposals") as batch_op:
+        batch_op.drop_column("cycle_id")
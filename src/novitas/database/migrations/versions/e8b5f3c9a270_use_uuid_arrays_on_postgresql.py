@@ -0,0 +1,57 @@
+"""Use UUID arrays for cycle id lists on PostgreSQL
+
+Revision ID: e8b5f3c9a270
+Revises: c4e1a8d25f67
+Create Date: 2026-10-16 05:12:28.604731
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b5f3c9a270"
+down_revision: str | Sequence[str] | None = "c4e1a8d25f67"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+UUID_LIST_COLUMNS = ["agents_used", "changes_proposed", "changes_accepted"]
+
+
+def _convert(column: str, type_: sa.types.TypeEngine, expression: str) -> None:
+    """Rebuild a column with a new type, since USING cannot hold a subquery."""
+    op.add_column("improvement_cycles", sa.Column(f"{column}_new", type_))
+    op.execute(f"UPDATE improvement_cycles SET {column}_new = {expression}")
+    op.drop_column("improvement_cycles", column)
+    op.alter_column(
+        "improvement_cycles",
+        f"{column}_new",
+        new_column_name=column,
+        nullable=False,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite keeps the JSON array of strings
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in UUID_LIST_COLUMNS:
+        _convert(
+            column,
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            f"ARRAY(SELECT jsonb_array_elements_text({column})::uuid)",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in UUID_LIST_COLUMNS:
+        _convert(column, postgresql.JSONB(), f"to_jsonb({column}::text[])")
@@ -2,43 +2,118 @@
 
 from datetime import UTC
 from datetime import datetime
+from enum import Enum as PyEnum
+from typing import Any
+from uuid import UUID
 
+from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import Float
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import Text
+from sqlalchemy import TypeDecorator
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import relationship
 
 from ..core.models import AgentStatus
 from ..core.models import AgentType
 from ..core.models import ImprovementType
 
-# Use JSON for both PostgreSQL and SQLite for compatibility
-JSONType = JSON
+# Binary, indexable JSONB on PostgreSQL; plain JSON everywhere else
+JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 Base = declarative_base()
 
 
+class UUIDList(TypeDecorator):
+    """List of UUIDs: native UUID[] on PostgreSQL, a JSON array of strings elsewhere."""
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> Any:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(PG_UUID(as_uuid=True)))
+        return dialect.type_descriptor(JSON())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return [str(item) for item in value]
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return [UUID(item) for item in value]
+
+
+def _enum_type(enum_class: type[PyEnum]) -> Enum:
+    """Store an enum's values as a plain VARCHAR instead of a native enum type."""
+    return Enum(
+        enum_class,
+        native_enum=False,
+        length=32,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
 class AgentStateModel(Base):
     """SQLAlchemy model for agent state."""
 
     __tablename__ = "agent_states"
 
     id = Column(String, primary_key=True)
-    agent_type = Column(Enum(AgentType), nullable=False)
+    agent_type = Column(_enum_type(AgentType), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(Enum(AgentStatus), nullable=False, default=AgentStatus.ACTIVE)
+    status = Column(
+        _enum_type(AgentStatus),
+        nullable=False,
+        default=AgentStatus.ACTIVE,
+        index=True,
+    )
     version = Column(Integer, nullable=False, default=1)
     prompt = Column(Text, nullable=False)
     memory = Column(JSONType, nullable=False, default=dict)
     performance_metrics = Column(JSONType, nullable=False, default=dict)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
-    last_active = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    last_active = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC), index=True
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_agent_states_performance_metrics_gin",
+            performance_metrics,
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    # Read-only relationships; lazy="raise" makes accidental N+1 loads fail loudly,
+    # so callers must opt in with selectinload() when they need the children.
+    proposals = relationship(
+        "ChangeProposalModel",
+        primaryjoin="AgentStateModel.id == foreign(ChangeProposalModel.agent_id)",
+        back_populates="agent",
+        viewonly=True,
+        lazy="raise",
+    )
+    actions = relationship(
+        "AgentActionModel",
+        primaryjoin="AgentStateModel.id == foreign(AgentActionModel.agent_id)",
+        back_populates="agent",
+        viewonly=True,
+        lazy="raise",
+    )
 
     def __repr__(self) -> str:
         return f"<AgentStateModel(id='{self.id}', name='{self.name}', type='{self.agent_type}')>"
@@ -51,7 +126,8 @@ class ChangeProposalModel(Base):
 
     id = Column(String, primary_key=True)
     agent_id = Column(String, nullable=False)
-    improvement_type = Column(Enum(ImprovementType), nullable=False)
+    cycle_id = Column(String, nullable=True, index=True)
+    improvement_type = Column(_enum_type(ImprovementType), nullable=False, index=True)
     file_path = Column(String(500), nullable=False)
     description = Column(Text, nullable=False)
     reasoning = Column(Text, nullable=False)
@@ -59,6 +135,26 @@ class ChangeProposalModel(Base):
     confidence_score = Column(Float, nullable=False)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
 
+    # Leading agent_id column also serves plain agent_id lookups
+    __table_args__ = (
+        Index("ix_change_proposals_agent_id_created_at", agent_id, created_at),
+    )
+
+    agent = relationship(
+        "AgentStateModel",
+        primaryjoin="AgentStateModel.id == foreign(ChangeProposalModel.agent_id)",
+        back_populates="proposals",
+        viewonly=True,
+        lazy="raise",
+    )
+    cycle = relationship(
+        "ImprovementCycleModel",
+        primaryjoin="ImprovementCycleModel.id == foreign(ChangeProposalModel.cycle_id)",
+        back_populates="proposals",
+        viewonly=True,
+        lazy="raise",
+    )
+
     def __repr__(self) -> str:
         return f"<ChangeProposalModel(id='{self.id}', file='{self.file_path}', type='{self.improvement_type}')>"
 
@@ -70,16 +166,27 @@ class ImprovementCycleModel(Base):
 
     id = Column(String, primary_key=True)
     cycle_number = Column(Integer, nullable=False)
-    start_time = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    start_time = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC), index=True
+    )
     end_time = Column(DateTime, nullable=True)
-    agents_used = Column(JSONType, nullable=False, default=list)
-    changes_proposed = Column(JSONType, nullable=False, default=list)
-    changes_accepted = Column(JSONType, nullable=False, default=list)
-    success = Column(
-        String(10), nullable=False, default="true"
-    )  # SQLite boolean workaround
+    agents_used = Column(UUIDList, nullable=False, default=list)
+    changes_proposed = Column(UUIDList, nullable=False, default=list)
+    changes_accepted = Column(UUIDList, nullable=False, default=list)
+    success = Column(Boolean, nullable=False, default=True)
     error_message = Column(Text, nullable=True)
 
+    # Serves get_latest/get_recent, which order by cycle_number descending
+    __table_args__ = (Index("ix_cycles_number_desc", cycle_number.desc()),)
+
+    proposals = relationship(
+        "ChangeProposalModel",
+        primaryjoin="ImprovementCycleModel.id == foreign(ChangeProposalModel.cycle_id)",
+        back_populates="cycle",
+        viewonly=True,
+        lazy="raise",
+    )
+
     def __repr__(self) -> str:
         return (
             f"<ImprovementCycleModel(id='{self.id}', cycle_number={self.cycle_number})>"
@@ -92,16 +199,30 @@ class AgentActionModel(Base):
     __tablename__ = "agent_actions"
 
     id = Column(String, primary_key=True)
-    agent_id = Column(String, nullable=False)
+    agent_id = Column(String, nullable=False, index=True)
     action_type = Column(String(100), nullable=False)
     details = Column(JSONType, nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
-    success = Column(
-        String(10), nullable=False, default="true"
-    )  # SQLite boolean workaround
+    timestamp = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC), index=True
+    )
+    success = Column(Boolean, nullable=False, default=True)
     error_message = Column(Text, nullable=True)
     duration_seconds = Column(Float, nullable=True)
 
+    __table_args__ = (
+        Index("ix_actions_details_gin", details, postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+    agent = relationship(
+        "AgentStateModel",
+        primaryjoin="AgentStateModel.id == foreign(AgentActionModel.agent_id)",
+        back_populates="actions",
+        viewonly=True,
+        lazy="raise",
+    )
+
     def __repr__(self) -> str:
         return f"<AgentActionModel(id='{self.id}', agent_id='{self.agent_id}', action_type='{self.action_type}')>"
 
@@ -113,12 +234,10 @@ class PromptTemplateModel(Base):
 
     id = Column(String, primary_key=True)
     name = Column(String(255), nullable=False)
-    agent_type = Column(Enum(AgentType), nullable=False)
+    agent_type = Column(_enum_type(AgentType), nullable=False, index=True)
     template = Column(Text, nullable=False)
     version = Column(Integer, nullable=False, default=1)
-    is_active = Column(
-        String(10), nullable=False, default="true"
-    )  # SQLite boolean workaround
+    is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
     updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
 
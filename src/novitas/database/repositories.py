@@ -1,27 +1,114 @@
 """Repository pattern implementation for database operations."""
 
+import functools
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from contextlib import asynccontextmanager
+from typing import Any
+from typing import ClassVar
 from uuid import UUID
 
+from sqlalchemy import Select
+from sqlalchemy import bindparam
+from sqlalchemy import delete
+from sqlalchemy import insert
 from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from ..core.models import AgentState
 from ..core.models import ChangeProposal
 from ..core.models import ImprovementCycle
 from .models import AgentStateModel
+from .models import Base
 from .models import ChangeProposalModel
 from .models import ImprovementCycleModel
 
+# session.info flag set while a unit of work is open on that session
+_UNIT_OF_WORK = "novitas_unit_of_work"
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """Return whether a unit of work is open on the session."""
+    return bool(session.info.get(_UNIT_OF_WORK))
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[None]:
+    """Group repository writes on a session into a single commit.
+
+    Repository methods only flush while the unit of work is open; it commits on
+    exit and rolls back on error. Nested units of work join the outermost one.
+    """
+    if in_unit_of_work(session):
+        yield
+        return
+
+    session.info[_UNIT_OF_WORK] = True
+    try:
+        yield
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        session.info.pop(_UNIT_OF_WORK, None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _uuid(value: str) -> UUID:
+    """Parse a UUID string, reusing results for ids that recur across rows."""
+    return UUID(value)
+
 
 class BaseRepository(ABC):
     """Base repository interface following SOLID principles."""
 
+    model: ClassVar[type[Base]]
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize repository with database session."""
         self.session = session
 
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Open a unit of work so the writes inside it commit once."""
+        return unit_of_work(self.session)
+
+    async def _commit(self) -> None:
+        """Commit, or only flush while a unit of work is open."""
+        if in_unit_of_work(self.session):
+            await self.session.flush()
+        else:
+            await self.session.commit()
+
+    async def bulk_core_insert(self, items: list[dict[str, Any]]) -> None:
+        """Insert many rows in one executemany, bypassing the ORM unit of work."""
+        if not items:
+            return
+
+        await self.session.execute(insert(self.model), items)
+        await self._commit()
+
+    async def update_by_id(self, entity_id: str, values: dict[str, Any]) -> bool:
+        """Update one row by primary key in a single UPDATE; False if missing."""
+        # Default synchronize_session refreshes loaded instances without a SELECT
+        result = await self.session.execute(
+            update(self.model).where(self.model.id == entity_id).values(**values)
+        )
+        await self._commit()
+        return result.rowcount > 0
+
+    async def delete_by_id(self, entity_id: str) -> bool:
+        """Delete one row by primary key in a single DELETE; False if missing."""
+        result = await self.session.execute(
+            delete(self.model).where(self.model.id == entity_id)
+        )
+        await self._commit()
+        return result.rowcount > 0
+
     @abstractmethod
     async def create(self, entity) -> None:
         """Create a new entity."""
@@ -46,36 +133,50 @@ class BaseRepository(ABC):
 class AgentStateRepository(BaseRepository):
     """Repository for agent state operations."""
 
+    model = AgentStateModel
+
+    # Built once at import; SQLAlchemy's compiled cache keys off these objects
+    _SELECT_ALL = select(AgentStateModel)
+    _SELECT_BY_IDS = select(AgentStateModel).where(
+        AgentStateModel.id.in_(bindparam("ids", expanding=True))
+    )
+    _SELECT_BY_STATUS = select(AgentStateModel).where(
+        AgentStateModel.status == bindparam("status")
+    )
+
     async def create(self, agent_state: AgentState) -> None:
         """Create a new agent state."""
-        model = AgentStateModel(
-            id=str(agent_state.id),
-            agent_type=agent_state.agent_type,
-            name=agent_state.name,
-            description=agent_state.description,
-            status=agent_state.status,
-            version=agent_state.version,
-            prompt=agent_state.prompt,
-            memory=agent_state.memory,
-            performance_metrics=agent_state.performance_metrics,
-            created_at=agent_state.created_at,
-            last_active=agent_state.last_active,
-        )
-        self.session.add(model)
-        await self.session.commit()
+        await self.create_many([agent_state])
 
-    async def get_by_id(self, agent_id: str) -> AgentState | None:
-        """Get agent state by ID."""
-        result = await self.session.execute(
-            select(AgentStateModel).where(AgentStateModel.id == agent_id)
+    async def create_many(self, agent_states: list[AgentState]) -> None:
+        """Create multiple agent states in a single bulk insert."""
+        await self.bulk_core_insert(
+            [self._to_row_dict(agent_state) for agent_state in agent_states]
         )
-        model = result.scalar_one_or_none()
-
-        if model is None:
-            return None
 
-        return AgentState(
-            id=UUID(model.id),
+    @staticmethod
+    def _to_row_dict(agent_state: AgentState) -> dict[str, Any]:
+        """Build the insert parameters for an agent state."""
+        return {
+            "id": str(agent_state.id),
+            "agent_type": agent_state.agent_type,
+            "name": agent_state.name,
+            "description": agent_state.description,
+            "status": agent_state.status,
+            "version": agent_state.version,
+            "prompt": agent_state.prompt,
+            "memory": agent_state.memory,
+            "performance_metrics": agent_state.performance_metrics,
+            "created_at": agent_state.created_at,
+            "last_active": agent_state.last_active,
+        }
+
+    @staticmethod
+    def _to_entity(model: AgentStateModel) -> AgentState:
+        """Build an agent state from its database row."""
+        # Rows were validated on the way in, so skip pydantic validation on reads
+        return AgentState.model_construct(
+            id=_uuid(model.id),
             agent_type=model.agent_type,
             name=model.name,
             description=model.description,
@@ -88,118 +189,113 @@ class AgentStateRepository(BaseRepository):
             last_active=model.last_active,
         )
 
-    async def update(self, agent_state: AgentState) -> None:
-        """Update an agent state."""
-        result = await self.session.execute(
-            select(AgentStateModel).where(AgentStateModel.id == str(agent_state.id))
-        )
-        model = result.scalar_one_or_none()
+    async def get_by_id(self, agent_id: str) -> AgentState | None:
+        """Get agent state by ID."""
+        model = await self.session.get(AgentStateModel, agent_id)
 
         if model is None:
-            raise ValueError(f"Agent state with id {agent_state.id} not found")
+            return None
+
+        return self._to_entity(model)
+
+    async def get_by_ids(self, agent_ids: list[str]) -> list[AgentState]:
+        """Get agent states for several IDs in a single query."""
+        if not agent_ids:
+            return []
+
+        result = await self.session.execute(self._SELECT_BY_IDS, {"ids": agent_ids})
+        models = {model.id: model for model in result.scalars().all()}
 
-        model.agent_type = agent_state.agent_type
-        model.name = agent_state.name
-        model.description = agent_state.description
-        model.status = agent_state.status
-        model.version = agent_state.version
-        model.prompt = agent_state.prompt
-        model.memory = agent_state.memory
-        model.performance_metrics = agent_state.performance_metrics
-        model.last_active = agent_state.last_active
+        return [
+            self._to_entity(model)
+            for model in (models.get(agent_id) for agent_id in agent_ids)
+            if model is not None
+        ]
+
+    async def update(self, agent_state: AgentState) -> None:
+        """Update an agent state."""
+        values = self._to_row_dict(agent_state)
+        del values["id"], values["created_at"]
 
-        await self.session.commit()
+        if not await self.update_by_id(str(agent_state.id), values):
+            raise ValueError(f"Agent state with id {agent_state.id} not found")
 
     async def delete(self, agent_id: str) -> None:
         """Delete an agent state."""
-        result = await self.session.execute(
-            select(AgentStateModel).where(AgentStateModel.id == agent_id)
-        )
-        model = result.scalar_one_or_none()
-
-        if model is not None:
-            await self.session.delete(model)
-            await self.session.commit()
+        await self.delete_by_id(agent_id)
 
     async def get_all(self) -> list[AgentState]:
         """Get all agent states."""
-        result = await self.session.execute(select(AgentStateModel))
-        models = result.scalars().all()
+        return [agent_state async for agent_state in self.iter_all()]
 
-        return [
-            AgentState(
-                id=UUID(model.id),
-                agent_type=model.agent_type,
-                name=model.name,
-                description=model.description,
-                status=model.status,
-                version=model.version,
-                prompt=model.prompt,
-                memory=model.memory,
-                performance_metrics=model.performance_metrics,
-                created_at=model.created_at,
-                last_active=model.last_active,
-            )
-            for model in models
-        ]
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[AgentState]:
+        """Stream all agent states, fetching batch_size rows at a time."""
+        return self._stream(self._SELECT_ALL, {}, batch_size)
 
     async def get_by_status(self, status) -> list[AgentState]:
         """Get agent states by status."""
-        result = await self.session.execute(
-            select(AgentStateModel).where(AgentStateModel.status == status)
+        return [agent_state async for agent_state in self.iter_by_status(status)]
+
+    def iter_by_status(
+        self, status, batch_size: int = 1000
+    ) -> AsyncIterator[AgentState]:
+        """Stream agent states with the given status."""
+        return self._stream(self._SELECT_BY_STATUS, {"status": status}, batch_size)
+
+    async def _stream(
+        self, stmt: Select, params: dict[str, Any], batch_size: int
+    ) -> AsyncIterator[AgentState]:
+        """Yield entities for stmt while holding only batch_size rows in memory."""
+        models = await self.session.stream_scalars(
+            stmt, params, execution_options={"yield_per": batch_size}
         )
-        models = result.scalars().all()
 
-        return [
-            AgentState(
-                id=UUID(model.id),
-                agent_type=model.agent_type,
-                name=model.name,
-                description=model.description,
-                status=model.status,
-                version=model.version,
-                prompt=model.prompt,
-                memory=model.memory,
-                performance_metrics=model.performance_metrics,
-                created_at=model.created_at,
-                last_active=model.last_active,
-            )
-            for model in models
-        ]
+        async for model in models:
+            yield self._to_entity(model)
 
 
 class ChangeProposalRepository(BaseRepository):
     """Repository for change proposal operations."""
 
+    model = ChangeProposalModel
+
+    _SELECT_BY_CYCLE_ID = select(ChangeProposalModel).where(
+        ChangeProposalModel.cycle_id == bindparam("cycle_id")
+    )
+
     async def create(self, proposal: ChangeProposal) -> None:
         """Create a new change proposal."""
-        model = ChangeProposalModel(
-            id=str(proposal.id),
-            agent_id=str(proposal.agent_id),
-            improvement_type=proposal.improvement_type,
-            file_path=proposal.file_path,
-            description=proposal.description,
-            reasoning=proposal.reasoning,
-            proposed_changes=proposal.proposed_changes,
-            confidence_score=proposal.confidence_score,
-            created_at=proposal.created_at,
-        )
-        self.session.add(model)
-        await self.session.commit()
+        await self.create_many([proposal])
 
-    async def get_by_id(self, proposal_id: str) -> ChangeProposal | None:
-        """Get change proposal by ID."""
-        result = await self.session.execute(
-            select(ChangeProposalModel).where(ChangeProposalModel.id == proposal_id)
+    async def create_many(self, proposals: list[ChangeProposal]) -> None:
+        """Create multiple change proposals in a single bulk insert."""
+        await self.bulk_core_insert(
+            [self._to_row_dict(proposal) for proposal in proposals]
         )
-        model = result.scalar_one_or_none()
-
-        if model is None:
-            return None
 
-        return ChangeProposal(
-            id=UUID(model.id),
-            agent_id=UUID(model.agent_id),
+    @staticmethod
+    def _to_row_dict(proposal: ChangeProposal) -> dict[str, Any]:
+        """Build the insert parameters for a change proposal."""
+        return {
+            "id": str(proposal.id),
+            "agent_id": str(proposal.agent_id),
+            "cycle_id": str(proposal.cycle_id) if proposal.cycle_id else None,
+            "improvement_type": proposal.improvement_type,
+            "file_path": proposal.file_path,
+            "description": proposal.description,
+            "reasoning": proposal.reasoning,
+            "proposed_changes": proposal.proposed_changes,
+            "confidence_score": proposal.confidence_score,
+            "created_at": proposal.created_at,
+        }
+
+    @staticmethod
+    def _to_entity(model: ChangeProposalModel) -> ChangeProposal:
+        """Build a change proposal from its database row."""
+        return ChangeProposal.model_construct(
+            id=_uuid(model.id),
+            agent_id=_uuid(model.agent_id),
+            cycle_id=_uuid(model.cycle_id) if model.cycle_id else None,
             improvement_type=model.improvement_type,
             file_path=model.file_path,
             description=model.description,
@@ -209,192 +305,144 @@ class ChangeProposalRepository(BaseRepository):
             created_at=model.created_at,
         )
 
-    async def update(self, proposal: ChangeProposal) -> None:
-        """Update a change proposal."""
-        result = await self.session.execute(
-            select(ChangeProposalModel).where(
-                ChangeProposalModel.id == str(proposal.id)
-            )
-        )
-        model = result.scalar_one_or_none()
+    async def get_by_id(self, proposal_id: str) -> ChangeProposal | None:
+        """Get change proposal by ID."""
+        model = await self.session.get(ChangeProposalModel, proposal_id)
 
         if model is None:
-            raise ValueError(f"Change proposal with id {proposal.id} not found")
+            return None
+
+        return self._to_entity(model)
 
-        model.agent_id = str(proposal.agent_id)
-        model.improvement_type = proposal.improvement_type
-        model.file_path = proposal.file_path
-        model.description = proposal.description
-        model.reasoning = proposal.reasoning
-        model.proposed_changes = proposal.proposed_changes
-        model.confidence_score = proposal.confidence_score
+    async def update(self, proposal: ChangeProposal) -> None:
+        """Update a change proposal."""
+        values = self._to_row_dict(proposal)
+        del values["id"], values["created_at"]
 
-        await self.session.commit()
+        if not await self.update_by_id(str(proposal.id), values):
+            raise ValueError(f"Change proposal with id {proposal.id} not found")
 
     async def delete(self, proposal_id: str) -> None:
         """Delete a change proposal."""
-        result = await self.session.execute(
-            select(ChangeProposalModel).where(ChangeProposalModel.id == proposal_id)
-        )
-        model = result.scalar_one_or_none()
-
-        if model is not None:
-            await self.session.delete(model)
-            await self.session.commit()
+        await self.delete_by_id(proposal_id)
 
-    async def get_by_cycle_id(
-        self,
-        cycle_id: str,  # noqa: ARG002
-    ) -> list[ChangeProposal]:
+    async def get_by_cycle_id(self, cycle_id: str) -> list[ChangeProposal]:
         """Get change proposals by cycle ID."""
-        # This would need a cycle_id field in the model or a join table
-        # For now, return all proposals
-        result = await self.session.execute(select(ChangeProposalModel))
+        result = await self.session.execute(
+            self._SELECT_BY_CYCLE_ID, {"cycle_id": cycle_id}
+        )
         models = result.scalars().all()
 
-        return [
-            ChangeProposal(
-                id=UUID(model.id),
-                agent_id=UUID(model.agent_id),
-                improvement_type=model.improvement_type,
-                file_path=model.file_path,
-                description=model.description,
-                reasoning=model.reasoning,
-                proposed_changes=model.proposed_changes,
-                confidence_score=model.confidence_score,
-                created_at=model.created_at,
-            )
-            for model in models
-        ]
+        return [self._to_entity(model) for model in models]
 
 
 class ImprovementCycleRepository(BaseRepository):
     """Repository for improvement cycle operations."""
 
+    model = ImprovementCycleModel
+
+    _SELECT_RECENT = (
+        select(ImprovementCycleModel)
+        .order_by(ImprovementCycleModel.cycle_number.desc())
+        .limit(bindparam("count"))
+    )
+    # selectinload fetches all proposals in one extra IN query, avoiding both
+    # per-cycle lookups and joinedload's cycles x proposals row explosion
+    _SELECT_RECENT_WITH_PROPOSALS = _SELECT_RECENT.options(
+        selectinload(ImprovementCycleModel.proposals)
+    )
+
     async def create(self, cycle: ImprovementCycle) -> None:
         """Create a new improvement cycle."""
-        model = ImprovementCycleModel(
-            id=str(cycle.id),
-            cycle_number=cycle.cycle_number,
-            start_time=cycle.start_time,
-            end_time=cycle.end_time,
-            agents_used=[str(agent_id) for agent_id in cycle.agents_used],
-            changes_proposed=[str(change_id) for change_id in cycle.changes_proposed],
-            changes_accepted=[str(change_id) for change_id in cycle.changes_accepted],
-            success=str(cycle.success).lower(),
-            error_message=cycle.error_message,
+        await self.create_many([cycle])
+
+    async def create_many(self, cycles: list[ImprovementCycle]) -> None:
+        """Create multiple improvement cycles in a single bulk insert."""
+        await self.bulk_core_insert([self._to_row_dict(cycle) for cycle in cycles])
+
+    @staticmethod
+    def _to_row_dict(cycle: ImprovementCycle) -> dict[str, Any]:
+        """Build the insert parameters for an improvement cycle."""
+        return {
+            "id": str(cycle.id),
+            "cycle_number": cycle.cycle_number,
+            "start_time": cycle.start_time,
+            "end_time": cycle.end_time,
+            "agents_used": cycle.agents_used,
+            "changes_proposed": cycle.changes_proposed,
+            "changes_accepted": cycle.changes_accepted,
+            "success": cycle.success,
+            "error_message": cycle.error_message,
+        }
+
+    @staticmethod
+    def _to_entity(model: ImprovementCycleModel) -> ImprovementCycle:
+        """Build an improvement cycle from its database row."""
+        return ImprovementCycle.model_construct(
+            id=_uuid(model.id),
+            cycle_number=model.cycle_number,
+            start_time=model.start_time,
+            end_time=model.end_time,
+            agents_used=model.agents_used,
+            changes_proposed=model.changes_proposed,
+            changes_accepted=model.changes_accepted,
+            success=model.success,
+            error_message=model.error_message,
         )
-        self.session.add(model)
-        await self.session.commit()
 
     async def get_by_id(self, cycle_id: str) -> ImprovementCycle | None:
         """Get improvement cycle by ID."""
-        result = await self.session.execute(
-            select(ImprovementCycleModel).where(ImprovementCycleModel.id == cycle_id)
-        )
-        model = result.scalar_one_or_none()
+        model = await self.session.get(ImprovementCycleModel, cycle_id)
 
         if model is None:
             return None
 
-        return ImprovementCycle(
-            id=UUID(model.id),
-            cycle_number=model.cycle_number,
-            start_time=model.start_time,
-            end_time=model.end_time,
-            agents_used=[UUID(agent_id) for agent_id in model.agents_used],
-            changes_proposed=[UUID(change_id) for change_id in model.changes_proposed],
-            changes_accepted=[UUID(change_id) for change_id in model.changes_accepted],
-            success=model.success.lower() == "true",
-            error_message=model.error_message,
-        )
+        return self._to_entity(model)
 
     async def update(self, cycle: ImprovementCycle) -> None:
         """Update an improvement cycle."""
-        result = await self.session.execute(
-            select(ImprovementCycleModel).where(
-                ImprovementCycleModel.id == str(cycle.id)
-            )
-        )
-        model = result.scalar_one_or_none()
+        values = self._to_row_dict(cycle)
+        del values["id"]
 
-        if model is None:
+        if not await self.update_by_id(str(cycle.id), values):
             raise ValueError(f"Improvement cycle with id {cycle.id} not found")
 
-        model.cycle_number = cycle.cycle_number
-        model.start_time = cycle.start_time
-        model.end_time = cycle.end_time
-        model.agents_used = [str(agent_id) for agent_id in cycle.agents_used]
-        model.changes_proposed = [
-            str(change_id) for change_id in cycle.changes_proposed
-        ]
-        model.changes_accepted = [
-            str(change_id) for change_id in cycle.changes_accepted
-        ]
-        model.success = str(cycle.success).lower()
-        model.error_message = cycle.error_message
-
-        await self.session.commit()
-
     async def delete(self, cycle_id: str) -> None:
         """Delete an improvement cycle."""
-        result = await self.session.execute(
-            select(ImprovementCycleModel).where(ImprovementCycleModel.id == cycle_id)
-        )
-        model = result.scalar_one_or_none()
-
-        if model is not None:
-            await self.session.delete(model)
-            await self.session.commit()
+        await self.delete_by_id(cycle_id)
 
     async def get_latest(self) -> ImprovementCycle | None:
         """Get the latest improvement cycle."""
-        result = await self.session.execute(
-            select(ImprovementCycleModel)
-            .order_by(ImprovementCycleModel.cycle_number.desc())
-            .limit(1)
-        )
-        model = result.scalar_one_or_none()
+        # LIMIT 1 over ix_cycles_number_desc is a single index seek
+        model = await self.session.scalar(self._SELECT_RECENT, {"count": 1})
 
         if model is None:
             return None
 
-        return ImprovementCycle(
-            id=UUID(model.id),
-            cycle_number=model.cycle_number,
-            start_time=model.start_time,
-            end_time=model.end_time,
-            agents_used=[UUID(agent_id) for agent_id in model.agents_used],
-            changes_proposed=[UUID(change_id) for change_id in model.changes_proposed],
-            changes_accepted=[UUID(change_id) for change_id in model.changes_accepted],
-            success=model.success.lower() == "true",
-            error_message=model.error_message,
-        )
+        return self._to_entity(model)
 
     async def get_recent(self, count: int) -> list[ImprovementCycle]:
         """Get recent improvement cycles."""
+        models = await self.session.scalars(self._SELECT_RECENT, {"count": count})
+
+        return [self._to_entity(model) for model in models]
+
+    async def get_recent_with_proposals(
+        self, count: int
+    ) -> list[tuple[ImprovementCycle, list[ChangeProposal]]]:
+        """Get recent improvement cycles together with their change proposals."""
         result = await self.session.execute(
-            select(ImprovementCycleModel)
-            .order_by(ImprovementCycleModel.cycle_number.desc())
-            .limit(count)
+            self._SELECT_RECENT_WITH_PROPOSALS, {"count": count}
         )
         models = result.scalars().all()
 
         return [
-            ImprovementCycle(
-                id=UUID(model.id),
-                cycle_number=model.cycle_number,
-                start_time=model.start_time,
-                end_time=model.end_time,
-                agents_used=[UUID(agent_id) for agent_id in model.agents_used],
-                changes_proposed=[
-                    UUID(change_id) for change_id in model.changes_proposed
-                ],
-                changes_accepted=[
-                    UUID(change_id) for change_id in model.changes_accepted
+            (
+                self._to_entity(model),
+                [
+                    ChangeProposalRepository._to_entity(proposal)
+                    for proposal in model.proposals
                 ],
-                success=model.success.lower() == "true",
-                error_message=model.error_message,
             )
             for model in models
         ]
@@ -1,11 +1,16 @@
 """Adapter to make LLMProvider compatible with LLMClient protocol."""
 
+import json
 from typing import Any
 
 from ..core.models import ChangeProposal
 from ..core.protocols import LLMClient
 from .provider import LLMProvider
 
+# Upper bounds on what analyze_code puts into a prompt
+MAX_CODE_CHARS = 16384
+MAX_CONTEXT_CHARS = 4096
+
 
 class LLMClientAdapter(LLMClient):
     """Adapter to make LLMProvider compatible with LLMClient protocol."""
@@ -57,8 +62,11 @@ class LLMClientAdapter(LLMClient):
         Returns:
             Analysis results
         """
-        prompt = (
-            f"Analyze this code and provide insights:\n\n{code}\n\nContext: {context}"
-        )
+        code_length = len(code)
+        prompt = f"Analyze this code and provide insights:\n\n{code[:MAX_CODE_CHARS]}"
+        if context:
+            serialized_context = json.dumps(context, default=str)
+            prompt += f"\n\nContext: {serialized_context[:MAX_CONTEXT_CHARS]}"
+
         response = await self.generate_response(prompt, context)
-        return {"analysis": response, "code_length": len(code)}
+        return {"analysis": response, "code_length": code_length}
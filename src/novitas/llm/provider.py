@@ -4,7 +4,9 @@ This module provides a simple interface for LLM providers using LangChain,
 leveraging their existing capabilities rather than reimplementing them.
 """
 
+import hashlib
 import os
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from typing import Any
 from typing import Protocol
@@ -22,6 +24,37 @@ MAX_TEMPERATURE = 2.0
 
 logger = get_logger(__name__)
 
+# Providers built by create_llm_provider, keyed by their configuration with the
+# API key hashed so no plaintext key is kept in the module
+_PROVIDER_CACHE_SIZE = 32
+_provider_cache: OrderedDict[tuple[str, str, float, int | None, int], "LLMProvider"] = (
+    OrderedDict()
+)
+
+# Structured-output wrappers keyed by (id(provider), schema). The wrapper holds its
+# provider, so weak keys would never be freed; a small LRU bounds what stays alive
+# instead. Each entry pins its provider, so an id is never reused while cached.
+_STRUCTURED_CACHE_SIZE = 64
+_structured_cache: OrderedDict[
+    tuple[int, type[BaseModel]], tuple["LLMProvider", Any]
+] = OrderedDict()
+
+
+def _lru_get(cache: OrderedDict[Any, Any], key: Any) -> Any:
+    """Return a cached value and mark it most recently used, or None."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict[Any, Any], key: Any, value: Any, maxsize: int) -> None:
+    """Store a value, evicting the least recently used entries past maxsize."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
 
 class LLMProvider(Protocol):
     """Protocol defining the interface for LLM providers."""
@@ -83,18 +116,32 @@ def create_llm_provider(config: LLMConfig) -> LLMProvider:
     Raises:
         LLMProviderError: If initialization fails
     """
+    cache_key = (
+        config.model,
+        hashlib.sha256(config.api_key.encode()).hexdigest(),
+        config.temperature,
+        config.max_tokens,
+        config.timeout,
+    )
+    cached = _lru_get(_provider_cache, cache_key)
+    if cached is not None:
+        return cached
+
     try:
         logger.info("Creating LLM provider", model=config.model)
 
         # Set API key in environment for LangChain to use
+        env_var = None
         if "gpt" in config.model.lower():
-            os.environ["OPENAI_API_KEY"] = config.api_key
-            logger.info("Set OpenAI API key")
+            env_var = "OPENAI_API_KEY"
         elif "claude" in config.model.lower():
-            os.environ["ANTHROPIC_API_KEY"] = config.api_key
-            logger.info("Set Anthropic API key")
+            env_var = "ANTHROPIC_API_KEY"
         # Add more providers as needed - LangChain will handle them automatically
 
+        if env_var is not None and os.environ.get(env_var) != config.api_key:
+            os.environ[env_var] = config.api_key
+            logger.info("Set API key", env_var=env_var)
+
         # Filter out None values to avoid validation errors
         kwargs = {
             "model": config.model,
@@ -107,6 +154,7 @@ def create_llm_provider(config: LLMConfig) -> LLMProvider:
         logger.info("Initializing chat model with LangChain", kwargs=kwargs)
         provider = init_chat_model(**kwargs)
         logger.info("LLM provider created successfully")
+        _lru_put(_provider_cache, cache_key, provider, _PROVIDER_CACHE_SIZE)
         return provider
 
     except Exception as e:
@@ -166,8 +214,13 @@ async def generate_structured_response(
         LLMProviderError: If generation fails
     """
     try:
-        # Use LangChain's built-in structured output
-        structured_provider = provider.with_structured_output(schema)
+        # Use LangChain's built-in structured output, building the wrapper once
+        cache_key = (id(provider), schema)
+        entry = _lru_get(_structured_cache, cache_key)
+        if entry is None or entry[0] is not provider:
+            entry = (provider, provider.with_structured_output(schema))
+            _lru_put(_structured_cache, cache_key, entry, _STRUCTURED_CACHE_SIZE)
+        structured_provider = entry[1]
 
         # Handle different input types
         if isinstance(prompt, str):
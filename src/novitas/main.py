@@ -10,13 +10,24 @@ from .config.settings import settings
 from .core.exceptions import ImprovementCycleError
 from .core.models import ImprovementCycle
 from .database.connection import get_database_manager
+from .messaging import close_message_brokers
 from .messaging import get_message_broker
 
 logger = get_logger(__name__)
 
 
-async def initialize_system_components():
-    """Initialize system components (database, message broker, LLM)."""
+def _trace(message: str) -> None:
+    """Print a demo trace line when DEMO_TRACE is enabled."""
+    if settings.demo_trace:
+        print(message)
+
+
+async def initialize_system_components(dry_run: bool = False):
+    """Initialize system components (database, message broker, LLM).
+
+    Args:
+        dry_run: Use an in-memory database so nothing is written
+    """
     # Check for available LLM providers
     available_providers = {}
     if settings.anthropic_api_key:
@@ -38,11 +49,11 @@ async def initialize_system_components():
         logger.info("  - OpenAI: https://platform.openai.com/")
         raise ImprovementCycleError("No LLM provider configured")
 
-    logger.info(f"Available LLM providers: {list(available_providers.keys())}")
+    logger.info("Available LLM providers", providers=list(available_providers))
 
     # Initialize database manager
     logger.info("Initializing database manager...")
-    database_manager = get_database_manager()
+    database_manager = get_database_manager(dry_run=dry_run)
     await database_manager.connect()
     logger.info("Database manager initialized successfully")
 
@@ -82,7 +93,7 @@ async def create_orchestrator_agent(
         and performance when making your decisions.""",
     )
 
-    logger.info(f"Created Orchestrator Agent: {orchestrator.name}")
+    logger.info("Created Orchestrator Agent", name=orchestrator.name)
 
     # Initialize the orchestrator
     logger.info("Initializing Orchestrator...")
@@ -97,7 +108,6 @@ async def run_improvement_cycle(
     force: bool = False,  # noqa: ARG001
     dry_run: bool = False,
 ) -> None:
-    print("DEMO: Entered run_improvement_cycle function")
     """Run a complete improvement cycle.
 
     Args:
@@ -105,10 +115,11 @@ async def run_improvement_cycle(
         force: Force execution even if recent cycle exists
         dry_run: Run in dry-run mode (no actual changes)
     """
-    print("DEMO: About to configure logging")
+    _trace("DEMO: Entered run_improvement_cycle function")
+    _trace("DEMO: About to configure logging")
     # Configure logging
     configure_logging()
-    print("DEMO: Logging configured in improvement cycle")
+    _trace("DEMO: Logging configured in improvement cycle")
 
     cycle_id = uuid4()
     cycle = ImprovementCycle(
@@ -116,7 +127,7 @@ async def run_improvement_cycle(
         cycle_number=1,  # TODO: Get from database
     )
 
-    print(
+    _trace(
         f"DEMO: Starting improvement cycle - cycle_id: {cycle_id}, daily: {daily}, dry_run: {dry_run}"
     )
     logger.info(
@@ -124,14 +135,14 @@ async def run_improvement_cycle(
     )
 
     try:
-        print("DEMO: STEP 1: About to initialize system components")
+        _trace("DEMO: STEP 1: About to initialize system components")
         logger.info("STEP 1: About to initialize system components")
         # Initialize system components
         (
             database_manager,
             message_broker,
             available_providers,
-        ) = await initialize_system_components()
+        ) = await initialize_system_components(dry_run=dry_run)
         logger.info("STEP 1 COMPLETE: System components initialized")
 
         logger.info("STEP 2: About to create orchestrator agent")
@@ -157,7 +168,7 @@ async def run_improvement_cycle(
                 "best_practices",
             ],
         )
-        logger.info(f"Created Code Agent: {code_agent_id}")
+        logger.info("Created Code Agent", agent_id=code_agent_id)
 
         logger.info("Creating Documentation Specialist...")
         doc_agent_id = await orchestrator.create_specialized_agent(
@@ -166,17 +177,22 @@ async def run_improvement_cycle(
             description="Improves documentation and README files",
             capabilities=["documentation", "readme", "api_docs", "examples"],
         )
-        logger.info(f"Created Documentation Agent: {doc_agent_id}")
+        logger.info("Created Documentation Agent", agent_id=doc_agent_id)
         logger.info("STEP 3 COMPLETE: Specialized agents created")
 
         logger.info("STEP 4: About to show managed agents")
         # Show managed agents
-        logger.info(f"Managed Agents: {len(orchestrator.managed_agents)}")
-        for _agent_id, agent_data in orchestrator.managed_agents.items():
-            logger.info(f"  - {agent_data['name']} ({agent_data['type']})")
-            logger.info(f"    Created: {agent_data['created_at']}")
-            logger.info(f"    Capabilities: {', '.join(agent_data['capabilities'])}")
-            logger.info(f"    Performance: {agent_data['performance']:.2f}")
+        logger.info("Managed Agents", count=len(orchestrator.managed_agents))
+        for agent_id, agent_data in orchestrator.managed_agents.items():
+            logger.info(
+                "Managed agent",
+                agent_id=agent_id,
+                name=agent_data["name"],
+                type=agent_data["type"],
+                created_at=agent_data["created_at"],
+                capabilities=agent_data["capabilities"],
+                performance=agent_data["performance"],
+            )
         logger.info("STEP 4 COMPLETE: Managed agents displayed")
 
         logger.info("STEP 5: About to run improvement cycle")
@@ -197,8 +213,20 @@ async def run_improvement_cycle(
         proposals = await orchestrator.execute(context)
         logger.info("STEP 5.1 COMPLETE: Orchestrator executed")
 
+        # Persist the cycle and its proposals together in a single commit
+        cycle.agents_used = list(orchestrator.managed_agents)
+        cycle.changes_proposed = [proposal.id for proposal in proposals]
+        async with database_manager.transaction():
+            await database_manager.save_improvement_cycle(cycle)
+            await database_manager.save_change_proposals(
+                [
+                    proposal.model_copy(update={"cycle_id": cycle_id})
+                    for proposal in proposals
+                ]
+            )
+
         print(f"\n🎉 DEMO SUCCESS! Generated {len(proposals)} improvement proposals:")
-        logger.info(f"Generated {len(proposals)} improvement proposals:")
+        logger.info("Generated improvement proposals", count=len(proposals))
         for i, proposal in enumerate(proposals, 1):
             print(f"\n📋 PROPOSAL {i}:")
             print(f"   Title: {proposal.description}")
@@ -212,28 +240,28 @@ async def run_improvement_cycle(
             else:
                 print(f"   Changes: {proposal.proposed_changes}")
 
-            logger.info(f"  {i}. {proposal.description}")
-            logger.info(f"     File: {proposal.file_path}")
-            logger.info(f"     Type: {proposal.improvement_type}")
-            logger.info(f"     Confidence: {proposal.confidence_score:.2f}")
-            logger.info(f"     Reasoning: {proposal.reasoning[:150]}...")
+            logger.info(
+                "Improvement proposal",
+                index=i,
+                description=proposal.description,
+                file_path=proposal.file_path,
+                improvement_type=proposal.improvement_type,
+                confidence=proposal.confidence_score,
+                reasoning_head=proposal.reasoning[:150],
+            )
 
         # Monitor agent performance
         logger.info("Monitoring agent performance...")
         performance_report = await orchestrator.monitor_agent_performance()
-        logger.info(f"Total agents: {performance_report['total_agents']}")
         logger.info(
-            f"Performance data: {len(performance_report['agent_performance'])} agents tracked"
+            "Agent performance",
+            total_agents=performance_report["total_agents"],
+            agents_tracked=len(performance_report["agent_performance"]),
         )
 
         # Show performance metrics
-        logger.info("Orchestrator Performance Metrics:")
         metrics = orchestrator.get_performance_metrics()
-        for key, value in metrics.items():
-            if isinstance(value, float):
-                logger.info(f"  {key}: {value:.2f}")
-            else:
-                logger.info(f"  {key}: {value}")
+        logger.info("Orchestrator Performance Metrics", **metrics)
 
         # Cleanup
         await orchestrator.cleanup()
@@ -251,13 +279,13 @@ async def run_improvement_cycle(
 
 async def main() -> None:
     """Main entry point for the application."""
-    print("DEMO: Starting Novitas AI system")
+    _trace("DEMO: Starting Novitas AI system")
     configure_logging()
-    print("DEMO: Logging configured")
+    _trace("DEMO: Logging configured")
     logger.info("Starting Novitas AI system")
 
     try:
-        print("DEMO: About to run improvement cycle")
+        _trace("DEMO: About to run improvement cycle")
         # Run improvement cycle (with dry-run mode if specified)
         await run_improvement_cycle(dry_run=settings.dry_run)
 
@@ -265,6 +293,9 @@ async def main() -> None:
         logger.error("Application failed", error=str(e))
         raise
 
+    finally:
+        await close_message_brokers()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
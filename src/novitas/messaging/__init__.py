@@ -1,9 +1,11 @@
 """Messaging system for Novitas."""
 
 from .broker import RedisMessageBroker
+from .broker import close_message_brokers
 from .broker import get_message_broker
 
 __all__ = [
     "RedisMessageBroker",
+    "close_message_brokers",
     "get_message_broker",
 ]
@@ -1,8 +1,11 @@
 """Redis-based message broker implementation for Novitas."""
 
 import asyncio
+import functools
+import weakref
 from collections.abc import Callable
 from collections.abc import Coroutine
+from collections.abc import Sequence
 from contextlib import suppress
 from datetime import UTC
 from datetime import datetime
@@ -10,7 +13,9 @@ from typing import Any
 from uuid import UUID
 from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
+from pydantic import TypeAdapter
 
 from ..config.logging import get_logger
 from ..config.settings import settings
@@ -21,6 +26,67 @@ from ..core.protocols import MessageBroker
 
 logger = get_logger(__name__)
 
+# Built once so each received message goes straight to the compiled validator
+_MESSAGE_ADAPTER = TypeAdapter(AgentMessage)
+
+
+@functools.lru_cache(maxsize=8192)
+def _channel_key(agent_id: UUID) -> bytes:
+    """Pub/sub channel name for an agent."""
+    return f"agent:{agent_id}".encode()
+
+
+@functools.lru_cache(maxsize=8192)
+def _queue_key(agent_id: UUID) -> bytes:
+    """Redis list holding an agent's persisted messages."""
+    return f"agent_queue:{agent_id}".encode()
+
+
+def _encode_message(
+    message: dict[str, Any],
+    recipient_id: UUID | None,
+    default_type: str,
+) -> tuple[UUID, MessageType, bytes]:
+    """Serialize an outgoing message in the AgentMessage wire format.
+
+    The payload is built from plain fields and dumped with orjson instead of
+    constructing an AgentMessage; messages are validated when received.
+
+    Args:
+        message: Message content
+        recipient_id: ID of the recipient agent, or None for a broadcast
+        default_type: Message type used when the message does not set one
+
+    Returns:
+        Message ID, message type and the serialized message
+
+    Raises:
+        MessageBrokerError: If the message type is unknown or the message
+            cannot be serialized
+    """
+    message_id = uuid4()
+    try:
+        message_type = MessageType(message.get("type", default_type))
+    except ValueError as e:
+        raise MessageBrokerError(f"Invalid message type: {e}") from e
+
+    payload = {
+        "id": message_id,
+        "sender_id": message.get("sender_id"),
+        "recipient_id": recipient_id,
+        "message_type": message_type,
+        "content": message.get("content", ""),
+        "metadata": message.get("metadata", {}),
+        "timestamp": message.get("timestamp") or datetime.now(UTC),
+        "is_broadcast": recipient_id is None,
+    }
+    try:
+        message_data = orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+    except TypeError as e:
+        raise MessageBrokerError(f"Message is not serializable: {e}") from e
+
+    return message_id, message_type, message_data
+
 
 class RedisMessageBroker(MessageBroker):
     """Redis-based message broker implementation."""
@@ -33,15 +99,35 @@ class RedisMessageBroker(MessageBroker):
         """
         self.redis_url = redis_url or settings.redis_url
         self._redis: redis.Redis | None = None
+        # Callbacks are kept as tuples so dispatch iterates an immutable snapshot
         self._subscribers: dict[
-            UUID, list[Callable[[AgentMessage], Coroutine[Any, Any, None]]]
+            UUID, tuple[Callable[[AgentMessage], Coroutine[Any, Any, None]], ...]
         ] = {}
+        # Flattened (agent_id, callback) pairs for broadcasts, rebuilt on (un)subscribe
+        self._broadcast_targets: tuple[
+            tuple[UUID, Callable[[AgentMessage], Coroutine[Any, Any, None]]], ...
+        ] = ()
         self._pubsub: redis.client.PubSub | None = None
         self._listening_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
+        self._pending_subscribes: set[bytes] = set()
+        self._pending_unsubscribes: set[bytes] = set()
+        self._subscriptions_changed = asyncio.Event()
+        self._channels_subscribed = asyncio.Event()
+        self._subscription_task: asyncio.Task | None = None
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Connect to Redis."""
+        # The broker is shared per URL, so concurrent callers must not double-connect
+        async with self._connect_lock:
+            if self._redis:
+                return
+
+            await self._connect()
+
+    async def _connect(self) -> None:
+        """Open the Redis connection and start the background tasks."""
         try:
             self._redis = redis.from_url(self.redis_url, decode_responses=True)
             await self._redis.ping()
@@ -49,12 +135,26 @@ class RedisMessageBroker(MessageBroker):
             # Initialize pub/sub
             self._pubsub = self._redis.pubsub()
 
+            # Fresh events for this connection; (re)subscribe every known agent
+            self._shutdown_event = asyncio.Event()
+            self._subscriptions_changed = asyncio.Event()
+            self._channels_subscribed = asyncio.Event()
+            self._pending_subscribes.update(
+                _channel_key(agent_id) for agent_id in self._subscribers
+            )
+            if self._pending_subscribes or self._pending_unsubscribes:
+                self._subscriptions_changed.set()
+
             # Start listening for messages
             self._listening_task = asyncio.create_task(self._listen_for_messages())
 
+            # Flush channel subscriptions in batches
+            self._subscription_task = asyncio.create_task(self._sync_subscriptions())
+
             logger.info("Redis message broker connected successfully")
 
         except Exception as e:
+            self._redis = None
             logger.error("Failed to connect to Redis", error=str(e))
             raise MessageBrokerError(f"Failed to connect to Redis: {e}") from e
 
@@ -63,10 +163,11 @@ class RedisMessageBroker(MessageBroker):
         try:
             self._shutdown_event.set()
 
-            if self._listening_task:
-                self._listening_task.cancel()
-                with suppress(asyncio.CancelledError):
-                    await self._listening_task
+            for task in (self._subscription_task, self._listening_task):
+                if task:
+                    task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await task
 
             if self._pubsub:
                 await self._pubsub.close()
@@ -74,6 +175,11 @@ class RedisMessageBroker(MessageBroker):
             if self._redis:
                 await self._redis.close()
 
+            self._redis = None
+            self._pubsub = None
+            self._listening_task = None
+            self._subscription_task = None
+
             logger.info("Redis message broker disconnected successfully")
 
         except Exception as e:
@@ -90,36 +196,29 @@ class RedisMessageBroker(MessageBroker):
         if not self._redis:
             raise MessageBrokerError("Message broker not connected")
 
-        try:
-            # Create message record
-            message_record = AgentMessage(
-                id=uuid4(),
-                sender_id=message.get("sender_id"),
-                recipient_id=to_agent,
-                message_type=MessageType(message.get("type", "general")),
-                content=message.get("content", {}),
-                timestamp=message.get("timestamp") or datetime.now(UTC),
-            )
-
-            # Serialize message
-            message_data = message_record.model_dump_json()
-
-            # Send to Redis pub/sub
-            channel = f"agent:{to_agent}"
-            await self._redis.publish(channel, message_data)
+        # Encoding is pure, so only the Redis round-trip sits in the try block
+        message_id, message_type, message_data = _encode_message(
+            message, to_agent, "general"
+        )
+        channel = _channel_key(to_agent)
+        queue_key = _queue_key(to_agent)
 
-            # Also store in agent's message queue for persistence
-            queue_key = f"agent_queue:{to_agent}"
-            await self._redis.lpush(queue_key, message_data)
-
-            # Keep only last 100 messages per agent
-            await self._redis.ltrim(queue_key, 0, 99)
+        try:
+            # Publish, persist and trim in a single round-trip
+            async with self._redis.pipeline(transaction=False) as pipe:
+                # Send to Redis pub/sub
+                pipe.publish(channel, message_data)
+                # Also store in agent's message queue for persistence
+                pipe.lpush(queue_key, message_data)
+                # Keep only last 100 messages per agent
+                pipe.ltrim(queue_key, 0, 99)
+                await pipe.execute()
 
             logger.info(
                 "Message sent",
-                message_id=message_record.id,
+                message_id=message_id,
                 to_agent=to_agent,
-                message_type=message_record.message_type.value,
+                message_type=message_type.value,
             )
 
         except Exception as e:
@@ -137,19 +236,21 @@ class RedisMessageBroker(MessageBroker):
             agent_id: ID of the agent
 
         Returns:
-            Message content or None if no message available
+            Message fields decoded from JSON (IDs and timestamp as strings)
+            or None if no message available
         """
         if not self._redis:
             raise MessageBrokerError("Message broker not connected")
 
         try:
             # Get message from agent's queue
-            queue_key = f"agent_queue:{agent_id}"
+            queue_key = _queue_key(agent_id)
             message_data = await self._redis.rpop(queue_key)
 
             if message_data:
-                message = AgentMessage.model_validate_json(message_data)
-                return message.model_dump()
+                # Queued messages were written by send_message, so skip model
+                # validation and hand back the decoded JSON fields
+                return orjson.loads(message_data)
 
             return None
 
@@ -161,36 +262,68 @@ class RedisMessageBroker(MessageBroker):
             )
             raise MessageBrokerError(f"Failed to receive message: {e}") from e
 
-    async def broadcast_message(self, message: dict[str, Any]) -> None:
-        """Broadcast a message to all agents.
+    async def receive_messages(
+        self, agent_id: UUID, max_messages: int = 32
+    ) -> list[dict[str, Any]]:
+        """Receive up to max_messages queued messages for an agent at once.
 
         Args:
-            message: Message content
+            agent_id: ID of the agent
+            max_messages: Maximum number of messages to drain
+
+        Returns:
+            Decoded messages, oldest first (same order as repeated receive_message)
+
+        Raises:
+            ValueError: If max_messages is less than 1
         """
+        # LRANGE -0 would return the whole queue while LTRIM 0 -1 removes nothing
+        if max_messages < 1:
+            raise ValueError(f"max_messages must be at least 1, got {max_messages}")
+
         if not self._redis:
             raise MessageBrokerError("Message broker not connected")
 
         try:
-            # Create message record
-            message_record = AgentMessage(
-                id=uuid4(),
-                sender_id=message.get("sender_id"),
-                recipient_id=None,  # Broadcast
-                message_type=MessageType(message.get("type", "broadcast")),
-                content=message.get("content", {}),
-                timestamp=message.get("timestamp") or datetime.now(UTC),
+            # Messages are pushed to the head, so the oldest sit at the tail.
+            # Read and drop them atomically in one round-trip.
+            queue_key = _queue_key(agent_id)
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.lrange(queue_key, -max_messages, -1)
+                pipe.ltrim(queue_key, 0, -max_messages - 1)
+                message_data, _ = await pipe.execute()
+
+            return [orjson.loads(data) for data in reversed(message_data)]
+
+        except Exception as e:
+            logger.error(
+                "Failed to receive messages",
+                agent_id=agent_id,
+                error=str(e),
             )
+            raise MessageBrokerError(f"Failed to receive messages: {e}") from e
 
-            # Serialize message
-            message_data = message_record.model_dump_json()
+    async def broadcast_message(self, message: dict[str, Any]) -> None:
+        """Broadcast a message to all agents.
 
+        Args:
+            message: Message content
+        """
+        if not self._redis:
+            raise MessageBrokerError("Message broker not connected")
+
+        message_id, message_type, message_data = _encode_message(
+            message, None, "broadcast"
+        )
+
+        try:
             # Broadcast to all agents
             await self._redis.publish("broadcast", message_data)
 
             logger.info(
                 "Broadcast message sent",
-                message_id=message_record.id,
-                message_type=message_record.message_type.value,
+                message_id=message_id,
+                message_type=message_type.value,
             )
 
         except Exception as e:
@@ -212,16 +345,16 @@ class RedisMessageBroker(MessageBroker):
             callback: Callback function to handle messages
         """
         if agent_id not in self._subscribers:
-            self._subscribers[agent_id] = []
+            self._subscribers[agent_id] = ()
 
-        self._subscribers[agent_id].append(callback)
+            # Queue a subscription to the agent's channel
+            channel = _channel_key(agent_id)
+            self._pending_unsubscribes.discard(channel)
+            self._pending_subscribes.add(channel)
+            self._subscriptions_changed.set()
 
-        # Subscribe to agent's channel
-        if self._pubsub:
-            # Store task reference to avoid RUF006 warning
-            task = asyncio.create_task(self._pubsub.subscribe(f"agent:{agent_id}"))
-            # We don't need to await this task, so we ignore it
-            _ = task
+        self._subscribers[agent_id] += (callback,)
+        self._rebuild_broadcast_targets()
 
         logger.info(f"Agent {agent_id} subscribed to messages")
 
@@ -237,74 +370,152 @@ class RedisMessageBroker(MessageBroker):
             callback: Callback function to remove
         """
         if agent_id in self._subscribers:
-            if callback in self._subscribers[agent_id]:
-                self._subscribers[agent_id].remove(callback)
+            callbacks = self._subscribers[agent_id]
+            if callback in callbacks:
+                index = callbacks.index(callback)
+                self._subscribers[agent_id] = callbacks[:index] + callbacks[index + 1 :]
 
             if not self._subscribers[agent_id]:
                 del self._subscribers[agent_id]
 
-                # Unsubscribe from agent's channel
-                if self._pubsub:
-                    # Store task reference to avoid RUF006 warning
-                    task = asyncio.create_task(
-                        self._pubsub.unsubscribe(f"agent:{agent_id}")
-                    )
-                    # We don't need to await this task, so we ignore it
-                    _ = task
+                # Queue an unsubscription from the agent's channel
+                channel = _channel_key(agent_id)
+                self._pending_subscribes.discard(channel)
+                self._pending_unsubscribes.add(channel)
+                self._subscriptions_changed.set()
+
+            self._rebuild_broadcast_targets()
 
         logger.info(f"Agent {agent_id} unsubscribed from messages")
 
+    def _rebuild_broadcast_targets(self) -> None:
+        """Recompute the flat list of callbacks that receive broadcasts."""
+        self._broadcast_targets = tuple(
+            (agent_id, callback)
+            for agent_id, callbacks in self._subscribers.items()
+            for callback in callbacks
+        )
+
+    async def _sync_subscriptions(self) -> None:
+        """Apply queued channel (un)subscriptions, one command per batch."""
+        if not self._pubsub:
+            return
+
+        try:
+            while not self._shutdown_event.is_set():
+                await self._subscriptions_changed.wait()
+                self._subscriptions_changed.clear()
+
+                subscribes = self._pending_subscribes
+                unsubscribes = self._pending_unsubscribes
+                self._pending_subscribes = set()
+                self._pending_unsubscribes = set()
+
+                try:
+                    if subscribes:
+                        await self._pubsub.subscribe(*subscribes)
+                        # Wake the listener if it is idling without channels
+                        self._channels_subscribed.set()
+                    if unsubscribes:
+                        await self._pubsub.unsubscribe(*unsubscribes)
+                except Exception as e:
+                    logger.error(
+                        "Failed to update subscriptions",
+                        subscribe=sorted(subscribes),
+                        unsubscribe=sorted(unsubscribes),
+                        error=str(e),
+                    )
+
+        except asyncio.CancelledError:
+            logger.info("Subscription task cancelled")
+
     async def _listen_for_messages(self) -> None:
         """Listen for incoming messages and route to subscribers."""
         if not self._pubsub:
             return
 
         try:
-            async for message in self._pubsub.listen():
-                if message["type"] == "message":
-                    try:
-                        # Parse message
-                        message_data = message["data"]
-                        agent_message = AgentMessage.model_validate_json(message_data)
-
-                        # Route to subscribers
-                        if agent_message.to_agent_id in self._subscribers:
-                            for callback in self._subscribers[
-                                agent_message.to_agent_id
-                            ]:
-                                try:
-                                    await callback(agent_message)
-                                except Exception as e:
-                                    logger.error(
-                                        "Error in message callback",
-                                        agent_id=agent_message.to_agent_id,
-                                        error=str(e),
-                                    )
-
-                        # Handle broadcast messages
-                        if agent_message.to_agent_id is None:
-                            for agent_id, callbacks in self._subscribers.items():
-                                for callback in callbacks:
-                                    try:
-                                        await callback(agent_message)
-                                    except Exception as e:
-                                        logger.error(
-                                            "Error in broadcast callback",
-                                            agent_id=agent_id,
-                                            error=str(e),
-                                        )
-
-                    except Exception as e:
-                        logger.error(
-                            "Error processing message",
-                            error=str(e),
+            while not self._shutdown_event.is_set():
+                # The pub/sub connection only exists once a channel is subscribed
+                if not self._pubsub.subscribed:
+                    self._channels_subscribed.clear()
+                    with suppress(TimeoutError):
+                        await asyncio.wait_for(
+                            self._channels_subscribed.wait(), timeout=1.0
                         )
+                    continue
+
+                # Control messages (subscribe/unsubscribe acks) are skipped here
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is None:
+                    continue
+
+                try:
+                    await self._route_message(message["data"])
+                except Exception as e:
+                    logger.error(
+                        "Error processing message",
+                        error=str(e),
+                    )
 
         except asyncio.CancelledError:
             logger.info("Message listening task cancelled")
         except Exception as e:
             logger.error("Error in message listening task", error=str(e))
 
+    async def _route_message(self, message_data: str | bytes) -> None:
+        """Parse a pub/sub payload and deliver it to the matching subscribers.
+
+        Args:
+            message_data: Serialized AgentMessage
+        """
+        agent_message = _MESSAGE_ADAPTER.validate_json(message_data)
+        recipient_id = agent_message.recipient_id
+
+        # Route to subscribers
+        if recipient_id in self._subscribers:
+            await self._dispatch(
+                [
+                    (recipient_id, callback)
+                    for callback in self._subscribers[recipient_id]
+                ],
+                agent_message,
+                "Error in message callback",
+            )
+
+        # Handle broadcast messages
+        if recipient_id is None:
+            await self._dispatch(
+                self._broadcast_targets,
+                agent_message,
+                "Error in broadcast callback",
+            )
+
+    async def _dispatch(
+        self,
+        targets: Sequence[
+            tuple[UUID, Callable[[AgentMessage], Coroutine[Any, Any, None]]]
+        ],
+        agent_message: AgentMessage,
+        error_message: str,
+    ) -> None:
+        """Run subscriber callbacks concurrently and log the ones that fail.
+
+        Args:
+            targets: Pairs of subscribed agent ID and callback
+            agent_message: Message passed to every callback
+            error_message: Log message used for failed callbacks
+        """
+        results = await asyncio.gather(
+            *(callback(agent_message) for _, callback in targets),
+            return_exceptions=True,
+        )
+        for (agent_id, _), result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(error_message, agent_id=agent_id, error=str(result))
+
     async def get_message_count(self, agent_id: UUID) -> int:
         """Get the number of messages in an agent's queue.
 
@@ -318,7 +529,7 @@ class RedisMessageBroker(MessageBroker):
             return 0
 
         try:
-            queue_key = f"agent_queue:{agent_id}"
+            queue_key = _queue_key(agent_id)
             return await self._redis.llen(queue_key)
         except Exception as e:
             logger.error(
@@ -338,7 +549,7 @@ class RedisMessageBroker(MessageBroker):
             return
 
         try:
-            queue_key = f"agent_queue:{agent_id}"
+            queue_key = _queue_key(agent_id)
             await self._redis.delete(queue_key)
             logger.info(f"Cleared messages for agent {agent_id}")
         except Exception as e:
@@ -349,8 +560,30 @@ class RedisMessageBroker(MessageBroker):
             )
 
 
+# Shared brokers per event loop and Redis URL. A broker's Redis connection, lock
+# and events belong to the loop that first used them, so each loop gets its own.
+_brokers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, RedisMessageBroker]
+] = weakref.WeakKeyDictionary()
+# Brokers requested outside a running loop, keyed by Redis URL
+_unbound_brokers: dict[str, RedisMessageBroker] = {}
+
+
+def _loop_brokers() -> dict[str, RedisMessageBroker]:
+    """Return the broker registry for the running event loop, if any."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _unbound_brokers
+
+    return _brokers.setdefault(loop, {})
+
+
 def get_message_broker(redis_url: str | None = None) -> MessageBroker:
-    """Get a message broker instance.
+    """Get the message broker for a Redis URL.
+
+    Brokers are shared per URL within an event loop, so repeated calls reuse
+    one connection and one listener task.
 
     Args:
         redis_url: Redis connection URL (defaults to settings)
@@ -358,4 +591,18 @@ def get_message_broker(redis_url: str | None = None) -> MessageBroker:
     Returns:
         Message broker instance
     """
-    return RedisMessageBroker(redis_url)
+    url = redis_url or settings.redis_url
+    brokers = _loop_brokers()
+    if url not in brokers:
+        brokers[url] = RedisMessageBroker(url)
+    return brokers[url]
+
+
+async def close_message_brokers() -> None:
+    """Disconnect and forget the brokers shared on the running event loop."""
+    brokers = _brokers.pop(asyncio.get_running_loop(), {})
+    brokers.update(_unbound_brokers)
+    _unbound_brokers.clear()
+
+    for broker in brokers.values():
+        await broker.disconnect()
@@ -1,12 +1,15 @@
 """Pytest configuration and fixtures for Novitas tests."""
 
+import random
+from uuid import UUID
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
 
 from novitas.core.models import AgentState
 from novitas.core.models import AgentStatus
@@ -18,6 +21,18 @@ from novitas.database.connection import DatabaseManagerImpl
 from novitas.database.models import Base
 
 
+@pytest.fixture(scope="session")
+def _uuid_rng() -> random.Random:
+    """Create the seeded generator behind next_uuid."""
+    return random.Random(0)
+
+
+@pytest.fixture
+def next_uuid(_uuid_rng: random.Random):
+    """Return a factory for version 4 UUIDs that does not read os.urandom."""
+    return lambda: UUID(int=_uuid_rng.getrandbits(128), version=4)
+
+
 @pytest.fixture
 def sample_agent_state() -> AgentState:
     """Create a sample agent state for testing."""
@@ -37,6 +52,7 @@ def sample_change_proposal(sample_agent_state: AgentState) -> ChangeProposal:
     return ChangeProposal(
         id=uuid4(),
         agent_id=sample_agent_state.id,
+        cycle_id=uuid4(),
         improvement_type=ImprovementType.CODE_IMPROVEMENT,
         file_path="src/test.py",
         description="Improve code quality",
@@ -58,30 +74,35 @@ def sample_improvement_cycle() -> ImprovementCycle:
     )
 
 
-@pytest_asyncio.fixture
-async def async_session() -> AsyncSession:
-    """Create an async database session for testing."""
-    # Create in-memory SQLite database for testing
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _engine() -> AsyncEngine:
+    """Create the in-memory SQLite engine and schema once per test session."""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
     )
 
-    # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Create session factory
-    async_session_maker = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_session(_engine: AsyncEngine) -> AsyncSession:
+    """Create an async database session for testing."""
+    async_session_maker = async_sessionmaker(_engine, expire_on_commit=False)
 
     # Create and yield session
     async with async_session_maker() as session:
         yield session
 
-    # Cleanup
-    await engine.dispose()
+    # Empty every table so the next test starts clean (SQLite has no TRUNCATE)
+    async with _engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
 
 @pytest_asyncio.fixture
@@ -107,9 +128,8 @@ async def clean_database() -> DatabaseManagerImpl:
                     await conn.run_sync(Base.metadata.create_all)
 
                 # Create session maker
-                self._session_maker = sessionmaker(
+                self._session_maker = async_sessionmaker(
                     bind=self._engine,
-                    class_=AsyncSession,
                     expire_on_commit=False,
                 )
 
@@ -1,7 +1,8 @@
 """Tests for Agent Factory."""
 
+from types import SimpleNamespace
+from typing import NamedTuple
 from unittest.mock import Mock
-from unittest.mock import patch
 from uuid import UUID
 
 import pytest
@@ -10,8 +11,84 @@ from novitas.agents.agent_factory import AgentFactory
 from novitas.agents.agent_factory import DefaultAgentFactory
 from novitas.agents.orchestrator import OrchestratorAgent
 from novitas.core.exceptions import AgentError
-from novitas.core.protocols import DatabaseManager
-from novitas.core.protocols import MessageBroker
+
+# Canned LLM results shared by every test that patches the LLM calls
+_PROVIDER = object()
+_PROMPT_RESPONSE = SimpleNamespace(prompt="Test prompt for orchestrator agent")
+
+
+class StubDatabaseManager:
+    """Database manager stand-in; the factory only stores and passes it on."""
+
+    async def load_agent_state(self, agent_id):
+        return None
+
+    async def save_agent_state(self, agent_state):
+        return None
+
+
+class StubMessageBroker:
+    """Message broker stand-in; the factory only stores and passes it on."""
+
+    async def send_message(self, to_agent, message):
+        return None
+
+    async def receive_message(self, agent_id):
+        return None
+
+
+class FastOrchestratorAgent(OrchestratorAgent):
+    """Orchestrator that skips memory manager setup and teardown."""
+
+    async def initialize(self) -> None:
+        self._initialized = True
+
+    async def cleanup(self) -> None:
+        return None
+
+
+@pytest.fixture(scope="module")
+def stub_deps():
+    """Create the factory dependencies once for the whole module."""
+    return (
+        StubDatabaseManager(),
+        StubMessageBroker(),
+        {"anthropic": {"api_key": "test", "temperature": 0.5}},
+    )
+
+
+@pytest.fixture
+def factory(stub_deps):
+    """Create a fresh agent factory on the shared dependency mocks."""
+    database_manager, message_broker, available_providers = stub_deps
+    factory = DefaultAgentFactory(
+        database_manager=database_manager,
+        message_broker=message_broker,
+        available_llm_providers=available_providers,
+    )
+    factory.agent_class = FastOrchestratorAgent
+    return factory
+
+
+class PatchedLLM(NamedTuple):
+    """Mocks standing in for the LLM calls made while creating agents."""
+
+    create_llm_provider: Mock
+    generate_structured_response: Mock
+
+
+@pytest.fixture
+def patched_llm(mocker):
+    """Patch LLM provider creation and prompt generation."""
+    return PatchedLLM(
+        create_llm_provider=mocker.patch(
+            "novitas.agents.agent_factory.create_llm_provider", return_value=_PROVIDER
+        ),
+        generate_structured_response=mocker.patch(
+            "novitas.agents.agent_factory.generate_structured_response",
+            return_value=_PROMPT_RESPONSE,
+        ),
+    )
 
 
 class TestAgentFactory:
@@ -24,83 +101,24 @@ class TestAgentFactory:
         assert hasattr(AgentFactory, "retire_agent")
         assert hasattr(AgentFactory, "get_active_agents")
 
-    def test_default_agent_factory_creation(self):
+    def test_default_agent_factory_creation(self, stub_deps, factory):
         """Test DefaultAgentFactory can be instantiated."""
-        mock_db = Mock(spec=DatabaseManager)
-        mock_broker = Mock(spec=MessageBroker)
-        available_providers = {"anthropic": {"api_key": "test"}}
-
-        factory = DefaultAgentFactory(
-            database_manager=mock_db,
-            message_broker=mock_broker,
-            available_llm_providers=available_providers,
-        )
+        database_manager, message_broker, available_providers = stub_deps
 
         assert isinstance(factory, DefaultAgentFactory)
-        assert factory.database_manager == mock_db
-        assert factory.message_broker == mock_broker
+        assert factory.database_manager == database_manager
+        assert factory.message_broker == message_broker
         assert factory.available_llm_providers == available_providers
 
     @pytest.mark.asyncio
-    async def test_create_orchestrator_agent(self):
-        """Test creating an orchestrator agent."""
-        mock_db = Mock(spec=DatabaseManager)
-        mock_broker = Mock(spec=MessageBroker)
-        available_providers = {
-            "anthropic": {
-                "api_key": "test_key",
-                "temperature": 0.5,
-            }
-        }
-
-        # Mock the LLM provider creation and structured response
-        with (
-            patch(
-                "novitas.agents.agent_factory.create_llm_provider"
-            ) as mock_create_provider,
-            patch(
-                "novitas.agents.agent_factory.generate_structured_response"
-            ) as mock_generate_response,
-        ):
-            # Mock the LLM provider
-            mock_provider = Mock()
-            mock_create_provider.return_value = mock_provider
-
-            # Mock the structured response
-            mock_response = Mock()
-            mock_response.prompt = "Test prompt for orchestrator agent"
-            mock_generate_response.return_value = mock_response
-
-            # Mock agent initialization
-            with patch.object(OrchestratorAgent, "initialize") as mock_init:
-                mock_init.return_value = None
-
-                factory = DefaultAgentFactory(
-                    database_manager=mock_db,
-                    message_broker=mock_broker,
-                    available_llm_providers=available_providers,
-                )
-
-                agent = await factory.create_agent(
-                    name="Test Orchestrator Agent",
-                    description="A test orchestrator agent",
-                    capabilities=["coordination", "task_assignment"],
-                )
-
-                assert agent.name == "Test Orchestrator Agent"
-                assert agent.description == "A test orchestrator agent"
-                assert agent.id is not None
-
-    @pytest.mark.asyncio
-    async def test_create_agent_no_providers(self):
+    async def test_create_agent_no_providers(self, stub_deps):
         """Test creating an agent with no LLM providers raises error."""
-        mock_db = Mock(spec=DatabaseManager)
-        mock_broker = Mock(spec=MessageBroker)
+        database_manager, message_broker, _ = stub_deps
         available_providers = {}
 
         factory = DefaultAgentFactory(
-            database_manager=mock_db,
-            message_broker=mock_broker,
+            database_manager=database_manager,
+            message_broker=message_broker,
             available_llm_providers=available_providers,
         )
 
@@ -112,126 +130,67 @@ class TestAgentFactory:
             )
 
     @pytest.mark.asyncio
-    async def test_retire_agent(self):
-        """Test retiring an agent."""
-        mock_db = Mock(spec=DatabaseManager)
-        mock_broker = Mock(spec=MessageBroker)
-        available_providers = {"anthropic": {"api_key": "test"}}
-
-        # Mock the LLM provider creation and structured response
-        with (
-            patch(
-                "novitas.agents.agent_factory.create_llm_provider"
-            ) as mock_create_provider,
-            patch(
-                "novitas.agents.agent_factory.generate_structured_response"
-            ) as mock_generate_response,
-            patch.object(OrchestratorAgent, "initialize") as mock_init,
-            patch.object(OrchestratorAgent, "cleanup") as mock_cleanup,
-        ):
-            # Mock the LLM provider
-            mock_provider = Mock()
-            mock_create_provider.return_value = mock_provider
-
-            # Mock the structured response
-            mock_response = Mock()
-            mock_response.prompt = "Test prompt for code agent"
-            mock_generate_response.return_value = mock_response
-
-            # Mock agent initialization and cleanup
-            mock_init.return_value = None
-            mock_cleanup.return_value = None
-
-            factory = DefaultAgentFactory(
-                database_manager=mock_db,
-                message_broker=mock_broker,
-                available_llm_providers=available_providers,
-            )
+    @pytest.mark.parametrize(
+        "scenario",
+        ["create", "retire", "list", "retire_missing"],
+    )
+    async def test_agent_lifecycle(self, factory, patched_llm, scenario):
+        """Test creating, retiring and listing agents."""
+        await LIFECYCLE_SCENARIOS[scenario](factory)
 
-            # Create an agent first
-            agent = await factory.create_agent(
-                name="Test Agent",
-                description="A test agent",
-                capabilities=["test"],
-            )
 
-            # Retire the agent
-            await factory.retire_agent(agent.id, "Test retirement")
+async def _create_agent(factory, name="Test Agent"):
+    """Create an agent through the factory with test metadata."""
+    return await factory.create_agent(
+        name=name,
+        description=f"{name} description",
+        capabilities=["coordination", "task_assignment"],
+    )
 
-            # Verify the agent is no longer in active agents
-            active_agents = await factory.get_active_agents()
-            assert agent.id not in [a.id for a in active_agents]
 
-    @pytest.mark.asyncio
-    async def test_get_active_agents(self):
-        """Test getting active agents."""
-        mock_db = Mock(spec=DatabaseManager)
-        mock_broker = Mock(spec=MessageBroker)
-        available_providers = {"anthropic": {"api_key": "test"}}
-
-        # Mock the LLM provider creation and structured response
-        with (
-            patch(
-                "novitas.agents.agent_factory.create_llm_provider"
-            ) as mock_create_provider,
-            patch(
-                "novitas.agents.agent_factory.generate_structured_response"
-            ) as mock_generate_response,
-            patch.object(OrchestratorAgent, "initialize") as mock_init,
-        ):
-            # Mock the LLM provider
-            mock_provider = Mock()
-            mock_create_provider.return_value = mock_provider
-
-            # Mock the structured response
-            mock_response = Mock()
-            mock_response.prompt = "Test prompt for code agent"
-            mock_generate_response.return_value = mock_response
-
-            # Mock agent initialization
-            mock_init.return_value = None
-
-            factory = DefaultAgentFactory(
-                database_manager=mock_db,
-                message_broker=mock_broker,
-                available_llm_providers=available_providers,
-            )
+async def _check_create(factory):
+    """A created agent carries the requested metadata."""
+    agent = await _create_agent(factory, "Test Orchestrator Agent")
 
-            # Create multiple agents
-            agent1 = await factory.create_agent(
-                name="Agent 1",
-                description="First agent",
-                capabilities=["test"],
-            )
+    assert agent.name == "Test Orchestrator Agent"
+    assert agent.description == "Test Orchestrator Agent description"
+    assert agent.id is not None
 
-            agent2 = await factory.create_agent(
-                name="Agent 2",
-                description="Second agent",
-                capabilities=["test"],
-            )
 
-            # Get active agents
-            active_agents = await factory.get_active_agents()
+async def _check_retire(factory):
+    """A retired agent is no longer active."""
+    agent = await _create_agent(factory)
 
-            assert len(active_agents) == 2
-        agent_ids = [a.id for a in active_agents]
-        assert agent1.id in agent_ids
-        assert agent2.id in agent_ids
+    await factory.retire_agent(agent.id, "Test retirement")
 
-    @pytest.mark.asyncio
-    async def test_retire_nonexistent_agent(self):
-        """Test retiring a non-existent agent raises error."""
-        mock_db = Mock(spec=DatabaseManager)
-        mock_broker = Mock(spec=MessageBroker)
-        available_providers = {"anthropic": {"api_key": "test"}}
+    active_agents = await factory.get_active_agents()
+    assert agent.id not in [a.id for a in active_agents]
 
-        factory = DefaultAgentFactory(
-            database_manager=mock_db,
-            message_broker=mock_broker,
-            available_llm_providers=available_providers,
-        )
 
-        fake_id = UUID("12345678-1234-5678-1234-567812345678")
+async def _check_list(factory):
+    """Every created agent is reported as active."""
+    agent1 = await _create_agent(factory, "Agent 1")
+    agent2 = await _create_agent(factory, "Agent 2")
+
+    active_agents = await factory.get_active_agents()
+
+    assert len(active_agents) == 2
+    agent_ids = [a.id for a in active_agents]
+    assert agent1.id in agent_ids
+    assert agent2.id in agent_ids
+
+
+async def _check_retire_missing(factory):
+    """Retiring an unknown agent raises an error."""
+    fake_id = UUID("12345678-1234-5678-1234-567812345678")
+
+    with pytest.raises(AgentError, match="Agent not found"):
+        await factory.retire_agent(fake_id, "Test retirement")
+
 
-        with pytest.raises(AgentError, match="Agent not found"):
-            await factory.retire_agent(fake_id, "Test retirement")
+LIFECYCLE_SCENARIOS = {
+    "create": _check_create,
+    "retire": _check_retire,
+    "list": _check_list,
+    "retire_missing": _check_retire_missing,
+}
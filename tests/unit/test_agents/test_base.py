@@ -13,30 +13,58 @@ from novitas.core.models import AgentStatus
 from novitas.core.models import AgentType
 
 
+@pytest.fixture
+def fresh_id(next_uuid):
+    """Create an agent ID for the current test."""
+    return next_uuid()
+
+
+class StubDatabaseManager:
+    """Database manager stand-in with no stored agent state."""
+
+    async def load_agent_state(self, agent_id):
+        return None
+
+    async def save_agent_state(self, agent_state):
+        return None
+
+
+class StubLLMClient:
+    """LLM client stand-in; the base agent never calls it directly."""
+
+
+class StubMessageBroker:
+    """Message broker stand-in that drops every message."""
+
+    async def send_message(self, to_agent, message):
+        return None
+
+    async def receive_message(self, agent_id):
+        return None
+
+
 class MockAgent(BaseAgent):
     """Mock agent for testing."""
 
-    def __init__(self, **kwargs):
-        # Create mock dependencies
-        database_manager = AsyncMock()
-        llm_client = AsyncMock()
-        message_broker = AsyncMock()
+    # Stub dependencies hold no state, so every instance shares them;
+    # load_agent_state returns None so the default state created in
+    # __init__ is used
+    _database_manager = StubDatabaseManager()
+    _llm_client = StubLLMClient()
+    _message_broker = StubMessageBroker()
 
+    def __init__(self, **kwargs):
         # Extract agent_id if provided, otherwise generate
         agent_id = kwargs.pop("agent_id", uuid4())
 
         super().__init__(
-            database_manager=database_manager,
-            llm_client=llm_client,
-            message_broker=message_broker,
+            database_manager=self._database_manager,
+            llm_client=self._llm_client,
+            message_broker=self._message_broker,
             agent_id=agent_id,
             **kwargs,
         )
 
-        # Mock the database manager to return None for load_agent_state
-        # This ensures we use the default state created in __init__
-        self.database_manager.load_agent_state.return_value = None
-
     async def _initialize_agent(self) -> None:
         """Mock initialization."""
         pass
@@ -53,284 +81,157 @@ class MockAgent(BaseAgent):
 class TestBaseAgent:
     """Test the base agent class."""
 
-    def test_base_agent_initialization(self) -> None:
-        """Test base agent initialization."""
-        agent = MockAgent(
-            agent_id=uuid4(),
+    @pytest.fixture
+    def mock_agent(self, fresh_id):
+        """Create a mock agent for testing."""
+        return MockAgent(
+            agent_id=fresh_id,
             name="Test Agent",
             description="A test agent",
             agent_type=AgentType.CODE_AGENT,
             prompt="You are a test agent.",
         )
 
-        assert agent.name == "Test Agent"
-        assert agent.agent_type == "code_agent"
-        assert agent.description == "A test agent"
-        assert agent.prompt == "You are a test agent."
-        assert isinstance(agent.state, AgentState)
-        assert agent.state.status == AgentStatus.ACTIVE
-        assert agent.state.version == 1
+    def test_base_agent_initialization(self, mock_agent) -> None:
+        """Test base agent initialization."""
+        assert mock_agent.name == "Test Agent"
+        assert mock_agent.agent_type == "code_agent"
+        assert mock_agent.description == "A test agent"
+        assert mock_agent.prompt == "You are a test agent."
+        assert isinstance(mock_agent.state, AgentState)
+        assert mock_agent.state.status == AgentStatus.ACTIVE
+        assert mock_agent.state.version == 1
 
     @pytest.mark.asyncio
-    async def test_initialize_agent_success(self) -> None:
+    async def test_initialize_agent_success(self, mock_agent) -> None:
         """Test successful agent initialization."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
-        await agent.initialize()
+        await mock_agent.initialize()
 
-        assert agent.state.status == AgentStatus.ACTIVE
-        assert agent.state.version == 1
+        assert mock_agent.state.status == AgentStatus.ACTIVE
+        assert mock_agent.state.version == 1
 
     @pytest.mark.asyncio
-    async def test_initialize_agent_failure(self) -> None:
+    async def test_initialize_agent_failure(self, mock_agent) -> None:
         """Test agent initialization failure."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
         # Mock _initialize_agent to raise an exception
-        agent._initialize_agent = AsyncMock(
+        mock_agent._initialize_agent = AsyncMock(
             side_effect=Exception("Initialization failed")
         )
 
         with pytest.raises(AgentError, match="Failed to initialize agent Test Agent"):
-            await agent.initialize()
+            await mock_agent.initialize()
 
     @pytest.mark.asyncio
-    async def test_execute_agent_success(self) -> None:
+    async def test_execute_agent_success(self, mock_agent) -> None:
         """Test successful agent execution."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
         # Initialize first
-        await agent.initialize()
+        await mock_agent.initialize()
 
         # Execute with context
-        result = await agent.execute({"test": "context"})
+        result = await mock_agent.execute({"test": "context"})
 
         assert result == [{"result": "success"}]
-        assert agent.state.status == AgentStatus.ACTIVE
+        assert mock_agent.state.status == AgentStatus.ACTIVE
 
     @pytest.mark.asyncio
-    async def test_execute_agent_timeout(self) -> None:
+    async def test_execute_agent_timeout(self, mock_agent) -> None:
         """Test agent execution timeout."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
         # Initialize first
-        await agent.initialize()
+        await mock_agent.initialize()
 
         # Mock _execute_agent to raise TimeoutError
-        agent._execute_agent = AsyncMock(
+        mock_agent._execute_agent = AsyncMock(
             side_effect=TimeoutError("Execution timed out")
         )
 
         with pytest.raises(
             AgentTimeoutError, match="Agent Test Agent execution timed out"
         ):
-            await agent.execute({"test": "context"})
+            await mock_agent.execute({"test": "context"})
 
     @pytest.mark.asyncio
-    async def test_execute_agent_failure(self) -> None:
+    async def test_execute_agent_failure(self, mock_agent) -> None:
         """Test agent execution failure."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
         # Initialize first
-        await agent.initialize()
+        await mock_agent.initialize()
 
         # Mock _execute_agent to raise an exception
-        agent._execute_agent = AsyncMock(side_effect=Exception("Execution failed"))
+        mock_agent._execute_agent = AsyncMock(side_effect=Exception("Execution failed"))
 
         with pytest.raises(AgentError, match="Agent Test Agent execution failed"):
-            await agent.execute({"test": "context"})
+            await mock_agent.execute({"test": "context"})
 
     @pytest.mark.asyncio
-    async def test_cleanup_agent_success(self) -> None:
+    async def test_cleanup_agent_success(self, mock_agent) -> None:
         """Test successful agent cleanup."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
-        await agent.cleanup()
+        await mock_agent.cleanup()
 
-        assert agent.state.status == AgentStatus.ACTIVE
+        assert mock_agent.state.status == AgentStatus.ACTIVE
 
     @pytest.mark.asyncio
-    async def test_cleanup_agent_failure(self) -> None:
+    async def test_cleanup_agent_failure(self, mock_agent) -> None:
         """Test agent cleanup failure."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
         # Mock _cleanup_agent to raise an exception
-        agent._cleanup_agent = AsyncMock(side_effect=Exception("Cleanup failed"))
+        mock_agent._cleanup_agent = AsyncMock(side_effect=Exception("Cleanup failed"))
 
         with pytest.raises(AgentError, match="Agent Test Agent cleanup failed"):
-            await agent.cleanup()
-
-    def test_increment_version(self) -> None:
-        """Test version increment."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
-        initial_version = agent.state.version
-        agent.state.increment_version()
-        assert agent.state.version == initial_version + 1
-
-    def test_update_memory(self) -> None:
-        """Test memory update."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
-        agent.state.memory.update({"key": "value"})
-        assert agent.state.memory["key"] == "value"
-
-    def test_update_performance_metrics(self) -> None:
-        """Test performance metrics update."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
+            await mock_agent.cleanup()
 
-        agent.state.performance_metrics.update({"accuracy": 0.95})
-        assert agent.state.performance_metrics["accuracy"] == 0.95
-
-    def test_get_state(self) -> None:
-        """Test getting agent state."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
-        state = agent.state
+    def test_agent_state_invariants(self, mock_agent) -> None:
+        """Test state access and mutation on a single agent."""
+        # Get state
+        state = mock_agent.state
         assert isinstance(state, AgentState)
         assert state.name == "Test Agent"
         assert state.agent_type == AgentType.CODE_AGENT
 
-    def test_get_performance_metrics(self) -> None:
-        """Test getting performance metrics."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
+        # Increment version
+        initial_version = state.version
+        state.increment_version()
+        assert state.version == initial_version + 1
 
-        metrics = agent.get_performance_metrics()
-        assert isinstance(metrics, dict)
-        assert metrics == agent.state.performance_metrics.copy()
+        # Update memory
+        state.memory.update({"key": "value"})
+        assert state.memory["key"] == "value"
 
-    def test_context_manager(self) -> None:
-        """Test agent as context manager."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
+        # Update performance metrics
+        state.performance_metrics.update({"accuracy": 0.95})
+        assert state.performance_metrics["accuracy"] == 0.95
 
-        # Mock async context manager methods
-        agent.initialize = AsyncMock()
-        agent.cleanup = AsyncMock()
-
-        # Test that the agent can be used as a context manager
-        # Note: BaseAgent doesn't implement async context manager by default
-        # This test verifies the agent has the required methods
-        assert hasattr(agent, "initialize")
-        assert hasattr(agent, "cleanup")
+        # Get performance metrics
+        metrics = mock_agent.get_performance_metrics()
+        assert isinstance(metrics, dict)
+        assert metrics == state.performance_metrics.copy()
 
     @pytest.mark.asyncio
-    async def test_context_manager_usage(self) -> None:
+    async def test_context_manager_usage(self, mock_agent) -> None:
         """Test using agent as context manager."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
+        # BaseAgent doesn't implement async context manager by default,
+        # so verify the agent has the required methods
+        assert hasattr(mock_agent, "initialize")
+        assert hasattr(mock_agent, "cleanup")
 
         # Mock async context manager methods
-        agent.initialize = AsyncMock()
-        agent.cleanup = AsyncMock()
+        mock_agent.initialize = AsyncMock()
+        mock_agent.cleanup = AsyncMock()
 
         # Test manual context manager pattern
-        await agent.initialize()
+        await mock_agent.initialize()
         try:
             # Do work with agent
             pass
         finally:
-            await agent.cleanup()
+            await mock_agent.cleanup()
 
-        agent.initialize.assert_called_once()
-        agent.cleanup.assert_called_once()
+        mock_agent.initialize.assert_awaited_once()
+        mock_agent.cleanup.assert_awaited_once()
 
-    def test_agent_properties(self) -> None:
+    def test_agent_properties(self, mock_agent) -> None:
         """Test agent properties."""
-        agent = MockAgent(
-            agent_id=uuid4(),
-            name="Test Agent",
-            description="A test agent",
-            agent_type=AgentType.CODE_AGENT,
-            prompt="You are a test agent.",
-        )
-
-        assert agent.id is not None
-        assert agent.name == "Test Agent"
-        assert agent.agent_type == "code_agent"
-        assert agent.description == "A test agent"
-        assert agent.prompt == "You are a test agent."
-        assert agent.state.name == "Test Agent"
-        assert agent.state.agent_type == AgentType.CODE_AGENT
+        assert mock_agent.id is not None
+        assert mock_agent.name == "Test Agent"
+        assert mock_agent.agent_type == "code_agent"
+        assert mock_agent.description == "A test agent"
+        assert mock_agent.prompt == "You are a test agent."
+        assert mock_agent.state.name == "Test Agent"
+        assert mock_agent.state.agent_type == AgentType.CODE_AGENT
@@ -1,8 +1,8 @@
 """Tests for LangChain-based memory manager."""
 
+from dataclasses import dataclass
 from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 from langchain.memory import ConversationBufferMemory
@@ -12,61 +12,98 @@ from novitas.agents.memory import MemoryFilter
 from novitas.core.models import MemoryItem
 from novitas.core.models import MemoryType
 
+# Stored memory returned by the database mock; loading only reads it
+_LOADED_MEMORY_PAYLOAD = {
+    "agent_id": "00000000-0000-4000-8000-000000000001",
+    "items": [
+        {
+            "id": "00000000-0000-4000-8000-000000000002",
+            "memory_type": "conversation",
+            "content": {"message": "Hello"},
+            "tags": ["greeting"],
+            "importance": 0.8,
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "ttl": None,
+            "metadata": {},
+        }
+    ],
+    "last_updated": "2024-01-01T00:00:00+00:00",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FakeAgent:
+    """Agent stand-in exposing only what the memory manager reads."""
+
+    id: UUID
+    name: str
+
 
 class TestLangChainMemoryManager:
     """Test LangChain-based memory manager."""
 
-    @pytest.fixture
-    def mock_database_manager(self):
-        """Create a mock database manager."""
+    @pytest.fixture(scope="class")
+    def database_manager_proto(self):
+        """Create the database manager mock once for the class."""
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_database_manager(self, database_manager_proto):
+        """Provide the shared database manager mock, reset for this test."""
+        database_manager_proto.reset_mock(return_value=True, side_effect=True)
+        return database_manager_proto
+
     @pytest.fixture
     def memory_manager(self, mock_database_manager):
         """Create a LangChain memory manager instance."""
         return LangChainMemoryManager(database_manager=mock_database_manager)
 
     @pytest.fixture
-    def mock_agent(self):
+    def mock_agent(self, next_uuid):
         """Create a mock agent."""
-        agent = MagicMock()
-        agent.id = uuid4()
-        agent.name = "Test Agent"
-        return agent
+        return FakeAgent(id=next_uuid(), name="Test Agent")
 
     @pytest.mark.asyncio
-    async def test_register_agent(self, memory_manager, mock_agent):
-        """Test agent registration."""
-        await memory_manager.register_agent(mock_agent)
-
-        assert mock_agent.id in memory_manager._agents
-        assert mock_agent.id in memory_manager._langchain_memories
-        assert isinstance(
-            memory_manager._langchain_memories[mock_agent.id], ConversationBufferMemory
-        )
-
-    @pytest.mark.asyncio
-    async def test_register_agent_already_registered(self, memory_manager, mock_agent):
-        """Test registering an already registered agent."""
-        await memory_manager.register_agent(mock_agent)
-
-        with pytest.raises(Exception, match="Agent .* is already registered"):
-            await memory_manager.register_agent(mock_agent)
-
-    @pytest.mark.asyncio
-    async def test_unregister_agent(self, memory_manager, mock_agent):
-        """Test agent unregistration."""
-        await memory_manager.register_agent(mock_agent)
-        await memory_manager.unregister_agent(mock_agent.id)
-
-        assert mock_agent.id not in memory_manager._agents
-        assert mock_agent.id not in memory_manager._langchain_memories
-
-    @pytest.mark.asyncio
-    async def test_unregister_agent_not_registered(self, memory_manager):
-        """Test unregistering a non-registered agent."""
-        with pytest.raises(Exception, match="Agent .* is not registered"):
-            await memory_manager.unregister_agent(uuid4())
+    @pytest.mark.parametrize(
+        ("ops", "error", "registered"),
+        [
+            pytest.param(["register"], None, True, id="register"),
+            pytest.param(
+                ["register", "register"],
+                r"Agent .* is already registered",
+                True,
+                id="register_twice",
+            ),
+            pytest.param(["register", "unregister"], None, False, id="unregister"),
+            pytest.param(
+                ["unregister"],
+                r"Agent .* is not registered",
+                False,
+                id="unregister_missing",
+            ),
+        ],
+    )
+    async def test_agent_registration(
+        self, memory_manager, mock_agent, ops, error, registered
+    ):
+        """Test registering and unregistering agents."""
+        *setup_ops, last_op = ops
+        for op in setup_ops:
+            await REGISTRATION_OPS[op](memory_manager, mock_agent)
+
+        if error:
+            with pytest.raises(Exception, match=error):
+                await REGISTRATION_OPS[last_op](memory_manager, mock_agent)
+        else:
+            await REGISTRATION_OPS[last_op](memory_manager, mock_agent)
+
+        assert (mock_agent.id in memory_manager._agents) is registered
+        assert (mock_agent.id in memory_manager._langchain_memories) is registered
+        if registered:
+            assert isinstance(
+                memory_manager._langchain_memories[mock_agent.id],
+                ConversationBufferMemory,
+            )
 
     @pytest.mark.asyncio
     async def test_add_memory(self, memory_manager, mock_agent):
@@ -81,7 +118,7 @@ class TestLangChainMemoryManager:
             importance=0.8,
         )
 
-        assert isinstance(memory_id, uuid4().__class__)
+        assert isinstance(memory_id, UUID)
 
         # Check that memory was added to both systems
         memories = await memory_manager.get_memory(mock_agent.id)
@@ -94,6 +131,56 @@ class TestLangChainMemoryManager:
         variables = langchain_memory.load_memory_variables({})
         assert "history" in variables
 
+    @pytest.mark.asyncio
+    async def test_add_memories(self, memory_manager, mock_agent):
+        """Test adding several memories in one call."""
+        await memory_manager.register_agent(mock_agent)
+        items = [
+            MemoryItem.model_construct(
+                memory_type=MemoryType.CONVERSATION,
+                content={"input": "Hello", "output": "Hi there!"},
+            ),
+            MemoryItem.model_construct(
+                memory_type=MemoryType.KNOWLEDGE, content={"fact": "test"}
+            ),
+            MemoryItem.model_construct(
+                memory_type=MemoryType.CONVERSATION, content={"message": "Bye"}
+            ),
+        ]
+
+        memory_ids = await memory_manager.add_memories(mock_agent.id, items)
+
+        assert memory_ids == [item.id for item in items]
+        assert await memory_manager.get_memory(mock_agent.id) == items
+        messages = memory_manager._langchain_memories[
+            mock_agent.id
+        ].chat_memory.messages
+        assert [message.content for message in messages] == [
+            "Hello",
+            "Hi there!",
+            "Bye",
+            "Message received",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_add_memories_notifies_handlers(self, memory_manager, mock_agent):
+        """Test every memory in a batch reaches the registered handlers."""
+        await memory_manager.register_agent(mock_agent)
+        handled = []
+        await memory_manager.add_memory_handler(mock_agent.id, handled.append)
+        items = [
+            MemoryItem.model_construct(
+                memory_type=MemoryType.KNOWLEDGE, content={"fact": "one"}
+            ),
+            MemoryItem.model_construct(
+                memory_type=MemoryType.KNOWLEDGE, content={"fact": "two"}
+            ),
+        ]
+
+        await memory_manager.add_memories(mock_agent.id, items)
+
+        assert handled == items
+
     @pytest.mark.asyncio
     async def test_add_memory_with_ttl(self, memory_manager, mock_agent):
         """Test adding memory with TTL."""
@@ -116,18 +203,20 @@ class TestLangChainMemoryManager:
         await memory_manager.register_agent(mock_agent)
 
         # Add different types of memory
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.CONVERSATION,
-            content={"message": "Hello"},
-            tags=["greeting"],
-        )
-
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.KNOWLEDGE,
-            content={"fact": "test fact"},
-            tags=["fact"],
+        await memory_manager.add_memories(
+            mock_agent.id,
+            [
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.CONVERSATION,
+                    content={"message": "Hello"},
+                    tags=["greeting"],
+                ),
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.KNOWLEDGE,
+                    content={"fact": "test fact"},
+                    tags=["fact"],
+                ),
+            ],
         )
 
         # Filter by memory type
@@ -143,18 +232,20 @@ class TestLangChainMemoryManager:
         """Test searching memory."""
         await memory_manager.register_agent(mock_agent)
 
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.CONVERSATION,
-            content={"message": "Hello world"},
-            tags=["greeting"],
-        )
-
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.KNOWLEDGE,
-            content={"fact": "Python is a programming language"},
-            tags=["programming"],
+        await memory_manager.add_memories(
+            mock_agent.id,
+            [
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.CONVERSATION,
+                    content={"message": "Hello world"},
+                    tags=["greeting"],
+                ),
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.KNOWLEDGE,
+                    content={"fact": "Python is a programming language"},
+                    tags=["programming"],
+                ),
+            ],
         )
 
         # Search for "Hello"
@@ -218,16 +309,16 @@ class TestLangChainMemoryManager:
         await memory_manager.register_agent(mock_agent)
 
         # Add multiple memories
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.CONVERSATION,
-            content={"message": "Hello"},
-        )
-
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.KNOWLEDGE,
-            content={"fact": "test"},
+        await memory_manager.add_memories(
+            mock_agent.id,
+            [
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.CONVERSATION, content={"message": "Hello"}
+                ),
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.KNOWLEDGE, content={"fact": "test"}
+                ),
+            ],
         )
 
         # Clear all memory
@@ -242,18 +333,20 @@ class TestLangChainMemoryManager:
         """Test getting memory statistics."""
         await memory_manager.register_agent(mock_agent)
 
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.CONVERSATION,
-            content={"message": "Hello"},
-            importance=0.8,
-        )
-
-        await memory_manager.add_memory(
-            agent_id=mock_agent.id,
-            memory_type=MemoryType.KNOWLEDGE,
-            content={"fact": "test"},
-            importance=0.6,
+        await memory_manager.add_memories(
+            mock_agent.id,
+            [
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.CONVERSATION,
+                    content={"message": "Hello"},
+                    importance=0.8,
+                ),
+                MemoryItem.model_construct(
+                    memory_type=MemoryType.KNOWLEDGE,
+                    content={"fact": "test"},
+                    importance=0.6,
+                ),
+            ],
         )
 
         stats = memory_manager.get_memory_stats(mock_agent.id)
@@ -335,22 +428,7 @@ class TestLangChainMemoryManager:
     ):
         """Test memory loading from database."""
         # Mock database to return existing memory
-        mock_database_manager.load_agent_memory.return_value = {
-            "agent_id": str(mock_agent.id),
-            "items": [
-                {
-                    "id": str(uuid4()),
-                    "memory_type": "conversation",
-                    "content": {"message": "Hello"},
-                    "tags": ["greeting"],
-                    "importance": 0.8,
-                    "timestamp": "2024-01-01T00:00:00+00:00",
-                    "ttl": None,
-                    "metadata": {},
-                }
-            ],
-            "last_updated": "2024-01-01T00:00:00+00:00",
-        }
+        mock_database_manager.load_agent_memory.return_value = _LOADED_MEMORY_PAYLOAD
 
         await memory_manager.register_agent(mock_agent)
 
@@ -359,3 +437,9 @@ class TestLangChainMemoryManager:
         assert len(memories) == 1
         assert memories[0].memory_type == MemoryType.CONVERSATION
         assert memories[0].content == {"message": "Hello"}
+
+
+REGISTRATION_OPS = {
+    "register": lambda manager, agent: manager.register_agent(agent),
+    "unregister": lambda manager, agent: manager.unregister_agent(agent.id),
+}
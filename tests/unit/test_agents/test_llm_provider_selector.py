@@ -7,6 +7,38 @@ from novitas.agents.llm_provider_selector import LLMProviderSelector
 from novitas.core.exceptions import AgentError
 
 
+@pytest.fixture(scope="module")
+def selector():
+    """Create one provider selector for the module; selection is stateless."""
+    return DefaultLLMProviderSelector()
+
+
+@pytest.fixture(scope="module")
+def anthropic_openai_providers():
+    """Provider configs with both Anthropic and OpenAI available."""
+    return {
+        "anthropic": {
+            "api_key": "test_key",
+            "temperature": 0.5,
+        },
+        "openai": {
+            "api_key": "test_key",
+            "temperature": 0.5,
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def anthropic_only_providers():
+    """Provider configs with only Anthropic available."""
+    return {
+        "anthropic": {
+            "api_key": "test_key",
+            "temperature": 0.5,
+        }
+    }
+
+
 class TestLLMProviderSelector:
     """Test cases for LLM Provider Selector."""
 
@@ -15,34 +47,22 @@ class TestLLMProviderSelector:
         # This test ensures the protocol is properly defined
         assert callable(LLMProviderSelector)
 
-    def test_default_llm_provider_selector_creation(self):
+    def test_default_llm_provider_selector_creation(self, selector):
         """Test DefaultLLMProviderSelector can be instantiated."""
-        selector = DefaultLLMProviderSelector()
         assert isinstance(selector, DefaultLLMProviderSelector)
 
-    def test_select_provider_for_orchestrator_anthropic_preferred(self):
+    def test_select_provider_for_orchestrator_anthropic_preferred(
+        self, selector, anthropic_openai_providers
+    ):
         """Test that Anthropic is preferred for orchestrator when available."""
-        selector = DefaultLLMProviderSelector()
-        available_providers = {
-            "anthropic": {
-                "api_key": "test_key",
-                "temperature": 0.5,
-            },
-            "openai": {
-                "api_key": "test_key",
-                "temperature": 0.5,
-            },
-        }
-
-        result = selector.select_provider_for_orchestrator(available_providers)
+        result = selector.select_provider_for_orchestrator(anthropic_openai_providers)
 
         assert result["model"] == "claude-sonnet-4-20250514"
         assert result["temperature"] == 0.1
         assert "api_key" in result
 
-    def test_select_provider_for_orchestrator_openai_fallback(self):
+    def test_select_provider_for_orchestrator_openai_fallback(self, selector):
         """Test that OpenAI is used as fallback when Anthropic not available."""
-        selector = DefaultLLMProviderSelector()
         available_providers = {
             "openai": {
                 "api_key": "test_key",
@@ -56,71 +76,35 @@ class TestLLMProviderSelector:
         assert result["temperature"] == 0.1
         assert "api_key" in result
 
-    def test_select_provider_for_orchestrator_no_providers(self):
+    def test_select_provider_for_orchestrator_no_providers(self, selector):
         """Test that error is raised when no providers available."""
-        selector = DefaultLLMProviderSelector()
         available_providers = {}
 
         with pytest.raises(AgentError, match="No LLM providers available"):
             selector.select_provider_for_orchestrator(available_providers)
 
-    def test_select_provider_for_agent_type_code_agent(self):
-        """Test provider selection for code agent."""
-        selector = DefaultLLMProviderSelector()
-        available_providers = {
-            "anthropic": {
-                "api_key": "test_key",
-                "temperature": 0.5,
-            }
-        }
-
-        result = selector.select_provider_for_agent_type(
-            "code_agent", available_providers
-        )
-
-        assert result["provider_name"] == "anthropic"
-        assert result["model"] == "claude-sonnet-4-20250514"
-        assert result["temperature"] == 0.1
-
-    def test_select_provider_for_agent_type_documentation_agent(self):
-        """Test provider selection for documentation agent."""
-        selector = DefaultLLMProviderSelector()
-        available_providers = {
-            "anthropic": {
-                "api_key": "test_key",
-                "temperature": 0.5,
-            }
-        }
-
-        result = selector.select_provider_for_agent_type(
-            "documentation_agent", available_providers
-        )
-
-        assert result["provider_name"] == "anthropic"
-        assert result["model"] == "claude-sonnet-4-20250514"
-        assert result["temperature"] == 0.3
-
-    def test_select_provider_for_agent_type_test_agent(self):
-        """Test provider selection for test agent."""
-        selector = DefaultLLMProviderSelector()
-        available_providers = {
-            "anthropic": {
-                "api_key": "test_key",
-                "temperature": 0.5,
-            }
-        }
-
+    @pytest.mark.parametrize(
+        ("agent_type", "expected_temperature"),
+        [
+            ("code_agent", 0.1),
+            ("documentation_agent", 0.3),
+            ("test_agent", 0.2),
+        ],
+    )
+    def test_select_provider_for_agent_type(
+        self, selector, anthropic_only_providers, agent_type, expected_temperature
+    ):
+        """Test provider selection for each specialized agent type."""
         result = selector.select_provider_for_agent_type(
-            "test_agent", available_providers
+            agent_type, anthropic_only_providers
         )
 
         assert result["provider_name"] == "anthropic"
         assert result["model"] == "claude-sonnet-4-20250514"
-        assert result["temperature"] == 0.2
+        assert result["temperature"] == expected_temperature
 
-    def test_select_provider_for_agent_type_default_fallback(self):
+    def test_select_provider_for_agent_type_default_fallback(self, selector):
         """Test default provider selection when specific type not handled."""
-        selector = DefaultLLMProviderSelector()
         available_providers = {
             "anthropic": {
                 "api_key": "test_key",
@@ -137,9 +121,8 @@ class TestLLMProviderSelector:
         assert "model" in result
         assert "temperature" in result
 
-    def test_select_provider_for_agent_type_no_providers(self):
+    def test_select_provider_for_agent_type_no_providers(self, selector):
         """Test error when no providers available for agent type."""
-        selector = DefaultLLMProviderSelector()
         available_providers = {}
 
         with pytest.raises(AgentError, match="No LLM providers available"):
@@ -1,9 +1,10 @@
 """Tests for the Orchestrator Agent."""
 
+import itertools
 from unittest.mock import AsyncMock
-from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 
 from novitas.agents.orchestrator import OrchestratorAgent
 from novitas.core.models import AgentType
@@ -12,31 +13,57 @@ from novitas.core.models import ImprovementType
 from novitas.core.schemas import AgentPrompt
 
 
+class StubDatabaseManager:
+    """Database manager stand-in with no stored agent state or memory."""
+
+    async def load_agent_state(self, agent_id):
+        return None
+
+    async def save_agent_state(self, agent_state):
+        return None
+
+    async def load_agent_memory(self, agent_id):
+        return None
+
+    async def save_agent_memory(self, agent_id, memory_data):
+        return None
+
+
+class StubLLMClient:
+    """LLM provider stand-in whose structured calls produce no response."""
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages, **kwargs):
+        return None
+
+
 class TestOrchestratorAgent:
     """Test cases for the Orchestrator Agent."""
 
     @pytest.fixture
     def mock_database_manager(self):
-        """Create a mock database manager."""
-        mock = AsyncMock()
-        mock.load_agent_state.return_value = None
-        return mock
+        """Create a stub database manager."""
+        return StubDatabaseManager()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_llm_client(self):
-        """Create a mock LLM client."""
-        mock = AsyncMock()
-        # Mock the with_structured_output method
-        structured_mock = AsyncMock()
-        structured_mock.ainvoke.return_value = AsyncMock()
-        mock.with_structured_output.return_value = structured_mock
-        return mock
+        """Create a stub LLM client; it holds no state, so one serves the module."""
+        return StubLLMClient()
 
     @pytest.fixture
     def mock_message_broker(self):
         """Create a mock message broker."""
         return AsyncMock()
 
+    @pytest.fixture
+    def patched_generate_response(self, monkeypatch):
+        """Patch the LLM text generation call with an AsyncMock."""
+        mock = AsyncMock()
+        monkeypatch.setattr("novitas.llm.provider.generate_response", mock)
+        return mock
+
     @pytest.fixture(autouse=True)
     def mock_llm_provider(self, mock_llm_client, monkeypatch):
         """Mock LLM provider creation for all tests."""
@@ -50,7 +77,9 @@ class TestOrchestratorAgent:
         )
 
     @pytest.fixture
-    def orchestrator(self, mock_database_manager, mock_llm_client, mock_message_broker):
+    def orchestrator(
+        self, mock_database_manager, mock_llm_client, mock_message_broker, next_uuid
+    ):
         """Create an Orchestrator Agent instance."""
         # Create mock available providers
         available_providers = {
@@ -63,12 +92,18 @@ class TestOrchestratorAgent:
             database_manager=mock_database_manager,
             available_llm_providers=available_providers,
             message_broker=mock_message_broker,
-            agent_id=uuid4(),
+            agent_id=next_uuid(),
             name="Test Orchestrator",
             description="A test orchestrator agent",
             prompt="You are an orchestrator agent.",
         )
 
+    @pytest_asyncio.fixture
+    async def initialized_orchestrator(self, orchestrator):
+        """Create an Orchestrator Agent that has already been initialized."""
+        await orchestrator.initialize()
+        return orchestrator
+
     def test_orchestrator_initialization(self, orchestrator):
         """Test orchestrator initialization."""
         assert orchestrator.name == "Test Orchestrator"
@@ -85,9 +120,10 @@ class TestOrchestratorAgent:
         assert orchestrator._initialized is True
 
     @pytest.mark.asyncio
-    async def test_create_specialized_agent(self, orchestrator, monkeypatch):
+    async def test_create_specialized_agent(
+        self, initialized_orchestrator, monkeypatch
+    ):
         """Test creating a specialized agent."""
-        await orchestrator.initialize()
 
         # Mock the generate_structured_response function
         async def mock_generate_structured_response(provider, prompt, schema, **kwargs):
@@ -102,7 +138,7 @@ class TestOrchestratorAgent:
             mock_generate_structured_response,
         )
 
-        agent_id = await orchestrator.create_specialized_agent(
+        agent_id = await initialized_orchestrator.create_specialized_agent(
             agent_type="code_agent",
             name="Code Analyzer",
             description="Analyzes code and suggests improvements",
@@ -110,34 +146,34 @@ class TestOrchestratorAgent:
         )
 
         assert agent_id is not None
-        assert agent_id in orchestrator.managed_agents
-        assert orchestrator.managed_agents[agent_id]["name"] == "Code Analyzer"
-        assert orchestrator.managed_agents[agent_id]["type"] == "code_agent"
+        assert agent_id in initialized_orchestrator.managed_agents
+        assert (
+            initialized_orchestrator.managed_agents[agent_id]["name"] == "Code Analyzer"
+        )
+        assert initialized_orchestrator.managed_agents[agent_id]["type"] == "code_agent"
 
     @pytest.mark.asyncio
-    async def test_retire_agent(self, orchestrator):
+    async def test_retire_agent(self, initialized_orchestrator, next_uuid):
         """Test retiring an agent."""
-        await orchestrator.initialize()
-
         # Create an agent first
-        agent_id = uuid4()
-        orchestrator.managed_agents[agent_id] = {
+        agent_id = next_uuid()
+        initialized_orchestrator.managed_agents[agent_id] = {
             "name": "Test Agent",
             "type": "test_agent",
             "created_at": "2023-01-01",
             "performance": 0.5,
         }
 
-        await orchestrator.retire_agent(agent_id, "Low performance")
+        await initialized_orchestrator.retire_agent(agent_id, "Low performance")
 
-        assert agent_id not in orchestrator.managed_agents
-        assert agent_id in orchestrator.retired_agents
+        assert agent_id not in initialized_orchestrator.managed_agents
+        assert agent_id in initialized_orchestrator.retired_agents
 
     @pytest.mark.asyncio
-    async def test_coordinate_improvement_cycle(self, orchestrator, monkeypatch):
+    async def test_coordinate_improvement_cycle(
+        self, initialized_orchestrator, patched_generate_response, next_uuid
+    ):
         """Test coordinating an improvement cycle."""
-        await orchestrator.initialize()
-
         # Mock context for improvement cycle
         context = {
             "files_to_analyze": ["src/main.py", "tests/test_main.py"],
@@ -155,21 +191,11 @@ class TestOrchestratorAgent:
             "Coordinate workflow between agents",
             "Evaluate proposals and select best ones",
         ]
-        response_index = 0
-
-        async def mock_generate_response(provider, prompt):
-            nonlocal response_index
-            response = responses[response_index % len(responses)]
-            response_index += 1
-            return response
-
-        monkeypatch.setattr(
-            "novitas.llm.provider.generate_response", mock_generate_response
-        )
+        patched_generate_response.side_effect = itertools.cycle(responses)
 
         # Mock agent execution
-        mock_proposal = ChangeProposal(
-            agent_id=uuid4(),
+        mock_proposal = ChangeProposal.model_construct(
+            agent_id=next_uuid(),
             improvement_type=ImprovementType.CODE_IMPROVEMENT,
             file_path="src/main.py",
             description="Add docstring to main function",
@@ -178,23 +204,27 @@ class TestOrchestratorAgent:
             confidence_score=0.8,
         )
 
-        orchestrator._execute_agent_workflow = AsyncMock(return_value=[mock_proposal])
-        orchestrator._evaluate_proposals = AsyncMock(return_value=[mock_proposal])
+        initialized_orchestrator._execute_agent_workflow = AsyncMock(
+            return_value=[mock_proposal]
+        )
+        initialized_orchestrator._evaluate_proposals = AsyncMock(
+            return_value=[mock_proposal]
+        )
 
-        results = await orchestrator.coordinate_improvement_cycle(context)
+        results = await initialized_orchestrator.coordinate_improvement_cycle(context)
 
         assert len(results) > 0
         assert all(isinstance(proposal, ChangeProposal) for proposal in results)
 
     @pytest.mark.asyncio
-    async def test_evaluate_proposals(self, orchestrator, monkeypatch):
+    async def test_evaluate_proposals(
+        self, initialized_orchestrator, patched_generate_response, next_uuid
+    ):
         """Test evaluating change proposals."""
-        await orchestrator.initialize()
-
         # Mock proposals
         proposals = [
-            ChangeProposal(
-                agent_id=uuid4(),
+            ChangeProposal.model_construct(
+                agent_id=next_uuid(),
                 improvement_type=ImprovementType.CODE_IMPROVEMENT,
                 file_path="src/main.py",
                 description="Add type hints",
@@ -202,8 +232,8 @@ class TestOrchestratorAgent:
                 proposed_changes={"add_types": True},
                 confidence_score=0.9,
             ),
-            ChangeProposal(
-                agent_id=uuid4(),
+            ChangeProposal.model_construct(
+                agent_id=next_uuid(),
                 improvement_type=ImprovementType.DOCUMENTATION_IMPROVEMENT,
                 file_path="README.md",
                 description="Update documentation",
@@ -214,8 +244,7 @@ class TestOrchestratorAgent:
         ]
 
         # Mock the generate_response function
-        async def mock_generate_response(provider, prompt):
-            return """
+        patched_generate_response.return_value = """
             Proposal Evaluation:
 
             1. Add type hints (Score: 0.9)
@@ -229,27 +258,25 @@ class TestOrchestratorAgent:
                - Recommended for implementation
             """
 
-        monkeypatch.setattr(
-            "novitas.llm.provider.generate_response", mock_generate_response
+        selected_proposals = await initialized_orchestrator._evaluate_proposals(
+            proposals
         )
 
-        selected_proposals = await orchestrator._evaluate_proposals(proposals)
-
         assert len(selected_proposals) > 0
         assert all(
             isinstance(proposal, ChangeProposal) for proposal in selected_proposals
         )
 
     @pytest.mark.asyncio
-    async def test_monitor_agent_performance(self, orchestrator, monkeypatch):
+    async def test_monitor_agent_performance(
+        self, initialized_orchestrator, patched_generate_response, next_uuid
+    ):
         """Test monitoring agent performance."""
-        await orchestrator.initialize()
-
         # Create some test agents
-        agent1_id = uuid4()
-        agent2_id = uuid4()
+        agent1_id = next_uuid()
+        agent2_id = next_uuid()
 
-        orchestrator.managed_agents[agent1_id] = {
+        initialized_orchestrator.managed_agents[agent1_id] = {
             "name": "High Performer",
             "type": "code_agent",
             "performance": 0.9,
@@ -257,7 +284,7 @@ class TestOrchestratorAgent:
             "success_rate": 0.95,
         }
 
-        orchestrator.managed_agents[agent2_id] = {
+        initialized_orchestrator.managed_agents[agent2_id] = {
             "name": "Low Performer",
             "type": "code_agent",
             "performance": 0.3,
@@ -266,29 +293,24 @@ class TestOrchestratorAgent:
         }
 
         # Mock the generate_response function
-        async def mock_generate_response(provider, prompt):
-            return """
+        patched_generate_response.return_value = """
             Performance Analysis:
 
             High Performer: Excellent performance, keep active
             Low Performer: Poor performance, recommend retirement
             """
 
-        monkeypatch.setattr(
-            "novitas.llm.provider.generate_response", mock_generate_response
-        )
-
-        performance_report = await orchestrator.monitor_agent_performance()
+        performance_report = await initialized_orchestrator.monitor_agent_performance()
 
         assert "High Performer" in str(performance_report["agent_performance"])
         assert "Low Performer" in str(performance_report["agent_performance"])
         assert performance_report["recommendations"] is not None
 
     @pytest.mark.asyncio
-    async def test_evolve_agent_prompts(self, orchestrator, monkeypatch):
+    async def test_evolve_agent_prompts(
+        self, initialized_orchestrator, patched_generate_response
+    ):
         """Test evolving agent prompts based on performance."""
-        await orchestrator.initialize()
-
         # Mock performance data
         performance_data = {
             "code_agent": {
@@ -299,8 +321,7 @@ class TestOrchestratorAgent:
         }
 
         # Mock the generate_response function
-        async def mock_generate_response(provider, prompt):
-            return """
+        patched_generate_response.return_value = """
             Evolved Prompt for Code Agent:
 
             You are a code analysis expert. Focus on:
@@ -311,20 +332,16 @@ class TestOrchestratorAgent:
             Updated prompt: You are a Python code quality expert...
             """
 
-        monkeypatch.setattr(
-            "novitas.llm.provider.generate_response", mock_generate_response
+        evolved_prompts = await initialized_orchestrator.evolve_agent_prompts(
+            performance_data
         )
 
-        evolved_prompts = await orchestrator.evolve_agent_prompts(performance_data)
-
         assert "evolution_strategy" in evolved_prompts
         assert evolved_prompts["evolution_strategy"] is not None
 
     @pytest.mark.asyncio
-    async def test_execute_agent(self, orchestrator):
+    async def test_execute_agent(self, initialized_orchestrator):
         """Test orchestrator execution."""
-        await orchestrator.initialize()
-
         context = {
             "action": "improvement_cycle",
             "files_to_analyze": ["src/main.py"],
@@ -332,61 +349,58 @@ class TestOrchestratorAgent:
         }
 
         # Mock the coordination workflow
-        orchestrator.coordinate_improvement_cycle = AsyncMock(return_value=[])
+        initialized_orchestrator.coordinate_improvement_cycle = AsyncMock(
+            return_value=[]
+        )
 
-        results = await orchestrator.execute(context)
+        results = await initialized_orchestrator.execute(context)
 
         assert isinstance(results, list)
-        orchestrator.coordinate_improvement_cycle.assert_called_once()
+        initialized_orchestrator.coordinate_improvement_cycle.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_agent_communication(self, orchestrator):
+    async def test_agent_communication(self, initialized_orchestrator, next_uuid):
         """Test inter-agent communication."""
-        await orchestrator.initialize()
-
-        recipient_id = uuid4()
+        recipient_id = next_uuid()
         message_content = {"type": "analysis_request", "files": ["test.py"]}
 
-        await orchestrator.send_message(
+        await initialized_orchestrator.send_message(
             recipient_id, "analysis_request", message_content
         )
 
-        orchestrator.message_broker.send_message.assert_called_once()
+        initialized_orchestrator.message_broker.send_message.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_error_handling(self, orchestrator, monkeypatch):
+    async def test_error_handling(
+        self, initialized_orchestrator, patched_generate_response
+    ):
         """Test error handling in orchestrator."""
-        await orchestrator.initialize()
 
         # Mock the generate_response function to raise an error
-        async def mock_generate_response(provider, prompt):
-            raise Exception("LLM Error")
-
-        monkeypatch.setattr(
-            "novitas.llm.provider.generate_response", mock_generate_response
-        )
+        patched_generate_response.side_effect = Exception("LLM Error")
 
         context = {"action": "improvement_cycle", "files_to_analyze": ["test.py"]}
 
         # Should handle the error gracefully
-        results = await orchestrator.execute(context)
+        results = await initialized_orchestrator.execute(context)
 
         assert isinstance(results, list)
         assert len(results) == 0  # Should return empty list on error
 
     @pytest.mark.asyncio
-    async def test_cleanup_orchestrator(self, orchestrator):
+    async def test_cleanup_orchestrator(self, initialized_orchestrator, next_uuid):
         """Test orchestrator cleanup."""
-        await orchestrator.initialize()
-
         # Add some managed agents
-        agent_id = uuid4()
-        orchestrator.managed_agents[agent_id] = {"name": "Test Agent", "type": "test"}
+        agent_id = next_uuid()
+        initialized_orchestrator.managed_agents[agent_id] = {
+            "name": "Test Agent",
+            "type": "test",
+        }
 
-        await orchestrator.cleanup()
+        await initialized_orchestrator.cleanup()
 
         # Should cleanup all managed agents
-        assert len(orchestrator.managed_agents) == 0
+        assert len(initialized_orchestrator.managed_agents) == 0
         # Note: Base agent doesn't change status during cleanup, so it remains active
 
     def test_get_performance_metrics(self, orchestrator):
@@ -405,9 +419,10 @@ class TestOrchestratorAgent:
         assert metrics["proposal_acceptance_rate"] == 0.8
 
     @pytest.mark.asyncio
-    async def test_agent_lifecycle_management(self, orchestrator, monkeypatch):
+    async def test_agent_lifecycle_management(
+        self, initialized_orchestrator, monkeypatch
+    ):
         """Test complete agent lifecycle management."""
-        await orchestrator.initialize()
 
         # Mock the generate_structured_response function
         async def mock_generate_structured_response(provider, prompt, schema, **kwargs):
@@ -423,29 +438,29 @@ class TestOrchestratorAgent:
         )
 
         # Create agent
-        agent_id = await orchestrator.create_specialized_agent(
+        agent_id = await initialized_orchestrator.create_specialized_agent(
             "test_agent", "Test Agent", "Test description", ["test_capability"]
         )
 
-        assert agent_id in orchestrator.managed_agents
+        assert agent_id in initialized_orchestrator.managed_agents
 
         # Update performance
-        orchestrator.managed_agents[agent_id]["performance"] = 0.3
+        initialized_orchestrator.managed_agents[agent_id]["performance"] = 0.3
 
         # Monitor and potentially retire
-        await orchestrator.monitor_agent_performance()
+        await initialized_orchestrator.monitor_agent_performance()
 
         # Retire low-performing agent
-        await orchestrator.retire_agent(agent_id, "Low performance")
+        await initialized_orchestrator.retire_agent(agent_id, "Low performance")
 
-        assert agent_id not in orchestrator.managed_agents
-        assert agent_id in orchestrator.retired_agents
+        assert agent_id not in initialized_orchestrator.managed_agents
+        assert agent_id in initialized_orchestrator.retired_agents
 
     @pytest.mark.asyncio
-    async def test_system_evolution(self, orchestrator, monkeypatch):
+    async def test_system_evolution(
+        self, initialized_orchestrator, patched_generate_response
+    ):
         """Test system evolution capabilities."""
-        await orchestrator.initialize()
-
         # Mock performance data for evolution
         performance_data = {
             "code_agent": {"success_rate": 0.7},
@@ -453,19 +468,16 @@ class TestOrchestratorAgent:
         }
 
         # Mock the generate_response function
-        async def mock_generate_response(provider, prompt):
-            return """
+        patched_generate_response.return_value = """
             Evolution Strategy:
             1. Retire underperforming code_agent
             2. Create new specialized agent for testing
             3. Evolve doc_agent prompt for better performance
             """
 
-        monkeypatch.setattr(
-            "novitas.llm.provider.generate_response", mock_generate_response
+        evolution_plan = await initialized_orchestrator.plan_system_evolution(
+            performance_data
         )
 
-        evolution_plan = await orchestrator.plan_system_evolution(performance_data)
-
         assert evolution_plan is not None
         assert "actions" in evolution_plan
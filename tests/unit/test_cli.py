@@ -1,8 +1,11 @@
 """Tests for the CLI module."""
 
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import patch
 
+import pytest
+import typer
 from typer.testing import CliRunner
 
 from novitas.cli import _run_agents_command
@@ -173,6 +176,26 @@ class TestCLIWrapperFunctions:
         call_args = mock_asyncio_run.call_args[0][0]
         assert call_args is not None
 
+    @patch("novitas.cli.close_message_brokers")
+    @patch("novitas.cli.run_improvement_cycle")
+    def test_run_improvement_cycle_closes_message_brokers(
+        self, mock_run_cycle, mock_close
+    ):
+        """Test _run_improvement_cycle closes the brokers when the cycle fails."""
+        mock_run_cycle.side_effect = RuntimeError("boom")
+        loop = asyncio.new_event_loop()
+
+        try:
+            with (
+                patch("novitas.cli.asyncio.run", loop.run_until_complete),
+                pytest.raises(typer.Exit),
+            ):
+                _run_improvement_cycle()
+        finally:
+            loop.close()
+
+        mock_close.assert_awaited_once()
+
     @patch("novitas.cli.asyncio.run")
     @patch("novitas.cli.get_database_manager")
     def test_run_agents_command_success(self, mock_get_db, mock_asyncio_run):
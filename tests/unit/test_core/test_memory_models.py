@@ -1,7 +1,7 @@
 """Tests for memory models."""
 
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -54,7 +54,7 @@ class TestMemoryItem:
         assert memory_item.importance == 0.8
         assert memory_item.ttl is None
         assert memory_item.metadata == {}
-        assert isinstance(memory_item.id, uuid4().__class__)
+        assert isinstance(memory_item.id, UUID)
         assert isinstance(memory_item.timestamp, datetime)
 
     def test_memory_item_defaults(self) -> None:
@@ -20,10 +20,10 @@ class TestDatabaseManager:
         manager = clean_database
 
         # Act & Assert
-        assert manager.get_status() == "Connected"
+        assert manager.status == "Connected"
 
         await manager.disconnect()
-        assert manager.get_status() == "Disconnected"
+        assert manager.status == "Disconnected"
 
     @pytest.mark.asyncio
     async def test_save_and_load_agent_state(
@@ -81,6 +81,19 @@ class TestDatabaseManager:
         assert loaded_agent.name == "Updated Agent Name"
         assert loaded_agent.status == AgentStatus.INACTIVE
 
+    @pytest.mark.asyncio
+    async def test_load_agent_states(self, clean_database, sample_agent_state) -> None:
+        """Test loading several agent states at once."""
+        # Arrange
+        manager = clean_database
+        await manager.save_agent_state(sample_agent_state)
+
+        # Act
+        loaded = await manager.load_agent_states([uuid4(), sample_agent_state.id])
+
+        # Assert
+        assert [agent.id for agent in loaded] == [sample_agent_state.id]
+
     @pytest.mark.asyncio
     async def test_save_and_get_change_proposal(
         self, clean_database, sample_change_proposal
@@ -92,13 +105,31 @@ class TestDatabaseManager:
 
         # Act
         await manager.save_change_proposal(proposal)
-        proposals = await manager.get_change_proposals(
-            uuid4()
-        )  # cycle_id not implemented yet
+        proposals = await manager.get_change_proposals(proposal.cycle_id)
+        other_cycle_proposals = await manager.get_change_proposals(uuid4())
+
+        # Assert
+        assert [saved.id for saved in proposals] == [proposal.id]
+        assert other_cycle_proposals == []
+
+    @pytest.mark.asyncio
+    async def test_save_change_proposals_batch(
+        self, clean_database, sample_change_proposal
+    ) -> None:
+        """Test saving a batch of change proposals."""
+        # Arrange
+        manager = clean_database
+        second_proposal = sample_change_proposal.model_copy(update={"id": uuid4()})
+
+        # Act
+        await manager.save_change_proposals([sample_change_proposal, second_proposal])
+        proposals = await manager.get_change_proposals(sample_change_proposal.cycle_id)
 
         # Assert
-        assert len(proposals) >= 1
-        # Note: get_change_proposals currently returns all proposals since cycle_id filtering isn't implemented
+        assert {proposal.id for proposal in proposals} == {
+            sample_change_proposal.id,
+            second_proposal.id,
+        }
 
     @pytest.mark.asyncio
     async def test_save_and_get_improvement_cycle(
@@ -135,6 +166,20 @@ class TestDatabaseManager:
         agent_ids = [agent.id for agent in all_agents]
         assert agent_state.id in agent_ids
 
+    @pytest.mark.asyncio
+    async def test_iter_all_agents(self, clean_database, sample_agent_state) -> None:
+        """Test streaming all agents."""
+        # Arrange
+        manager = clean_database
+        agent_state = sample_agent_state
+
+        # Act
+        await manager.save_agent_state(agent_state)
+        agent_ids = [agent.id async for agent in manager.iter_all_agents()]
+
+        # Assert
+        assert agent_ids == [agent_state.id]
+
     @pytest.mark.asyncio
     async def test_get_recent_cycles(
         self, clean_database, sample_improvement_cycle
@@ -182,24 +227,24 @@ class TestDatabaseManager:
         assert len(all_agents_after) == 0
 
     @pytest.mark.asyncio
-    async def test_get_status_connected(self, clean_database) -> None:
+    async def test_status_connected(self, clean_database) -> None:
         """Test getting database status when connected."""
         # Arrange
         manager = clean_database
 
         # Act & Assert
-        status = manager.get_status()
+        status = manager.status
         assert status == "Connected"
 
     @pytest.mark.asyncio
-    async def test_get_status_disconnected(self, clean_database) -> None:
+    async def test_status_disconnected(self, clean_database) -> None:
         """Test getting database status when disconnected."""
         # Arrange
         manager = clean_database
 
         # Act
         await manager.disconnect()
-        status = manager.get_status()
+        status = manager.status
 
         # Assert
         assert status == "Disconnected"
@@ -6,6 +6,7 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from novitas.core.models import AgentState
 from novitas.core.models import AgentStatus
@@ -14,7 +15,9 @@ from novitas.core.models import ChangeProposal
 from novitas.core.models import ImprovementCycle
 from novitas.core.models import ImprovementType
 from novitas.database.connection import DatabaseManagerImpl
+from novitas.database.connection import InMemoryDatabaseManager
 from novitas.database.connection import get_database_manager
+from novitas.database.repositories import AgentStateRepository
 
 
 class TestDatabaseManagerExtended:
@@ -27,7 +30,7 @@ class TestDatabaseManagerExtended:
 
         # Should not raise an exception
         await manager.connect()
-        assert manager.get_status() == "Connected"
+        assert manager.status == "Connected"
 
     @pytest.mark.asyncio
     async def test_disconnect_not_connected(self) -> None:
@@ -36,7 +39,7 @@ class TestDatabaseManagerExtended:
 
         # Should not raise an exception
         await manager.disconnect()
-        assert manager.get_status() == "Disconnected"
+        assert manager.status == "Disconnected"
 
     @pytest.mark.asyncio
     async def test_get_session_not_connected(self) -> None:
@@ -307,6 +310,11 @@ class TestDatabaseManagerExtended:
         manager = get_database_manager()
         assert isinstance(manager, DatabaseManagerImpl)
 
+    def test_get_database_manager_dry_run(self) -> None:
+        """Test get_database_manager returns an in-memory manager for dry runs."""
+        manager = get_database_manager(dry_run=True)
+        assert isinstance(manager, InMemoryDatabaseManager)
+
     @pytest.mark.asyncio
     async def test_session_reuse(self, clean_database) -> None:
         """Test that sessions are reused."""
@@ -359,3 +367,316 @@ class TestDatabaseManagerExtended:
         assert loaded2 is not None
         assert loaded2.id == agent2.id
         assert loaded2.name == agent2.name
+
+    @pytest.mark.asyncio
+    async def test_get_all_agents_served_from_cache(self, clean_database) -> None:
+        """Test that repeated reads are cached until the next write."""
+        manager = clean_database
+        agent1 = AgentState(
+            id=uuid4(),
+            agent_type=AgentType.CODE_AGENT,
+            name="Agent 1",
+            description="First agent",
+            status=AgentStatus.ACTIVE,
+            prompt="Test prompt 1",
+        )
+        agent2 = AgentState(
+            id=uuid4(),
+            agent_type=AgentType.TEST_AGENT,
+            name="Agent 2",
+            description="Second agent",
+            status=AgentStatus.ACTIVE,
+            prompt="Test prompt 2",
+        )
+
+        await manager.save_agent_state(agent1)
+        assert len(await manager.get_all_agents()) == 1
+
+        # Write behind the manager's back: the cached result is still served
+        session = await manager._get_session()
+        await AgentStateRepository(session).create(agent2)
+        assert len(await manager.get_all_agents()) == 1
+
+        # A write through the manager invalidates the cache
+        await manager.save_agent_state(agent1)
+        assert len(await manager.get_all_agents()) == 2
+
+    @pytest.mark.asyncio
+    async def test_load_agent_state_served_from_cache(self, clean_database) -> None:
+        """Test that repeated loads of one agent are served from the cache."""
+        manager = clean_database
+        agent = AgentState(
+            id=uuid4(),
+            agent_type=AgentType.CODE_AGENT,
+            name="Cached Agent",
+            description="Cached agent",
+            prompt="Test prompt",
+        )
+        await manager.save_agent_state(agent)
+
+        first = await manager.load_agent_state(agent.id)
+        with patch.object(AgentStateRepository, "get_by_id") as mock_get_by_id:
+            second = await manager.load_agent_state(agent.id)
+
+        mock_get_by_id.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_load_agent_state_does_not_cache_missing_agent(
+        self, clean_database
+    ) -> None:
+        """Test that an unknown agent is looked up again on the next load."""
+        manager = clean_database
+        agent = AgentState(
+            id=uuid4(),
+            agent_type=AgentType.CODE_AGENT,
+            name="Late Agent",
+            description="Created behind the manager's back",
+            prompt="Test prompt",
+        )
+
+        assert await manager.load_agent_state(agent.id) is None
+
+        session = await manager._get_session()
+        await AgentStateRepository(session).create(agent)
+        loaded = await manager.load_agent_state(agent.id)
+
+        assert loaded is not None
+        assert loaded.id == agent.id
+
+    @pytest.mark.asyncio
+    async def test_load_agent_state_cache_is_bounded(self, clean_database) -> None:
+        """Test that per-agent cache entries are capped by the LRU size."""
+        manager = clean_database
+        agents = [
+            AgentState(
+                id=uuid4(),
+                agent_type=AgentType.CODE_AGENT,
+                name=f"Agent {index}",
+                description="Bounded agent",
+                prompt="Test prompt",
+            )
+            for index in range(3)
+        ]
+        for agent in agents:
+            await manager.save_agent_state(agent)
+
+        with patch(
+            "novitas.database.connection.settings.database_cache_max_entries", 2
+        ):
+            for agent in agents:
+                await manager.load_agent_state(agent.id)
+
+        assert [key[0] for key in manager._result_cache] == [
+            f"load_agent_state:{agent.id}" for agent in agents[1:]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_latest_cycle_cache_invalidated_on_save(
+        self, clean_database
+    ) -> None:
+        """Test that saving a cycle invalidates the cached latest cycle."""
+        manager = clean_database
+
+        assert await manager.get_latest_cycle() is None
+
+        cycle = ImprovementCycle(id=uuid4(), cycle_number=1)
+        await manager.save_improvement_cycle(cycle)
+
+        latest = await manager.get_latest_cycle()
+        assert latest is not None
+        assert latest.id == cycle.id
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_copies(self, clean_database) -> None:
+        """Test that mutating a returned result does not corrupt the cache."""
+        manager = clean_database
+        agent = AgentState(
+            id=uuid4(),
+            agent_type=AgentType.CODE_AGENT,
+            name="Original",
+            description="Cached agent",
+            prompt="Test prompt",
+        )
+        await manager.save_agent_state(agent)
+        await manager.save_improvement_cycle(
+            ImprovementCycle(id=uuid4(), cycle_number=1)
+        )
+
+        (await manager.get_all_agents())[0].name = "Mutated"
+        (await manager.get_latest_cycle()).cycle_number = 99
+
+        assert (await manager.get_all_agents())[0].name == "Original"
+        assert (await manager.get_latest_cycle()).cycle_number == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_results_do_not_share_nested_fields(
+        self, clean_database
+    ) -> None:
+        """Test that unsaved in-place changes to nested fields do not leak."""
+        manager = clean_database
+        agent = AgentState(
+            id=uuid4(),
+            agent_type=AgentType.CODE_AGENT,
+            name="Nested",
+            description="Cached agent",
+            prompt="Test prompt",
+            performance_metrics={"total_executions": 1.0},
+        )
+        await manager.save_agent_state(agent)
+        await manager.save_improvement_cycle(
+            ImprovementCycle(id=uuid4(), cycle_number=1)
+        )
+
+        (await manager.load_agent_state(agent.id)).performance_metrics["leak"] = 1.0
+        (await manager.load_agent_state(agent.id)).memory["leak"] = True
+        (await manager.get_all_agents())[0].performance_metrics["leak"] = 1.0
+        (await manager.get_latest_cycle()).agents_used.append(uuid4())
+
+        reloaded = await manager.load_agent_state(agent.id)
+        assert reloaded.performance_metrics == {"total_executions": 1.0}
+        assert reloaded.memory == {}
+        assert (await manager.get_all_agents())[0].performance_metrics == {
+            "total_executions": 1.0
+        }
+        assert (await manager.get_latest_cycle()).agents_used == []
+
+    @pytest.mark.asyncio
+    async def test_reads_inside_unit_of_work_are_not_cached(
+        self, clean_database
+    ) -> None:
+        """Test that rows read before a rollback are not served afterwards."""
+        manager = clean_database
+        agent = AgentState(
+            id=uuid4(),
+            agent_type=AgentType.CODE_AGENT,
+            name="Rolled Back",
+            description="Never committed",
+            prompt="Test prompt",
+        )
+
+        with pytest.raises(RuntimeError):
+            async with manager.transaction():
+                await manager.save_agent_state(agent)
+                assert await manager.load_agent_state(agent.id) is not None
+                raise RuntimeError("abort")
+
+        assert manager._result_cache == {}
+        assert await manager.load_agent_state(agent.id) is None
+
+    @pytest.mark.asyncio
+    async def test_result_cache_evicts_least_recently_used(
+        self, clean_database
+    ) -> None:
+        """Test that the cache never grows past its configured size."""
+        manager = clean_database
+
+        with patch(
+            "novitas.database.connection.settings.database_cache_max_entries", 1
+        ):
+            await manager.get_all_agents()
+            await manager.get_latest_cycle()
+
+        assert [key[0] for key in manager._result_cache] == ["get_latest_cycle"]
+
+    @pytest.mark.asyncio
+    async def test_result_cache_disabled_with_zero_ttl(self, clean_database) -> None:
+        """Test that a zero TTL disables the read-result cache."""
+        manager = clean_database
+
+        with patch(
+            "novitas.database.connection.settings.database_cache_ttl_seconds", 0
+        ):
+            await manager.get_all_agents()
+
+        assert manager._result_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_connect_skips_create_all_when_auto_create_disabled(self) -> None:
+        """Test that connect() leaves schema management to migrations."""
+        manager = DatabaseManagerImpl()
+
+        with (
+            patch(
+                "novitas.database.connection.settings.database_url",
+                "sqlite+aiosqlite:///:memory:",
+            ),
+            patch("novitas.database.connection.settings.database_auto_create", False),
+            patch("novitas.database.connection.settings.debug", False),
+        ):
+            await manager.connect()
+
+        try:
+            with pytest.raises(Exception, match="no such table"):
+                await manager.get_all_agents()
+        finally:
+            await manager.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connect_prewarms_connection_pool(self, tmp_path) -> None:
+        """Test that connect() opens the configured pool of connections."""
+        manager = DatabaseManagerImpl()
+
+        with (
+            patch(
+                "novitas.database.connection.settings.database_url",
+                f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            ),
+            patch("novitas.database.connection.settings.database_pool_size", 3),
+        ):
+            await manager.connect()
+
+        try:
+            assert isinstance(manager._engine.pool, AsyncAdaptedQueuePool)
+            assert manager._engine.pool.checkedin() == 3
+        finally:
+            await manager.disconnect()
+
+
+class TestInMemoryDatabaseManager:
+    """Test the dict-backed database manager used for dry runs."""
+
+    @pytest.mark.asyncio
+    async def test_agent_state_round_trip(self) -> None:
+        """Test saved agent states can be loaded back."""
+        manager = InMemoryDatabaseManager()
+        await manager.connect()
+        agent_state = AgentState(
+            agent_type=AgentType.CODE_AGENT,
+            name="Dry Run Agent",
+            description="Agent used in a dry run",
+            prompt="Analyze code",
+        )
+
+        async with manager.transaction():
+            await manager.save_agent_state(agent_state)
+
+        assert await manager.load_agent_state(agent_state.id) == agent_state
+        assert await manager.load_agent_states([agent_state.id, uuid4()]) == [
+            agent_state
+        ]
+        assert manager.status == "Connected (in-memory)"
+
+    @pytest.mark.asyncio
+    async def test_change_proposals_filtered_by_cycle(self) -> None:
+        """Test proposals are returned for their own cycle only."""
+        manager = InMemoryDatabaseManager()
+        cycle_id = uuid4()
+        proposals = [
+            ChangeProposal(
+                agent_id=uuid4(),
+                cycle_id=owner,
+                improvement_type=ImprovementType.CODE_IMPROVEMENT,
+                file_path="src/example.py",
+                description="Improve example",
+                reasoning="It can be better",
+                proposed_changes={},
+                confidence_score=0.5,
+            )
+            for owner in (cycle_id, uuid4())
+        ]
+
+        await manager.save_change_proposals(proposals)
+
+        assert await manager.get_change_proposals(cycle_id) == [proposals[0]]
@@ -1,12 +1,17 @@
 """Tests for SQLAlchemy database models."""
 
+from uuid import uuid4
+
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from novitas.core.models import AgentStatus
 from novitas.core.models import AgentType
 from novitas.core.models import ImprovementType
+from novitas.database.models import AgentActionModel
 from novitas.database.models import AgentStateModel
 from novitas.database.models import ChangeProposalModel
 from novitas.database.models import ImprovementCycleModel
@@ -70,6 +75,58 @@ class TestAgentStateModel:
         saved_agent = result.scalar_one()
         assert saved_agent.memory == memory_data
 
+    @pytest.mark.asyncio
+    async def test_agent_state_relationships_eager_load(
+        self, async_session: AsyncSession
+    ) -> None:
+        """Test that agent children load via selectinload and never lazily."""
+        # Arrange
+        async_session.add_all(
+            [
+                AgentStateModel(
+                    id="test-id",
+                    agent_type=AgentType.CODE_AGENT,
+                    name="Test Agent",
+                    prompt="Test prompt",
+                ),
+                AgentActionModel(
+                    id="action-id",
+                    agent_id="test-id",
+                    action_type="analyze",
+                    details={},
+                ),
+                ChangeProposalModel(
+                    id="proposal-id",
+                    agent_id="test-id",
+                    improvement_type=ImprovementType.CODE_IMPROVEMENT,
+                    file_path="src/test.py",
+                    description="Test improvement",
+                    reasoning="Test reasoning",
+                    proposed_changes={},
+                    confidence_score=0.8,
+                ),
+            ]
+        )
+        await async_session.commit()
+        async_session.expunge_all()
+
+        # Act
+        result = await async_session.execute(
+            select(AgentStateModel).options(
+                selectinload(AgentStateModel.actions),
+                selectinload(AgentStateModel.proposals),
+            )
+        )
+        saved_agent = result.scalar_one()
+        async_session.expunge_all()
+        lazy_agent = (await async_session.execute(select(AgentStateModel))).scalar_one()
+
+        # Assert
+        assert [action.id for action in saved_agent.actions] == ["action-id"]
+        assert [proposal.id for proposal in saved_agent.proposals] == ["proposal-id"]
+        with pytest.raises(InvalidRequestError):
+            _ = lazy_agent.actions
+
 
 class TestChangeProposalModel:
     """Test ChangeProposalModel."""
@@ -139,12 +196,13 @@ class TestImprovementCycleModel:
     async def test_create_improvement_cycle(self, async_session: AsyncSession) -> None:
         """Test creating an improvement cycle."""
         # Arrange
+        agent1, agent2, change1, change2 = (uuid4() for _ in range(4))
         cycle = ImprovementCycleModel(
             id="test-id",
             cycle_number=1,
-            agents_used=["agent1", "agent2"],
-            changes_proposed=["change1", "change2"],
-            changes_accepted=["change1"],
+            agents_used=[agent1, agent2],
+            changes_proposed=[change1, change2],
+            changes_accepted=[change1],
             success=True,
         )
 
@@ -158,20 +216,20 @@ class TestImprovementCycleModel:
         )
         saved_cycle = result.scalar_one()
         assert saved_cycle.cycle_number == 1
-        assert saved_cycle.agents_used == ["agent1", "agent2"]
-        assert saved_cycle.changes_proposed == ["change1", "change2"]
-        assert saved_cycle.changes_accepted == ["change1"]
+        assert saved_cycle.agents_used == [agent1, agent2]
+        assert saved_cycle.changes_proposed == [change1, change2]
+        assert saved_cycle.changes_accepted == [change1]
         assert saved_cycle.success is True
 
     @pytest.mark.asyncio
     async def test_improvement_cycle_lists_json(
         self, async_session: AsyncSession
     ) -> None:
-        """Test that cycle lists are stored as JSON."""
+        """Test that cycle lists round-trip as lists of UUIDs."""
         # Arrange
-        agents_used = ["agent1", "agent2", "agent3"]
-        changes_proposed = ["change1", "change2"]
-        changes_accepted = ["change1"]
+        agents_used = [uuid4(), uuid4(), uuid4()]
+        changes_proposed = [uuid4(), uuid4()]
+        changes_accepted = changes_proposed[:1]
 
         cycle = ImprovementCycleModel(
             id="test-id",
@@ -193,3 +251,21 @@ class TestImprovementCycleModel:
         assert saved_cycle.agents_used == agents_used
         assert saved_cycle.changes_proposed == changes_proposed
         assert saved_cycle.changes_accepted == changes_accepted
+
+    @pytest.mark.asyncio
+    async def test_start_time_default(self, async_session: AsyncSession) -> None:
+        """Test that start_time is filled in when omitted."""
+        # Arrange
+        cycle = ImprovementCycleModel(id="test-id", cycle_number=1)
+
+        # Act
+        async_session.add(cycle)
+        await async_session.commit()
+
+        # Assert
+        result = await async_session.execute(
+            select(ImprovementCycleModel.start_time).where(
+                ImprovementCycleModel.id == "test-id"
+            )
+        )
+        assert result.scalar_one() is not None
@@ -2,6 +2,7 @@
 
 from datetime import UTC
 from datetime import datetime
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -158,6 +159,113 @@ class TestAgentStateRepository:
         assert agent1.id in agent_ids
         assert agent2.id in agent_ids
 
+    @pytest.mark.asyncio
+    async def test_get_by_ids(self, async_session) -> None:
+        """Test getting several agent states in one query."""
+        repository = AgentStateRepository(async_session)
+        agents = [
+            AgentState(
+                id=uuid4(),
+                agent_type=AgentType.CODE_AGENT,
+                name=f"Agent {i}",
+                description="Bulk agent",
+                prompt="Prompt",
+            )
+            for i in range(3)
+        ]
+        for agent in agents:
+            await repository.create(agent)
+
+        requested = [str(agents[2].id), str(uuid4()), str(agents[0].id)]
+        loaded = await repository.get_by_ids(requested)
+
+        assert [agent.id for agent in loaded] == [agents[2].id, agents[0].id]
+        assert await repository.get_by_ids([]) == []
+
+    @pytest.mark.asyncio
+    async def test_create_many_agent_states(self, async_session) -> None:
+        """Test bulk-creating agent states."""
+        repository = AgentStateRepository(async_session)
+        agents = [
+            AgentState(
+                agent_type=AgentType.CODE_AGENT,
+                name=f"Agent {i}",
+                description="Bulk agent",
+                prompt="Prompt",
+            )
+            for i in range(5)
+        ]
+
+        await repository.create_many(agents)
+
+        all_agents = await repository.get_all()
+        assert {agent.id for agent in all_agents} == {agent.id for agent in agents}
+
+    @pytest.mark.asyncio
+    async def test_get_by_status(self, async_session) -> None:
+        """Test getting agent states filtered by status."""
+        repository = AgentStateRepository(async_session)
+        active, inactive = (
+            AgentState(
+                agent_type=AgentType.CODE_AGENT,
+                name=status.value,
+                description="Status agent",
+                status=status,
+                prompt="Prompt",
+            )
+            for status in (AgentStatus.ACTIVE, AgentStatus.INACTIVE)
+        )
+        await repository.create_many([active, inactive])
+
+        loaded = await repository.get_by_status(AgentStatus.INACTIVE)
+        streamed = [
+            agent async for agent in repository.iter_by_status(AgentStatus.ACTIVE)
+        ]
+
+        assert [agent.id for agent in loaded] == [inactive.id]
+        assert [agent.id for agent in streamed] == [active.id]
+
+    @pytest.mark.asyncio
+    async def test_transaction_commits_once(self, async_session) -> None:
+        """Test that writes inside a transaction share a single commit."""
+        repository = AgentStateRepository(async_session)
+        agent = AgentState(
+            agent_type=AgentType.CODE_AGENT,
+            name="Agent",
+            description="Transactional agent",
+            prompt="Prompt",
+        )
+
+        with patch.object(
+            async_session, "commit", wraps=async_session.commit
+        ) as mock_commit:
+            async with repository.transaction():
+                await repository.create(agent)
+                await repository.update(agent.model_copy(update={"version": 2}))
+
+        assert mock_commit.call_count == 1
+        loaded = await repository.get_by_id(str(agent.id))
+        assert loaded is not None
+        assert loaded.version == 2
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back_on_error(self, async_session) -> None:
+        """Test that a failing transaction discards its writes."""
+        repository = AgentStateRepository(async_session)
+        agent = AgentState(
+            agent_type=AgentType.CODE_AGENT,
+            name="Agent",
+            description="Rolled back agent",
+            prompt="Prompt",
+        )
+
+        with pytest.raises(RuntimeError):
+            async with repository.transaction():
+                await repository.create(agent)
+                raise RuntimeError("boom")
+
+        assert await repository.get_all() == []
+
     @pytest.mark.asyncio
     async def test_get_all_empty(self, async_session) -> None:
         """Test getting all agent states when none exist."""
@@ -308,6 +416,7 @@ class TestChangeProposalRepository:
         # Create proposals for the same cycle
         proposal1 = ChangeProposal(
             agent_id=uuid4(),
+            cycle_id=cycle_id,
             improvement_type=ImprovementType.CODE_IMPROVEMENT,
             file_path="src/file1.py",
             description="First improvement",
@@ -317,6 +426,7 @@ class TestChangeProposalRepository:
         )
         proposal2 = ChangeProposal(
             agent_id=uuid4(),
+            cycle_id=cycle_id,
             improvement_type=ImprovementType.TEST_IMPROVEMENT,
             file_path="src/file2.py",
             description="Second improvement",
@@ -324,15 +434,45 @@ class TestChangeProposalRepository:
             proposed_changes={"change2": "content2"},
             confidence_score=0.9,
         )
+        # And one for another cycle
+        other_proposal = proposal1.model_copy(
+            update={"id": uuid4(), "cycle_id": uuid4()}
+        )
 
         await repository.create(proposal1)
         await repository.create(proposal2)
+        await repository.create(other_proposal)
 
-        # Get proposals by cycle ID (currently returns all since cycle_id filtering isn't implemented)
         proposals = await repository.get_by_cycle_id(str(cycle_id))
 
-        # Should return all proposals since filtering isn't implemented yet
-        assert len(proposals) >= 2
+        assert {proposal.id for proposal in proposals} == {proposal1.id, proposal2.id}
+        assert all(proposal.cycle_id == cycle_id for proposal in proposals)
+
+    @pytest.mark.asyncio
+    async def test_create_many_change_proposals(self, async_session) -> None:
+        """Test bulk-creating change proposals."""
+        repository = ChangeProposalRepository(async_session)
+        proposals = [
+            ChangeProposal(
+                agent_id=uuid4(),
+                improvement_type=ImprovementType.CODE_IMPROVEMENT,
+                file_path=f"src/file{i}.py",
+                description=f"Improvement {i}",
+                reasoning="Bulk reasoning",
+                proposed_changes={"index": i},
+                confidence_score=0.5,
+            )
+            for i in range(3)
+        ]
+
+        await repository.create_many(proposals)
+        await repository.create_many([])
+
+        for proposal in proposals:
+            loaded = await repository.get_by_id(str(proposal.id))
+            assert loaded is not None
+            assert loaded.file_path == proposal.file_path
+            assert loaded.proposed_changes == proposal.proposed_changes
 
     @pytest.mark.asyncio
     async def test_change_proposal_with_complex_changes(self, async_session) -> None:
@@ -531,6 +671,34 @@ class TestImprovementCycleRepository:
         recent = await repository.get_recent(5)
         assert len(recent) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_recent_with_proposals(self, async_session) -> None:
+        """Test loading recent cycles with their proposals eagerly."""
+        repository = ImprovementCycleRepository(async_session)
+        proposal_repository = ChangeProposalRepository(async_session)
+        cycles = [ImprovementCycle(cycle_number=i) for i in range(1, 3)]
+        await repository.create_many(cycles)
+        proposal = ChangeProposal(
+            agent_id=uuid4(),
+            cycle_id=cycles[0].id,
+            improvement_type=ImprovementType.CODE_IMPROVEMENT,
+            file_path="src/file.py",
+            description="Improvement",
+            reasoning="Reasoning",
+            proposed_changes={},
+            confidence_score=0.5,
+        )
+        await proposal_repository.create(proposal)
+
+        recent = await repository.get_recent_with_proposals(5)
+
+        assert [
+            (cycle.id, [p.id for p in proposals]) for cycle, proposals in recent
+        ] == [
+            (cycles[1].id, []),
+            (cycles[0].id, [proposal.id]),
+        ]
+
     @pytest.mark.asyncio
     async def test_improvement_cycle_with_agents_and_changes(
         self, async_session
@@ -24,7 +24,7 @@ async def test_database_basic_operations() -> None:
 
         # Connect
         await db_manager.connect()
-        assert db_manager.get_status() == "Connected"
+        assert db_manager.status == "Connected"
 
         # Create and save agent state
         agent_state = AgentState(
@@ -62,7 +62,7 @@ async def test_database_basic_operations() -> None:
 
         # Disconnect
         await db_manager.disconnect()
-        assert db_manager.get_status() == "Disconnected"
+        assert db_manager.status == "Disconnected"
 
     finally:
         # Restore original settings
@@ -10,6 +10,8 @@ from pydantic import Field
 
 from novitas.core.exceptions import LLMProviderError
 from novitas.llm.provider import LLMConfig
+from novitas.llm.provider import _provider_cache
+from novitas.llm.provider import _structured_cache
 from novitas.llm.provider import create_llm_provider
 from novitas.llm.provider import generate_response
 from novitas.llm.provider import generate_structured_response
@@ -64,6 +66,12 @@ class TestLLMConfig:
 class TestCreateLLMProvider:
     """Test create_llm_provider function."""
 
+    @pytest.fixture(autouse=True)
+    def empty_provider_cache(self):
+        """Start every test without cached providers."""
+        with patch.dict("novitas.llm.provider._provider_cache", clear=True):
+            yield
+
     def test_create_openai_provider(self):
         """Test creating OpenAI provider."""
         config = LLMConfig(model="gpt-4o-mini", api_key="test-key")
@@ -94,6 +102,34 @@ class TestCreateLLMProvider:
             )
             assert provider == mock_model
 
+    def test_create_provider_reuses_cached_instance(self):
+        """Test that an identical config reuses the built provider."""
+        config = LLMConfig(model="gpt-4o-mini", api_key="test-key")
+
+        with patch("novitas.llm.provider.init_chat_model") as mock_init_chat_model:
+            first = create_llm_provider(config)
+            second = create_llm_provider(config.model_copy())
+            other = create_llm_provider(config.model_copy(update={"temperature": 0.5}))
+
+            assert first is second
+            assert other is not None
+            assert mock_init_chat_model.call_count == 2
+
+    def test_provider_cache_is_bounded_and_hides_api_key(self):
+        """Test the cache evicts old providers and never stores the raw key."""
+        with (
+            patch("novitas.llm.provider.init_chat_model"),
+            patch("novitas.llm.provider._PROVIDER_CACHE_SIZE", 2),
+        ):
+            for index in range(3):
+                create_llm_provider(
+                    LLMConfig(model="gpt-4o-mini", api_key=f"secret-{index}")
+                )
+
+        keys = list(_provider_cache)
+        assert len(keys) == 2
+        assert not any(f"secret-{index}" in key for key in keys for index in range(3))
+
     def test_create_provider_error(self):
         """Test handling initialization errors."""
         config = LLMConfig(model="gpt-4o-mini", api_key="test-key")
@@ -159,6 +195,12 @@ class TestGenerateResponse:
 class TestGenerateStructuredResponse:
     """Test generate_structured_response function."""
 
+    @pytest.fixture(autouse=True)
+    def empty_structured_cache(self):
+        """Start every test without cached structured-output wrappers."""
+        with patch.dict("novitas.llm.provider._structured_cache", clear=True):
+            yield
+
     @pytest.fixture
     def mock_provider(self):
         """Create a mock provider for testing."""
@@ -213,6 +255,39 @@ class TestGenerateStructuredResponse:
         assert response.answer == "Test answer"
         mock_provider.ainvoke.assert_called_once_with(messages)
 
+    @pytest.mark.asyncio
+    async def test_generate_structured_response_reuses_wrapper(self, mock_provider):
+        """Test that the structured-output wrapper is built once per schema."""
+
+        class TestSchema(BaseModel):
+            answer: str = Field(description="The answer")
+
+        mock_provider.ainvoke.return_value = TestSchema(answer="Test answer")
+
+        await generate_structured_response(mock_provider, "First", TestSchema)
+        await generate_structured_response(mock_provider, "Second", TestSchema)
+
+        mock_provider.with_structured_output.assert_called_once_with(TestSchema)
+        assert mock_provider.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_structured_cache_evicts_least_recently_used(self):
+        """Test one-off providers are dropped once the cache is full."""
+
+        class TestSchema(BaseModel):
+            answer: str = Field(description="The answer")
+
+        providers = [AsyncMock() for _ in range(3)]
+        for provider in providers:
+            provider.with_structured_output = MagicMock(return_value=provider)
+
+        with patch("novitas.llm.provider._STRUCTURED_CACHE_SIZE", 2):
+            for provider in providers:
+                await generate_structured_response(provider, "Prompt", TestSchema)
+
+        cached_providers = [entry[0] for entry in _structured_cache.values()]
+        assert cached_providers == providers[1:]
+
     @pytest.mark.asyncio
     async def test_generate_structured_response_error(self, mock_provider):
         """Test handling of structured response errors."""
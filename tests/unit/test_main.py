@@ -1,17 +1,118 @@
 """Tests for the main module."""
 
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 
 from novitas.core.exceptions import ImprovementCycleError
+from novitas.core.models import ChangeProposal
+from novitas.core.models import ImprovementType
+from novitas.database.connection import InMemoryDatabaseManager
+from novitas.main import main
 from novitas.main import run_improvement_cycle
 
 
 class TestMain:
     """Test main module functionality."""
 
+    @pytest.fixture
+    def database_manager(self):
+        """Create an in-memory database manager for the cycle."""
+        return InMemoryDatabaseManager()
+
+    @pytest.fixture
+    def proposal(self):
+        """Create a proposal returned by the orchestrator."""
+        return ChangeProposal(
+            agent_id=uuid4(),
+            file_path="README.md",
+            description="Clarify setup",
+            reasoning="Setup steps are missing",
+            improvement_type=ImprovementType.DOCUMENTATION_IMPROVEMENT,
+            proposed_changes={"section": "Installation"},
+            confidence_score=0.8,
+        )
+
+    @pytest.fixture
+    def orchestrator(self, proposal):
+        """Create an orchestrator stub that returns one proposal."""
+        orchestrator = MagicMock()
+        orchestrator.create_specialized_agent = AsyncMock(return_value=uuid4())
+        orchestrator.managed_agents = {}
+        orchestrator.execute = AsyncMock(return_value=[proposal])
+        orchestrator.monitor_agent_performance = AsyncMock(
+            return_value={"total_agents": 0, "agent_performance": {}}
+        )
+        orchestrator.get_performance_metrics.return_value = {}
+        orchestrator.cleanup = AsyncMock()
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_run_improvement_cycle_saves_cycle_with_proposals(
+        self, database_manager, orchestrator, proposal
+    ) -> None:
+        """Test the cycle is saved so its proposals reference an existing row."""
+        with (
+            patch(
+                "novitas.main.initialize_system_components",
+                AsyncMock(return_value=(database_manager, None, {})),
+            ),
+            patch(
+                "novitas.main.create_orchestrator_agent",
+                AsyncMock(return_value=orchestrator),
+            ),
+        ):
+            await run_improvement_cycle(dry_run=True)
+
+        cycle = await database_manager.get_latest_cycle()
+        assert cycle is not None
+        assert cycle.changes_proposed == [proposal.id]
+        saved = await database_manager.get_change_proposals(cycle.id)
+        assert [saved_proposal.id for saved_proposal in saved] == [proposal.id]
+
+    @pytest.mark.asyncio
+    async def test_run_improvement_cycle_rolls_back_cycle_with_proposals(
+        self, clean_database, orchestrator
+    ) -> None:
+        """Test a failed proposal batch also discards the cycle row."""
+        clean_database.save_change_proposals = AsyncMock(
+            side_effect=RuntimeError("disk full")
+        )
+
+        with (
+            patch(
+                "novitas.main.initialize_system_components",
+                AsyncMock(return_value=(clean_database, None, {})),
+            ),
+            patch(
+                "novitas.main.create_orchestrator_agent",
+                AsyncMock(return_value=orchestrator),
+            ),
+            pytest.raises(ImprovementCycleError, match="disk full"),
+        ):
+            await run_improvement_cycle()
+
+        assert await clean_database.get_latest_cycle() is None
+
+    @pytest.mark.asyncio
+    async def test_main_closes_message_brokers_on_failure(self) -> None:
+        """Test the shared brokers are closed even when the cycle fails."""
+        with (
+            patch(
+                "novitas.main.run_improvement_cycle",
+                AsyncMock(side_effect=ImprovementCycleError("boom")),
+            ),
+            patch("novitas.main.close_message_brokers") as mock_close,
+            pytest.raises(ImprovementCycleError),
+        ):
+            await main()
+
+        mock_close.assert_awaited_once()
+
     @pytest.mark.asyncio
     @pytest.mark.slow
     async def test_run_improvement_cycle_success(self) -> None:
@@ -0,0 +1 @@
+"""Messaging layer unit tests."""
@@ -0,0 +1,444 @@
+"""Tests for the Redis message broker."""
+
+import asyncio
+from datetime import UTC
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import orjson
+import pytest
+import pytest_asyncio
+
+from novitas.core.exceptions import MessageBrokerError
+from novitas.core.models import AgentMessage
+from novitas.core.models import MessageType
+from novitas.messaging.broker import _MESSAGE_ADAPTER
+from novitas.messaging.broker import RedisMessageBroker
+from novitas.messaging.broker import _channel_key
+from novitas.messaging.broker import _encode_message
+from novitas.messaging.broker import close_message_brokers
+from novitas.messaging.broker import get_message_broker
+
+
+class TestMessageEncoding:
+    """Test the orjson wire format against the AgentMessage model."""
+
+    @pytest.fixture
+    def outgoing(self):
+        """Create an outgoing message with UUID, datetime and enum fields."""
+        return {
+            "sender_id": uuid4(),
+            "type": MessageType.COMMAND,
+            "content": "run",
+            "metadata": {"attempt": 1},
+            "timestamp": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        }
+
+    def test_encoded_message_validates_as_agent_message(self, outgoing):
+        """Test an encoded payload round-trips through the message adapter."""
+        # Arrange
+        recipient_id = uuid4()
+
+        # Act
+        message_id, message_type, data = _encode_message(outgoing, recipient_id, "text")
+        message = _MESSAGE_ADAPTER.validate_json(data)
+
+        # Assert
+        assert message == AgentMessage(
+            id=message_id,
+            sender_id=outgoing["sender_id"],
+            recipient_id=recipient_id,
+            message_type=message_type,
+            content="run",
+            metadata={"attempt": 1},
+            timestamp=outgoing["timestamp"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_received_message_validates_as_agent_message(self, outgoing):
+        """Test a queued payload from receive_message validates as a message."""
+        # Arrange
+        broker = RedisMessageBroker("redis://localhost:6379/0")
+        _, _, data = _encode_message(outgoing, None, "text")
+        broker._redis = MagicMock()
+        broker._redis.rpop = AsyncMock(return_value=data)
+
+        # Act
+        received = await broker.receive_message(uuid4())
+        message = AgentMessage.model_validate(received)
+
+        # Assert
+        assert message.sender_id == outgoing["sender_id"]
+        assert message.message_type is MessageType.COMMAND
+        assert message.timestamp == outgoing["timestamp"]
+        assert message.is_broadcast
+
+
+class TestMessageRouting:
+    """Test routing of pub/sub messages to subscribers."""
+
+    @pytest.fixture
+    def broker(self):
+        """Create a broker that is not connected to Redis."""
+        return RedisMessageBroker("redis://localhost:6379/0")
+
+    @pytest.mark.asyncio
+    async def test_direct_message_reaches_recipient_only(self, broker):
+        """Test a message is delivered to its recipient's subscribers."""
+        # Arrange
+        recipient_id = uuid4()
+        recipient_callback = AsyncMock()
+        other_callback = AsyncMock()
+        broker.subscribe(recipient_id, recipient_callback)
+        broker.subscribe(uuid4(), other_callback)
+        message = AgentMessage(
+            sender_id=uuid4(),
+            recipient_id=recipient_id,
+            message_type=MessageType.TEXT,
+            content="hello",
+        )
+
+        # Act
+        await broker._route_message(message.model_dump_json())
+
+        # Assert
+        recipient_callback.assert_awaited_once_with(message)
+        other_callback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_message_reaches_all_subscribers(self, broker):
+        """Test a message without recipient is delivered to every subscriber."""
+        # Arrange
+        callbacks = [AsyncMock(), AsyncMock()]
+        for callback in callbacks:
+            broker.subscribe(uuid4(), callback)
+        message = AgentMessage(
+            sender_id=uuid4(),
+            message_type=MessageType.STATUS,
+            content="ping",
+            is_broadcast=True,
+        )
+
+        # Act
+        await broker._route_message(message.model_dump_json())
+
+        # Assert
+        for callback in callbacks:
+            callback.assert_awaited_once_with(message)
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_block_others(self, broker):
+        """Test an exception in one callback does not stop delivery."""
+        # Arrange
+        recipient_id = uuid4()
+        failing_callback = AsyncMock(side_effect=RuntimeError("boom"))
+        callback = AsyncMock()
+        broker.subscribe(recipient_id, failing_callback)
+        broker.subscribe(recipient_id, callback)
+        message = AgentMessage(
+            sender_id=uuid4(),
+            recipient_id=recipient_id,
+            message_type=MessageType.COMMAND,
+            content="run",
+        )
+
+        # Act
+        await broker._route_message(message.model_dump_json())
+
+        # Assert
+        failing_callback.assert_awaited_once_with(message)
+        callback.assert_awaited_once_with(message)
+
+
+class FakePubSub:
+    """In-memory pub/sub that only delivers on subscribed channels."""
+
+    def __init__(self):
+        self.channels = set()
+        self.subscribe = AsyncMock(side_effect=lambda *c: self.channels.update(c))
+        self.unsubscribe = AsyncMock(
+            side_effect=lambda *c: self.channels.difference_update(c)
+        )
+        self._messages = asyncio.Queue()
+
+    @property
+    def subscribed(self):
+        return bool(self.channels)
+
+    def publish(self, channel, data):
+        if channel in self.channels:
+            self._messages.put_nowait({"channel": channel, "data": data})
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        try:
+            return await asyncio.wait_for(self._messages.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class TestSubscriptions:
+    """Test batched channel subscriptions and the pub/sub listener."""
+
+    @pytest_asyncio.fixture
+    async def broker(self):
+        """Create a broker running its background tasks on a fake pub/sub."""
+        broker = RedisMessageBroker("redis://localhost:6379/0")
+        broker._pubsub = FakePubSub()
+        tasks = [
+            asyncio.create_task(broker._sync_subscriptions()),
+            asyncio.create_task(broker._listen_for_messages()),
+        ]
+        yield broker
+        broker._shutdown_event.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_consecutive_subscribes_send_one_command(self, broker):
+        """Test back-to-back subscribe() calls coalesce into one SUBSCRIBE."""
+        # Arrange
+        agent_ids = [uuid4() for _ in range(3)]
+
+        # Act
+        for agent_id in agent_ids:
+            broker.subscribe(agent_id, AsyncMock())
+        await asyncio.sleep(0)
+
+        # Assert
+        broker._pubsub.subscribe.assert_awaited_once()
+        assert set(broker._pubsub.subscribe.await_args.args) == {
+            _channel_key(agent_id) for agent_id in agent_ids
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("existing_subscribers", [0, 1])
+    async def test_listener_receives_channel_added_while_polling(
+        self, broker, existing_subscribers
+    ):
+        """Test the running listener delivers on a newly subscribed channel."""
+        # Arrange
+        for _ in range(existing_subscribers):
+            broker.subscribe(uuid4(), AsyncMock())
+        await asyncio.sleep(0)
+        delivered = asyncio.Event()
+        recipient_id = uuid4()
+        callback = AsyncMock(side_effect=lambda _: delivered.set())
+        message = AgentMessage(
+            sender_id=uuid4(),
+            recipient_id=recipient_id,
+            message_type=MessageType.TEXT,
+            content="hello",
+        )
+
+        # Act
+        broker.subscribe(recipient_id, callback)
+        await asyncio.sleep(0)
+        broker._pubsub.publish(_channel_key(recipient_id), message.model_dump_json())
+        # Shorter than the idle listener's 1s fallback poll
+        await asyncio.wait_for(delivered.wait(), timeout=0.5)
+
+        # Assert
+        assert broker._pubsub.subscribe.await_count == existing_subscribers + 1
+        callback.assert_awaited_once_with(message)
+
+
+class TestReceiveMessages:
+    """Test draining an agent's message queue in one round-trip."""
+
+    @pytest.mark.asyncio
+    async def test_receive_messages_returns_oldest_first(self):
+        """Test batched receive drains the queue tail in arrival order."""
+        # Arrange
+        broker = RedisMessageBroker("redis://localhost:6379/0")
+        agent_id = uuid4()
+        pipe = MagicMock()
+        # LRANGE returns the tail newest-to-oldest because sends LPUSH to the head
+        pipe.execute = AsyncMock(
+            return_value=[
+                [
+                    orjson.dumps({"content": "second"}),
+                    orjson.dumps({"content": "first"}),
+                ],
+                True,
+            ]
+        )
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        broker._redis = MagicMock()
+        broker._redis.pipeline.return_value = pipe
+
+        # Act
+        messages = await broker.receive_messages(agent_id, max_messages=2)
+
+        # Assert
+        assert [message["content"] for message in messages] == ["first", "second"]
+        broker._redis.pipeline.assert_called_once_with(transaction=True)
+        pipe.lrange.assert_called_once_with(f"agent_queue:{agent_id}".encode(), -2, -1)
+        pipe.ltrim.assert_called_once_with(f"agent_queue:{agent_id}".encode(), 0, -3)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_messages", [0, -1])
+    async def test_receive_messages_rejects_non_positive_limit(self, max_messages):
+        """Test a limit below one fails instead of redelivering the whole queue."""
+        broker = RedisMessageBroker("redis://localhost:6379/0")
+        broker._redis = MagicMock()
+
+        with pytest.raises(ValueError, match="max_messages must be at least 1"):
+            await broker.receive_messages(uuid4(), max_messages=max_messages)
+
+        broker._redis.pipeline.assert_not_called()
+
+
+class TestBrokerSharing:
+    """Test that brokers and their connections are shared."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def close_shared_brokers(self):
+        """Drop the shared brokers created by each test."""
+        yield
+        await close_message_brokers()
+
+    def test_get_message_broker_reuses_instance_per_url(self):
+        """Test the same URL returns the same broker instance."""
+        url = "redis://localhost:6379/0"
+
+        assert get_message_broker(url) is get_message_broker(url)
+        assert get_message_broker(url) is not get_message_broker(
+            "redis://localhost:6380/0"
+        )
+
+    def test_get_message_broker_is_shared_per_event_loop(self):
+        """Test each event loop gets its own broker for the same URL."""
+
+        async def get_broker():
+            return get_message_broker("redis://localhost:6379/0")
+
+        brokers = []
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                brokers.append(
+                    (
+                        loop.run_until_complete(get_broker()),
+                        loop.run_until_complete(get_broker()),
+                    )
+                )
+            finally:
+                loop.close()
+
+        (first, first_again), (second, _) = brokers
+        assert first is first_again
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_close_message_brokers_disconnects_shared_broker(self):
+        """Test the close hook disconnects and forgets the shared broker."""
+        # Arrange
+        url = "redis://localhost:6379/0"
+        client = MagicMock()
+        client.ping = AsyncMock()
+        client.close = AsyncMock()
+        client.pubsub.return_value.close = AsyncMock()
+        broker = get_message_broker(url)
+
+        # Act
+        with patch("novitas.messaging.broker.redis.from_url", return_value=client):
+            await broker.connect()
+            await close_message_brokers()
+
+        # Assert
+        client.close.assert_awaited_once()
+        assert get_message_broker(url) is not broker
+
+    @pytest.mark.asyncio
+    async def test_connect_is_idempotent(self):
+        """Test connecting twice opens a single Redis connection."""
+        # Arrange
+        broker = RedisMessageBroker("redis://localhost:6379/0")
+        client = MagicMock()
+        client.ping = AsyncMock()
+        client.close = AsyncMock()
+        client.pubsub.return_value.close = AsyncMock()
+
+        # Act
+        with patch(
+            "novitas.messaging.broker.redis.from_url", return_value=client
+        ) as from_url:
+            await broker.connect()
+            await broker.connect()
+            await broker.disconnect()
+
+        # Assert
+        from_url.assert_called_once()
+        client.ping.assert_awaited_once()
+
+
+class TestSendMessage:
+    """Test publishing messages to an agent."""
+
+    @pytest.fixture
+    def broker(self):
+        """Create a broker whose Redis client hands out a mock pipeline."""
+        broker = RedisMessageBroker("redis://localhost:6379/0")
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 1, True])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        broker._redis = MagicMock()
+        broker._redis.pipeline.return_value = pipe
+        return broker
+
+    @pytest.mark.asyncio
+    async def test_send_message_pipelines_publish_and_persist(self, broker):
+        """Test publish, push and trim are queued and executed in one round-trip."""
+        # Arrange
+        agent_id = uuid4()
+        pipe = broker._redis.pipeline.return_value
+
+        # Act
+        await broker.send_message(
+            agent_id, {"type": "text", "sender_id": uuid4(), "content": "hi"}
+        )
+
+        # Assert
+        broker._redis.pipeline.assert_called_once_with(transaction=False)
+        channel = f"agent:{agent_id}".encode()
+        queue_key = f"agent_queue:{agent_id}".encode()
+        data = pipe.publish.call_args.args[1]
+        assert [call[0] for call in pipe.method_calls] == [
+            "publish",
+            "lpush",
+            "ltrim",
+            "execute",
+        ]
+        pipe.publish.assert_called_once_with(channel, data)
+        pipe.lpush.assert_called_once_with(queue_key, data)
+        pipe.ltrim.assert_called_once_with(queue_key, 0, 99)
+        pipe.execute.assert_awaited_once()
+        assert _MESSAGE_ADAPTER.validate_json(data).content == "hi"
+
+    @pytest.mark.asyncio
+    async def test_send_message_wraps_redis_errors(self, broker):
+        """Test a failed pipeline execute surfaces as MessageBrokerError."""
+        pipe = broker._redis.pipeline.return_value
+        pipe.execute.side_effect = ConnectionError("connection reset")
+
+        with pytest.raises(MessageBrokerError, match="Failed to send message"):
+            await broker.send_message(uuid4(), {"type": "text", "sender_id": uuid4()})
+
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_message_type_is_rejected_before_redis(self):
+        """Test an unknown message type fails without any Redis call."""
+        broker = RedisMessageBroker("redis://localhost:6379/0")
+        broker._redis = MagicMock()
+
+        with pytest.raises(MessageBrokerError, match="Invalid message type"):
+            await broker.send_message(uuid4(), {"type": "unknown"})
+
+        broker._redis.pipeline.assert_not_called()